@@ -0,0 +1,36 @@
+import random
+
+from video_editor.analyzer import TimeRange, segments_within_ranges
+from video_editor.transcriber import Segment
+
+
+def test_segments_within_ranges_matches_a_pairwise_scan():
+    rng = random.Random(7)
+    ranges = []
+    for _ in range(40):
+        start = rng.uniform(0, 100)
+        ranges.append(TimeRange(start, start + rng.uniform(0, 10)))
+    segments = []
+    for _ in range(300):
+        start = rng.uniform(0, 110)
+        segments.append(Segment(start=start, end=start + rng.uniform(0, 3), text="", confidence=1.0))
+
+    expected = [
+        any(r.start <= seg.start and seg.end <= r.end for r in ranges)
+        for seg in segments
+    ]
+
+    assert segments_within_ranges(segments, ranges) == expected
+    assert any(expected) and not all(expected)
+
+
+def test_segments_within_ranges_uses_an_earlier_longer_range():
+    # The range starting closest to the segment is too short; an earlier one covers it
+    ranges = [TimeRange(0.0, 10.0), TimeRange(4.0, 5.0)]
+    segments = [
+        Segment(start=4.5, end=6.0, text="", confidence=1.0),
+        Segment(start=9.0, end=11.0, text="", confidence=1.0),
+    ]
+
+    assert segments_within_ranges(segments, ranges) == [True, False]
+    assert segments_within_ranges(segments, []) == [False, False]
@@ -0,0 +1,258 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from video_editor.gui import caption_settings
+from video_editor.gui.caption_settings import CaptionSettingsPanel
+from video_editor.gui.models import CaptionSettings
+
+
+def _qt_app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_caption_settings_slider_drag_is_coalesced_into_one_emit():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    emitted = []
+    panel.settings_changed.connect(emitted.append)
+
+    for size in range(20, 40):
+        panel._size_slider.setValue(size)
+
+    assert emitted == []
+
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert len(emitted) == 1
+    assert emitted[0].font_size == 39
+
+
+def test_caption_settings_get_settings_reflects_pending_changes():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+
+    panel._size_spin.setValue(48)
+
+    assert panel.get_settings().font_size == 48
+
+
+def test_caption_settings_set_settings_is_silent_and_restores_signals():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    emitted = []
+    panel.settings_changed.connect(emitted.append)
+
+    settings = CaptionSettings(font_size=40, font_weight="semi-bold", text_color="black")
+    panel.set_settings(settings)
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert emitted == []
+    assert panel._size_slider.value() == 40
+    assert panel._weight_combo.currentText() == "Semi-Bold"
+    assert panel._color_combo.currentText() == "Black"
+    assert not panel._size_spin.signalsBlocked()
+    assert not panel._bg_check.signalsBlocked()
+
+
+def test_caption_settings_set_settings_keeps_signals_blocked_by_the_caller():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    panel._bg_check.blockSignals(True)
+
+    panel.set_settings(CaptionSettings(show_background=False))
+
+    assert panel._bg_check.signalsBlocked()
+    assert not panel._size_spin.signalsBlocked()
+
+
+def test_caption_settings_emits_again_after_each_coalescing_interval():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    sizes = []
+    panel.settings_changed.connect(lambda settings: sizes.append(settings.font_size))
+
+    panel._size_slider.setValue(30)
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+    panel._size_slider.setValue(31)
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert sizes == [30, 31]
+
+
+def test_caption_settings_change_reverted_within_an_interval_is_not_emitted():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    emitted = []
+    panel.settings_changed.connect(emitted.append)
+
+    panel._size_slider.setValue(30)
+    panel._size_slider.setValue(24)
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert emitted == []
+
+
+def test_caption_settings_font_list_is_enumerated_once(monkeypatch):
+    _qt_app()
+    first = CaptionSettingsPanel()
+    first._font_combo.ensure_fonts_loaded()
+
+    def fail_if_fonts_are_enumerated_again():
+        raise AssertionError("Font families must be cached after the first panel")
+
+    monkeypatch.setattr(
+        "video_editor.gui.caption_settings.QFontDatabase.families",
+        fail_if_fonts_are_enumerated_again,
+    )
+
+    panel = CaptionSettingsPanel()
+    panel._font_combo.ensure_fonts_loaded()
+
+    assert panel._font_combo.count() == len(caption_settings._get_font_items())
+
+
+def test_caption_settings_fonts_are_enumerated_on_first_popup(monkeypatch):
+    _qt_app()
+    monkeypatch.setattr(caption_settings, "_FONT_ITEMS", None)
+    monkeypatch.setattr(caption_settings, "_SHARED_MODELS", {})
+    monkeypatch.setattr(
+        "video_editor.gui.caption_settings.QFontDatabase.families",
+        lambda: ["Zeta", "Arial", "Roboto"],
+    )
+    panel = CaptionSettingsPanel()
+    emitted = []
+    panel.settings_changed.connect(emitted.append)
+
+    panel.set_settings(CaptionSettings(font_family="Roboto"))
+
+    assert caption_settings._FONT_ITEMS is None
+    assert panel._font_combo.currentText() == "Roboto"
+
+    panel._font_combo.ensure_fonts_loaded()
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert [panel._font_combo.itemText(i) for i in range(panel._font_combo.count())] == [
+        "Arial", "Roboto", "Zeta",
+    ]
+    assert panel._font_combo.currentText() == "Roboto"
+    assert emitted == []
+
+
+def test_caption_settings_panels_share_combo_models_but_not_selection():
+    _qt_app()
+    first = CaptionSettingsPanel()
+    second = CaptionSettingsPanel()
+    first._font_combo.ensure_fonts_loaded()
+    second._font_combo.ensure_fonts_loaded()
+
+    first._weight_combo.setCurrentText("Regular")
+
+    assert first._font_combo.model() is second._font_combo.model()
+    assert first._weight_combo.model() is second._weight_combo.model()
+    assert second._weight_combo.currentText() == "Bold"
+
+
+def test_caption_settings_size_sync_records_one_change_per_user_action(monkeypatch):
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    calls = []
+    original = panel._on_setting_changed
+
+    def record_setting_changed():
+        calls.append(panel._size_spin.value())
+        original()
+
+    monkeypatch.setattr(panel, "_on_setting_changed", record_setting_changed)
+
+    panel._size_slider.setValue(50)
+    panel._size_spin.setValue(20)
+
+    assert calls == [50, 20]
+    assert panel._size_slider.value() == 20
+
+
+def test_caption_settings_weight_and_color_round_trip_through_the_combos():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+
+    panel._weight_combo.setCurrentText("Extra-Bold")
+    panel._color_combo.setCurrentText("Black")
+
+    assert panel.get_settings().font_weight == "extra-bold"
+    assert panel.get_settings().text_color == "black"
+
+    panel.set_settings(CaptionSettings(font_weight="unknown", text_color="white"))
+
+    assert panel._weight_combo.currentText() == "Extra-Bold"
+    assert panel._color_combo.currentText() == "White"
+
+
+def test_caption_settings_position_label_only_updates_when_text_changes(monkeypatch):
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    texts = []
+    monkeypatch.setattr(panel._pos_display, "setText", texts.append)
+
+    panel.update_position_from_drag(CaptionSettings(pos_x=0.501))
+    panel.update_position_from_drag(CaptionSettings(pos_x=0.502))
+    panel.update_position_from_drag(CaptionSettings(pos_x=0.6))
+
+    assert texts == [
+        "Pos: 50%, 92% | Size: 60% x 7%",
+        "Pos: 60%, 92% | Size: 60% x 7%",
+    ]
+
+
+def test_caption_settings_reset_position_goes_through_the_coalescer():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    emitted = []
+    panel.settings_changed.connect(lambda settings: emitted.append(settings.pos_x))
+    panel.update_position_from_drag(CaptionSettings(pos_x=0.2))
+
+    panel._size_spin.setValue(30)
+    panel._reset_pos_btn.click()
+
+    assert emitted == []
+
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert emitted == [0.5]
+    assert panel._pos_display.text() == "Pos: 50%, 92% | Size: 60% x 7%"
+
+
+def test_caption_settings_missing_font_falls_back_and_reports_the_change(monkeypatch):
+    _qt_app()
+    monkeypatch.setattr(caption_settings, "_FONT_ITEMS", None)
+    monkeypatch.setattr(caption_settings, "_SHARED_MODELS", {})
+    monkeypatch.setattr(
+        "video_editor.gui.caption_settings.QFontDatabase.families",
+        lambda: ["Zeta", "Arial"],
+    )
+    panel = CaptionSettingsPanel()
+    panel.set_settings(CaptionSettings(font_family="Roboto"))
+    fonts = []
+    panel.settings_changed.connect(lambda settings: fonts.append(settings.font_family))
+
+    panel._font_combo.ensure_fonts_loaded()
+    QTest.qWait(panel.SETTINGS_EMIT_INTERVAL_MS * 3)
+
+    assert fonts == ["Arial"]
+
+
+def test_caption_settings_refresh_button_forwards_regenerate_requested():
+    _qt_app()
+    panel = CaptionSettingsPanel()
+    requests = []
+    panel.regenerate_requested.connect(lambda: requests.append(True))
+
+    panel._regen_btn.click()
+
+    assert requests == [True]
@@ -0,0 +1,571 @@
+import json
+import subprocess
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+from video_editor import export_cache
+from video_editor.analyzer import TimeRange
+from video_editor.config import Config
+from video_editor.cutter import Cutter, _pick_temp_dir
+from video_editor.encoder import EncoderConfig
+from video_editor.export_cache import SegmentCache
+
+shutil_usage = namedtuple("usage", "total used free")
+
+
+def _stub_ffmpeg(monkeypatch, fake_run) -> None:
+    """Send both probes and the progress-reporting FFmpeg runs to fake_run."""
+    monkeypatch.setattr("video_editor.cutter.subprocess.run", fake_run)
+    monkeypatch.setattr(
+        "video_editor.cutter.run_ffmpeg",
+        lambda cmd, on_progress=None, should_cancel=None, cwd=None: fake_run(cmd),
+    )
+
+
+def _stub_cutter(tmp_path: Path, monkeypatch, *, has_video: bool = True) -> tuple[Cutter, list[list[str]]]:
+    commands: list[list[str]] = []
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+    cutter = Cutter(Config(temp_dir=tmp_path), EncoderConfig(use_hardware=False))
+    # One batch at a time keeps the recorded command order deterministic
+    cutter.PARALLEL_BATCHES = 1
+    monkeypatch.setattr(cutter, "input_has_video", lambda path: has_video)
+    monkeypatch.setattr(cutter, "_input_has_audio", lambda path: True)
+    return cutter, commands
+
+
+def test_cut_video_extracts_segments_in_batched_ffmpeg_processes(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    cutter.SEGMENTS_PER_PROCESS = 2
+
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0), TimeRange(4.0, 5.0)],
+        tmp_path / "out.mp4",
+    )
+
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    assert len(extract_commands) == 2
+    assert extract_commands[0].count("-i") == 2
+    assert extract_commands[1].count("-i") == 1
+    first_graph = extract_commands[0][extract_commands[0].index("-filter_complex") + 1]
+    last_graph = extract_commands[1][extract_commands[1].index("-filter_complex") + 1]
+    assert "[1:v]" in first_graph and "tpad" in first_graph
+    # The final segment has no transition after it
+    assert "tpad" not in last_graph
+
+
+def test_audio_only_segments_are_mapped_per_input(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch, has_video=False)
+
+    cutter.cut_video(
+        tmp_path / "source.m4a",
+        [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0)],
+        tmp_path / "out.m4a",
+    )
+
+    extract = next(cmd for cmd in commands if "1:a:0" in cmd)
+    assert "-filter_complex" not in extract
+    assert extract.count("-i") == 2
+    assert extract[extract.index("1:a:0") - 1] == "-map"
+
+
+def test_pick_temp_dir_prefers_shared_memory_only_when_segments_fit(tmp_path: Path, monkeypatch):
+    shm_dir = tmp_path / "shm"
+    shm_dir.mkdir()
+    fallback = tmp_path / "disk"
+    monkeypatch.setattr("video_editor.cutter.SHM_DIR", shm_dir)
+    monkeypatch.setattr(
+        "video_editor.cutter.shutil.disk_usage",
+        lambda path: shutil_usage(total=4000, used=0, free=4000),
+    )
+
+    assert _pick_temp_dir(1000, fallback) == shm_dir
+    assert _pick_temp_dir(1001, fallback) == fallback
+    assert _pick_temp_dir(None, fallback) == fallback
+
+
+def test_short_ranges_use_the_short_segment_x264_tuning_only_when_opted_in(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 1.0), TimeRange(2.0, 3.5)],
+        tmp_path / "out.mp4",
+    )
+    default_extract = next(cmd for cmd in commands if "-filter_complex" in cmd)
+
+    commands.clear()
+    cutter.config = Config(temp_dir=tmp_path, fast_short_segments=True)
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 1.0), TimeRange(2.0, 3.5)],
+        tmp_path / "out.mp4",
+    )
+    short_extract = next(cmd for cmd in commands if "-filter_complex" in cmd)
+
+    commands.clear()
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 10.0), TimeRange(20.0, 30.0)],
+        tmp_path / "out.mp4",
+    )
+    long_extract = next(cmd for cmd in commands if "-filter_complex" in cmd)
+
+    assert "zerolatency" not in default_extract
+    assert "zerolatency" in short_extract
+    assert "zerolatency" not in long_extract
+    assert cutter.encoder_config.short_segment_mode is False
+
+
+def test_coalesce_ranges_merges_duplicates_overlaps_and_adjacent_ranges():
+    ranges = [
+        TimeRange(20.0, 30.0),
+        TimeRange(10.0, 20.0),
+        TimeRange(10.0, 20.0),
+        TimeRange(25.0, 28.0),
+        TimeRange(30.01, 31.0),
+        TimeRange(40.0, 41.0),
+    ]
+
+    assert Cutter.coalesce_ranges(ranges) == [TimeRange(10.0, 31.0), TimeRange(40.0, 41.0)]
+
+
+def test_cut_video_keeps_crop_overrides_of_the_first_merged_range(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(5.0, 6.0), TimeRange(0.0, 1.0), TimeRange(1.0, 2.0)],
+        tmp_path / "out.mp4",
+        segment_crop_filters={0: "crop=100:100:0:0", 1: "crop=200:200:0:0"},
+    )
+
+    extract = next(cmd for cmd in commands if "-filter_complex" in cmd)
+    graph = extract[extract.index("-filter_complex") + 1]
+    assert extract.count("-i") == 2
+    assert graph.index("crop=200:200:0:0") < graph.index("[1:v]") < graph.index("crop=100:100:0:0")
+
+
+def test_cut_video_stops_between_batches_when_cancelled(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    cutter.SEGMENTS_PER_PROCESS = 1
+    polls = []
+
+    def should_cancel() -> bool:
+        polls.append(True)
+        return len(polls) > 1
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        cutter.cut_video(
+            tmp_path / "source.mp4",
+            [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0), TimeRange(4.0, 5.0)],
+            tmp_path / "out.mp4",
+            should_cancel=should_cancel,
+        )
+
+    assert len([cmd for cmd in commands if "-filter_complex" in cmd]) == 1
+    assert not any("concat" in cmd for cmd in commands)
+
+
+@pytest.mark.parametrize("failing_step", ["-filter_complex", "concat"])
+def test_failed_cut_removes_its_temp_segments(tmp_path: Path, monkeypatch, failing_step: str):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    cutter.SEGMENTS_PER_PROCESS = 1
+    temp_root = tmp_path / "temp"
+    temp_root.mkdir()
+    cutter.config.temp_dir = temp_root
+    cutter.config.ram_temp_segments = False
+
+    def fake_run(cmd, *args, **kwargs):
+        for arg in cmd:
+            if isinstance(arg, str) and Path(arg).name.startswith("segment_"):
+                Path(arg).write_bytes(b"segment")
+        # Only the last batch, or the concat, fails
+        failed = failing_step in cmd and ("concat" in cmd or "4.0" in cmd)
+        return subprocess.CompletedProcess(cmd, int(failed), stdout="", stderr="ffmpeg error")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        cutter.cut_video(
+            tmp_path / "source.mp4",
+            [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0), TimeRange(4.0, 5.0)],
+            tmp_path / "out.mp4",
+        )
+
+    assert list(temp_root.iterdir()) == []
+
+
+def test_cut_video_reports_extracted_seconds_per_batch(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    cutter.SEGMENTS_PER_PROCESS = 2
+    ranges = [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0), TimeRange(4.0, 5.0)]
+    reported = []
+
+    cutter.cut_video(tmp_path / "source.mp4", ranges, tmp_path / "out.mp4", on_progress=reported.append)
+
+    assert reported == pytest.approx([2.0 + Cutter.SEGMENT_GAP * 2, Cutter.cut_duration(ranges)])
+    assert Cutter.cut_duration(ranges) == pytest.approx(3.0 + Cutter.SEGMENT_GAP * 2)
+
+
+def test_cut_video_reports_progress_while_a_batch_encodes(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    ranges = [TimeRange(0.0, 1.0), TimeRange(2.0, 4.0)]
+    reported = []
+
+    def fake_run_ffmpeg(cmd, on_progress=None, should_cancel=None, cwd=None):
+        if on_progress and "-filter_complex" in cmd:
+            # Both outputs advance together; the first stops at its 1s + gap
+            on_progress(0.5)
+            on_progress(1.5)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr("video_editor.cutter.run_ffmpeg", fake_run_ffmpeg)
+
+    cutter.cut_video(tmp_path / "source.mp4", ranges, tmp_path / "out.mp4", on_progress=reported.append)
+
+    first = 1.0 + Cutter.SEGMENT_GAP
+    assert reported == pytest.approx([1.0, min(1.5, first) + 1.5, Cutter.cut_duration(ranges)])
+
+
+@pytest.mark.parametrize("cancelled_step", ["-filter_complex", "concat"])
+def test_cancel_stops_the_running_ffmpeg_of_a_cut(tmp_path: Path, monkeypatch, cancelled_step: str):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    temp_root = tmp_path / "temp"
+    temp_root.mkdir()
+    cutter.config.temp_dir = temp_root
+    cutter.config.ram_temp_segments = False
+    cancel = threading.Event()
+
+    def fake_run_ffmpeg(cmd, on_progress=None, should_cancel=None, cwd=None):
+        commands.append(list(cmd))
+        if cancelled_step in cmd:
+            # The user presses Cancel while this FFmpeg is running
+            cancel.set()
+            assert should_cancel is not None and should_cancel()
+            raise RuntimeError("FFmpeg cancelled")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr("video_editor.cutter.run_ffmpeg", fake_run_ffmpeg)
+
+    # One batch: nothing is left to skip between batches
+    with pytest.raises(RuntimeError, match="cancelled"):
+        cutter.cut_video(
+            tmp_path / "source.mp4",
+            [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0)],
+            tmp_path / "out.mp4",
+            should_cancel=cancel.is_set,
+        )
+
+    assert any(cancelled_step in cmd for cmd in commands)
+    assert list(temp_root.iterdir()) == []
+
+
+def test_cut_video_runs_batches_in_parallel_and_concats_in_range_order(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    cutter.PARALLEL_BATCHES = 2
+    both_batches_running = threading.Barrier(2, timeout=5)
+    concat_lists = []
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        if "-filter_complex" in cmd:
+            # Deadlocks (and times out) unless both batches run at the same time
+            both_batches_running.wait()
+        if "concat" in cmd:
+            concat_lists.append(Path(cmd[cmd.index("-i") + 1]).read_text())
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0), TimeRange(4.0, 5.0)],
+        tmp_path / "out.mp4",
+    )
+
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    assert sorted(cmd.count("-i") for cmd in extract_commands) == [1, 2]
+    listed = [line for line in concat_lists[0].splitlines() if line.startswith("file")]
+    assert [Path(line.split("'")[1]).stem for line in listed] == [
+        "segment_0000", "segment_0001", "segment_0002",
+    ]
+
+
+def test_hardware_cuts_hold_no_more_encoder_sessions_than_allowed(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    monkeypatch.setattr("video_editor.cutter.encoder_session_limit", lambda config: 3)
+    ranges = [TimeRange(i * 2.0, i * 2.0 + 1.0) for i in range(7)]
+
+    cutter.cut_video(tmp_path / "source.mp4", ranges, tmp_path / "out.mp4")
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    assert [cmd.count("-i") for cmd in extract_commands] == [3, 3, 1]
+
+    # Parallel batches split the sessions between them
+    commands.clear()
+    cutter.PARALLEL_BATCHES = 4
+    cutter.cut_video(tmp_path / "source.mp4", ranges, tmp_path / "out.mp4")
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    assert [cmd.count("-i") for cmd in extract_commands] == [1] * 7
+
+    # Batch exports lower the budget of each export further
+    commands.clear()
+    cutter.PARALLEL_BATCHES = 1
+    cutter.config.max_encoder_sessions = 2
+    cutter.cut_video(tmp_path / "source.mp4", ranges, tmp_path / "out.mp4")
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    assert [cmd.count("-i") for cmd in extract_commands] == [2, 2, 2, 1]
+
+
+def test_single_uncropped_range_is_stream_copied(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    cutter.cut_video(tmp_path / "source.mp4", [TimeRange(0.0, 10.0)], tmp_path / "out.mp4")
+
+    assert len(commands) == 1
+    copy_cmd = commands[0]
+    assert "-filter_complex" not in copy_cmd
+    assert copy_cmd[copy_cmd.index("-c:v") + 1] == "copy"
+    assert not any("concat" in cmd for cmd in commands)
+
+
+def test_single_range_is_reencoded_when_cropped_or_off_keyframe(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    cutter.cut_video(
+        tmp_path / "source.mp4",
+        [TimeRange(0.0, 10.0)],
+        tmp_path / "out.mp4",
+        crop_filter="crop=100:100:0:0",
+    )
+    assert any("-filter_complex" in cmd for cmd in commands)
+
+    commands.clear()
+    # The stubbed probe reports no keyframe packets near 5s
+    cutter.cut_video(tmp_path / "source.mp4", [TimeRange(5.0, 10.0)], tmp_path / "out.mp4")
+    assert any("-read_intervals" in cmd for cmd in commands)
+    assert any("-filter_complex" in cmd for cmd in commands)
+
+
+def test_keyframe_probe_window_is_clamped_at_the_start_of_the_file(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    cutter.cut_video(tmp_path / "source.mp4", [TimeRange(0.0, 10.0)], tmp_path / "out.mp4")
+    # The first frame is always a keyframe, so nothing is probed
+    assert not any("-read_intervals" in cmd for cmd in commands)
+
+    commands.clear()
+    cutter.cut_video(tmp_path / "source.mp4", [TimeRange(0.5, 10.0)], tmp_path / "out.mp4")
+    probe = next(cmd for cmd in commands if "-read_intervals" in cmd)
+    assert probe[probe.index("-read_intervals") + 1] == "0.000%1.500"
+
+
+def test_keyframe_must_not_lie_after_the_cut_start(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    packets = ""
+
+    def fake_run(cmd, *args, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout=packets, stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+
+    packets = "4.980000,K__\n5.020000,___\n"
+    assert cutter._keyframe_near(tmp_path / "source.mp4", 5.0)
+
+    # Copying from here would start the video on the keyframe before the cut
+    packets = "4.000000,K__\n5.020000,K__\n"
+    assert not cutter._keyframe_near(tmp_path / "source.mp4", 5.0)
+
+
+def test_cut_graph_matches_the_segment_layout_of_cut_video(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+
+    graph = cutter.build_cut_graph(
+        tmp_path / "source.mp4",
+        [TimeRange(4.0, 5.0), TimeRange(0.0, 1.0), TimeRange(1.0, 2.0)],
+        crop_filter="crop=640:360:10:20",
+        crop_size=(640, 360),
+    )
+
+    assert graph.input_count == 2
+    assert graph.input_args[graph.input_args.index("-ss") + 1] == "0.0"
+    assert (graph.width, graph.height) == (640, 360)
+    assert graph.filter_graph.count("crop=640:360:10:20") == 2
+    # Only the gap between the two segments is frozen
+    assert graph.filter_graph.count("tpad") == 1
+    assert graph.filter_graph.endswith("[v0][a0][v1][a1]concat=n=2:v=1:a=1[cutv][cuta]")
+    assert commands == []
+
+    # The output size comes from crop_size, whatever form the filter takes
+    graph = cutter.build_cut_graph(
+        tmp_path / "source.mp4", [TimeRange(0.0, 1.0)], crop_filter="crop=iw/2:ih/2", crop_size=(960, 540)
+    )
+    assert (graph.width, graph.height) == (960, 540)
+    with pytest.raises(ValueError, match="crop_size"):
+        cutter.build_cut_graph(tmp_path / "source.mp4", [TimeRange(0.0, 1.0)], crop_filter="crop=iw/2:ih/2")
+
+
+def test_cut_graph_is_not_built_for_audio_only_or_many_ranges(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch, has_video=False)
+    assert cutter.build_cut_graph(tmp_path / "source.m4a", [TimeRange(0.0, 1.0)]) is None
+
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    many = [TimeRange(i * 2.0, i * 2.0 + 1.0) for i in range(cutter.MAX_GRAPH_RANGES + 1)]
+    assert cutter.build_cut_graph(tmp_path / "source.mp4", many, crop_filter="crop=2:2:0:0", crop_size=(2, 2)) is None
+
+
+def test_repeated_cut_reuses_cached_segments(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    cutter.segment_cache = SegmentCache(tmp_path / "cache")
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"video")
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        # Let "FFmpeg" create the segment outputs so the cache can commit them
+        for arg in cmd:
+            if isinstance(arg, str) and ".partial" in arg:
+                Path(arg).write_bytes(b"segment")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+    ranges = [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0)]
+
+    cutter.cut_video(source, ranges, tmp_path / "first.mp4")
+    commands.clear()
+    cutter.cut_video(source, [*ranges, TimeRange(4.0, 5.0)], tmp_path / "second.mp4")
+
+    extract_commands = [cmd for cmd in commands if "-filter_complex" in cmd]
+    # Only the new final range and the range that now gets a frozen gap are encoded
+    assert len(extract_commands) == 1
+    assert extract_commands[0].count("-i") == 2
+    assert len(list((tmp_path / "cache").glob("*.mp4"))) == 4
+    assert not list((tmp_path / "cache").glob("*.partial*"))
+
+
+def test_unchanged_cut_is_concatenated_from_cache_alone(tmp_path: Path, monkeypatch):
+    cutter, commands = _stub_cutter(tmp_path, monkeypatch)
+    cutter.segment_cache = SegmentCache(tmp_path / "cache")
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"video")
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        for arg in cmd:
+            if isinstance(arg, str) and ".partial" in arg:
+                Path(arg).write_bytes(b"segment")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+    ranges = [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0)]
+    progress: list[float] = []
+
+    cutter.cut_video(source, ranges, tmp_path / "first.mp4")
+    commands.clear()
+    cutter.cut_video(source, ranges, tmp_path / "second.mp4", on_progress=progress.append)
+
+    assert not any("-filter_complex" in cmd for cmd in commands)
+    assert any("concat" in cmd for cmd in commands)
+    assert progress == [pytest.approx(2.0 + cutter.SEGMENT_GAP)]
+
+
+def test_segment_cache_partials_are_unique_and_pruning_spares_work_in_progress(tmp_path: Path, monkeypatch):
+    cache = SegmentCache(tmp_path / "cache", max_bytes=0)
+    first = cache.partial_path("key", ".mp4")
+    second = cache.partial_path("key", ".mp4")
+    assert first != second
+    first.write_bytes(b"encoding")
+    second.write_bytes(b"encoding")
+    committed = cache.commit(second)
+    assert committed == tmp_path / "cache" / "key.mp4"
+
+    # Everything is recent: the committed segment may be about to be concatenated
+    cache.prune()
+    assert first.exists() and committed.exists()
+
+    later = time.time() + export_cache.STALE_PARTIAL_SECONDS + 1
+    monkeypatch.setattr("video_editor.export_cache.time.time", lambda: later)
+    cache.prune()
+    assert not first.exists() and not committed.exists()
+
+
+def test_failed_batch_discards_its_partial_segments(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    cutter.segment_cache = SegmentCache(tmp_path / "cache")
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"video")
+
+    def fake_run(cmd, *args, **kwargs):
+        for arg in cmd:
+            if isinstance(arg, str) and ".partial" in arg:
+                Path(arg).write_bytes(b"half a segment")
+        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="encoder error")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+
+    with pytest.raises(RuntimeError, match="extraction failed"):
+        cutter.cut_video(source, [TimeRange(0.0, 1.0), TimeRange(2.0, 3.0)], tmp_path / "out.mp4")
+
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_video_dimensions_are_probed_once_per_input(tmp_path: Path, monkeypatch):
+    commands: list[list[str]] = []
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout="1280,720\n", stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+    cutter = Cutter(Config(temp_dir=tmp_path), EncoderConfig(use_hardware=False))
+
+    assert cutter.get_video_dimensions(tmp_path / "source.mp4") == (1280, 720)
+    assert cutter.get_video_dimensions(tmp_path / "source.mp4") == (1280, 720)
+    assert len(commands) == 1
+
+
+def test_cutter_with_new_config_keeps_the_probe_results(tmp_path: Path, monkeypatch):
+    cutter, _ = _stub_cutter(tmp_path, monkeypatch)
+    cutter._dimensions_cache["source.mp4"] = (1920, 1080)
+
+    copy = cutter.with_config(Config(temp_dir=tmp_path, keep_temp=True))
+    copy._dimensions_cache["other.mp4"] = (640, 360)
+
+    assert copy.config.keep_temp and not cutter.config.keep_temp
+    assert copy._dimensions_cache["source.mp4"] == (1920, 1080)
+    # Probes made by the export do not leak back into the shared cutter
+    assert "other.mp4" not in cutter._dimensions_cache
+
+
+def test_probe_media_fills_every_probe_cache_with_one_ffprobe_run(tmp_path: Path, monkeypatch):
+    commands: list[list[str]] = []
+    probe = {
+        "streams": [{"codec_type": "video", "width": 1920, "height": 1080}, {"codec_type": "audio"}],
+        "format": {"duration": "12.5", "bit_rate": "800000"},
+    }
+
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(probe), stderr="")
+
+    _stub_ffmpeg(monkeypatch, fake_run)
+    cutter = Cutter(Config(temp_dir=tmp_path), EncoderConfig(use_hardware=False))
+    source = tmp_path / "source.mp4"
+
+    cutter.probe_media(source)
+
+    assert cutter.input_has_video(source)
+    assert cutter._input_has_audio(source)
+    assert cutter.get_video_dimensions(source) == (1920, 1080)
+    assert cutter.get_video_duration(source) == 12.5
+    assert cutter.get_bit_rate(source) == 800000
+    assert len(commands) == 1
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+from video_editor.analyzer import AnalyzedSegment, SegmentAction
+from video_editor.gui.models import CropConfig, EditSession
+from video_editor.transcriber import Segment, Token
+
+
+def _session(tmp_path: Path) -> EditSession:
+    segments = [
+        Segment(start=float(i), end=i + 0.5, text=f"segment {i}", confidence=1.0)
+        for i in range(4)
+    ]
+    actions = [SegmentAction.KEEP, SegmentAction.REMOVE, SegmentAction.KEEP]
+    return EditSession(
+        video_path=tmp_path / "recording.mp4",
+        video_duration=5.0,
+        original_segments=segments,
+        # The last segment has no analysis and therefore defaults to kept
+        analyzed_segments=[
+            AnalyzedSegment(segment=seg, action=action)
+            for seg, action in zip(segments, actions)
+        ],
+    )
+
+
+def test_set_all_segments_kept_matches_per_segment_overrides(tmp_path: Path):
+    for keep in (True, False):
+        bulk = _session(tmp_path)
+        single = _session(tmp_path)
+        bulk.keep_overrides[1] = True
+
+        bulk.set_all_segments_kept(keep)
+        for index in range(len(single.original_segments)):
+            single.set_segment_kept(index, keep)
+
+        assert bulk.keep_overrides == single.keep_overrides
+        assert all(bulk.is_segment_kept(i) is keep for i in range(4))
+
+
+def test_apply_analysis_keeps_presentation_settings_and_drops_index_edits(tmp_path: Path):
+    session = _session(tmp_path)
+    session.crop_config.width = 0.5
+    session.caption_settings.font_size = 40
+    session.add_highlight(1.0, 2.0)
+    session.set_segment_text(0, "edited")
+    session.set_segment_kept(1, True)
+    crop_config = session.crop_config
+
+    segments = [Segment(start=0.0, end=1.0, text="new", confidence=1.0)]
+    session.apply_analysis(3.0, segments, [AnalyzedSegment(segment=segments[0])], [], [])
+
+    assert session.original_segments == segments
+    assert session.video_duration == 3.0
+    assert session.crop_config is crop_config and crop_config.width == 0.5
+    assert session.caption_settings.font_size == 40
+    assert len(session.highlight_regions) == 1
+    assert session.text_edits == {} and session.keep_overrides == {}
+
+
+def test_crop_filter_matches_crop_rect_for_shared_presets():
+    first = CropConfig(width=0.5, height=0.75, pan_x=-0.5, pan_y=0.25)
+    second = first.copy()
+
+    x, y, w, h = first.get_crop_rect(1920, 1080)
+
+    assert first.to_ffmpeg_filter(1920, 1080) == f"crop={w}:{h}:{x}:{y}"
+    assert second.to_ffmpeg_filter(1920, 1080) is first.to_ffmpeg_filter(1920, 1080)
+    assert CropConfig().to_ffmpeg_filter(1280, 720) == "crop=1280:720:0:0"
+
+
+def test_segment_at_time_finds_the_playing_segment(tmp_path: Path):
+    session = _session(tmp_path)
+
+    assert [session.segment_at_time(t) for t in (-1.0, 0.0, 0.49, 0.5, 1.2, 3.4, 9.0)] == [
+        -1, 0, 0, -1, 1, 3, -1,
+    ]
+
+    session.apply_analysis(1.0, [Segment(start=0.0, end=1.0, text="new", confidence=1.0)], [], [], [])
+
+    assert session.segment_at_time(0.7) == 0
+    assert session.segment_at_time(1.2) == -1
+
+
+def test_save_and_load_round_trip_with_either_json_backend(tmp_path: Path, monkeypatch):
+    from video_editor.gui import models
+
+    session = _session(tmp_path)
+    session.tokens = [Token(text="szia", start=0.0, end=0.4), Token(text=" világ", start=0.4, end=0.5)]
+    session.text_edits[2] = "edited ő"
+    session.keep_overrides[1] = True
+    session.add_highlight(4.5, 5.0, "screen")
+
+    backends = [False] + ([True] if models.ORJSON_AVAILABLE else [])
+    for use_orjson in backends:
+        monkeypatch.setattr(models, "ORJSON_AVAILABLE", use_orjson)
+        path = tmp_path / f"session_{use_orjson}.vedproj"
+
+        session.save(path)
+        loaded = EditSession.load(path)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["text_edits"] == {"2": "edited ő"}
+        assert loaded.original_segments == session.original_segments
+        assert loaded.tokens == session.tokens
+        assert loaded.text_edits == session.text_edits
+        assert loaded.keep_overrides == session.keep_overrides
+        assert loaded.highlight_regions == session.highlight_regions
+        assert [a.action for a in loaded.analyzed_segments] == [a.action for a in session.analyzed_segments]
@@ -0,0 +1,50 @@
+import subprocess
+
+from video_editor import encoder
+from video_editor.encoder import EncoderConfig, get_encoder_args
+
+
+def _fake_ffmpeg(monkeypatch, listed: str, working: set[str]) -> list[str]:
+    opened: list[str] = []
+
+    def fake_run(cmd, *args, **kwargs):
+        if "-encoders" in cmd:
+            return subprocess.CompletedProcess(cmd, 0, stdout=listed, stderr="")
+        name = cmd[cmd.index("-c:v") + 1]
+        opened.append(name)
+        return subprocess.CompletedProcess(cmd, 0 if name in working else 1, stdout="", stderr="")
+
+    monkeypatch.setattr(encoder.subprocess, "run", fake_run)
+    monkeypatch.setattr(encoder, "_listed_encoders", None)
+    monkeypatch.setattr(encoder, "_hardware_encoder", None)
+    monkeypatch.setattr(encoder, "_hardware_encoder_detected", False)
+    return opened
+
+
+def test_listed_encoder_without_a_device_falls_back_to_the_next_one(monkeypatch):
+    opened = _fake_ffmpeg(
+        monkeypatch,
+        " V....D h264_nvenc\n V....D h264_qsv\n V....D libx264\n",
+        working={"h264_qsv"},
+    )
+
+    args = get_encoder_args(EncoderConfig(crf=20))
+    get_encoder_args(EncoderConfig())
+
+    assert args[args.index("-c:v") + 1] == "h264_qsv"
+    assert args[args.index("-global_quality") + 1] == "20"
+    # Detection runs once per process
+    assert opened == ["h264_nvenc", "h264_qsv"]
+
+
+def test_software_encoding_when_no_hardware_encoder_works(monkeypatch):
+    _fake_ffmpeg(monkeypatch, " V....D h264_nvenc\n V....D libx264\n", working=set())
+
+    assert get_encoder_args()[:2] == ["-c:v", "libx264"]
+
+
+def test_hardware_detection_is_skipped_when_disabled(monkeypatch):
+    opened = _fake_ffmpeg(monkeypatch, " V....D h264_nvenc\n", working={"h264_nvenc"})
+
+    assert get_encoder_args(EncoderConfig(use_hardware=False))[:2] == ["-c:v", "libx264"]
+    assert opened == []
@@ -0,0 +1,168 @@
+import subprocess
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from video_editor import export_pipeline
+from video_editor.analyzer import TimeRange
+from video_editor.config import Config
+from video_editor.cutter import Cutter
+from video_editor.project_io import ProjectData
+
+
+def _stub_exports(monkeypatch, *, fail_on: str | None = None, audio_only: tuple[str, ...] = ()) -> list:
+    exported = []
+
+    def fake_export_project(project, output_path, *, config, no_captions, should_cancel):
+        if project.name == fail_on:
+            raise RuntimeError("export failed")
+        exported.append((project.name, output_path, config, should_cancel))
+        return output_path
+
+    monkeypatch.setattr(
+        export_pipeline,
+        "load_project",
+        lambda path: SimpleNamespace(name=Path(path).stem, video_path=Path(path)),
+    )
+    monkeypatch.setattr(export_pipeline, "export_project", fake_export_project)
+    monkeypatch.setattr(Cutter, "input_has_video", lambda self, path: Path(path).stem not in audio_only)
+    return exported
+
+
+def test_export_projects_writes_each_project_into_the_output_dir(tmp_path: Path, monkeypatch):
+    exported = _stub_exports(monkeypatch, audio_only=("podcast",))
+    monkeypatch.setattr("video_editor.cutter.encoder_session_limit", lambda config: None)
+    config = Config(use_hardware_encoding=True, temp_dir=tmp_path / "tmp")
+
+    outputs = export_pipeline.export_projects(
+        [tmp_path / "a" / "clip.vedproj", tmp_path / "b" / "clip.vedproj", tmp_path / "podcast.vedproj"],
+        tmp_path / "out",
+        config=config,
+    )
+
+    assert outputs == [
+        tmp_path / "out" / "clip_edited.mp4",
+        tmp_path / "out" / "clip_edited_2.mp4",
+        tmp_path / "out" / "podcast_edited.m4a",
+    ]
+    assert [project for project, *_ in exported] == ["clip", "clip", "podcast"]
+    # export_project adjusts caption settings on the config it is given
+    assert all(job_config is not config for _, _, job_config, _ in exported)
+    assert len({job_config.temp_dir for _, _, job_config, _ in exported}) == 3
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_export_projects_overlaps_exports_only_on_a_hardware_encoder(monkeypatch):
+    monkeypatch.setattr("video_editor.cutter.encoder_session_limit", lambda config: 3 if config.use_hardware else None)
+
+    assert export_pipeline.batch_export_concurrency(Config(use_hardware_encoding=True)) == 2
+    assert export_pipeline.batch_export_concurrency(Config(use_hardware_encoding=False)) == 1
+    # Each running export keeps at least one encoder session
+    assert export_pipeline.batch_export_concurrency(
+        Config(use_hardware_encoding=True, max_encoder_sessions=1)
+    ) == 1
+
+
+def test_batch_exports_share_the_encoder_sessions_and_the_cancel_callback(tmp_path: Path, monkeypatch):
+    exported = _stub_exports(monkeypatch)
+    monkeypatch.setattr("video_editor.cutter.encoder_session_limit", lambda config: 5)
+    cancel = threading.Event()
+
+    export_pipeline.export_projects(
+        [tmp_path / "a.vedproj", tmp_path / "b.vedproj"],
+        tmp_path / "out",
+        config=Config(temp_dir=tmp_path / "tmp"),
+        should_cancel=cancel.is_set,
+    )
+
+    # Two exports at once, two sessions each: four of the five in use at most
+    assert [job_config.max_encoder_sessions for _, _, job_config, _ in exported] == [2, 2]
+    assert [callback for *_, callback in exported] == [cancel.is_set, cancel.is_set]
+
+
+def test_export_projects_stops_starting_exports_after_a_failure_or_cancel(tmp_path: Path, monkeypatch):
+    exported = _stub_exports(monkeypatch, fail_on="b")
+    monkeypatch.setattr("video_editor.cutter.encoder_session_limit", lambda config: None)
+    projects = [tmp_path / f"{name}.vedproj" for name in "abc"]
+    config = Config(temp_dir=tmp_path / "tmp")
+
+    with pytest.raises(RuntimeError, match="export failed"):
+        export_pipeline.export_projects(projects, tmp_path, config=config)
+
+    assert [project for project, *_ in exported] == ["a"]
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(RuntimeError, match="cancelled"):
+        export_pipeline.export_projects(projects, tmp_path, config=config, should_cancel=cancel.is_set)
+
+
+def _project(tmp_path: Path, folder: str) -> ProjectData:
+    video_path = tmp_path / folder / "clip.mp4"
+    video_path.parent.mkdir()
+    video_path.write_bytes(b"video")
+    return ProjectData(
+        path=video_path.with_suffix(".vedproj"),
+        video_path=video_path,
+        video_duration=10.0,
+        segments=[],
+        tokens=[],
+        analyzed=[],
+        original_keep_ranges=[TimeRange(0.0, 1.0), TimeRange(4.0, 5.0)],
+        text_edits={},
+        keep_overrides={},
+        highlight_regions=[],
+        caption_settings={"enabled": False},
+        raw={},
+    )
+
+
+def test_concurrent_exports_of_same_named_sources_use_separate_temp_files(tmp_path: Path, monkeypatch):
+    loaded = {name: _project(tmp_path, name) for name in "ab"}
+    monkeypatch.setattr(export_pipeline, "load_project", lambda path: loaded[Path(path).stem])
+    monkeypatch.setattr(export_pipeline, "batch_export_concurrency", lambda config: 2)
+    monkeypatch.setattr(Cutter, "PARALLEL_BATCHES", 1)
+    monkeypatch.setattr(Cutter, "input_has_video", lambda self, path: True)
+    monkeypatch.setattr(Cutter, "_input_has_audio", lambda self, path: True)
+
+    # Each export extracts in one FFmpeg run; both must be running before either finishes
+    both_extracting = threading.Barrier(2, timeout=10)
+    segment_dirs: dict[Path, str] = {}
+    concat_lists: dict[Path, str] = {}
+    lock = threading.Lock()
+
+    def fake_run(cmd, *args, **kwargs):
+        if "-filter_complex" in cmd:
+            owner = "a" if str(loaded["a"].video_path) in cmd else "b"
+            both_extracting.wait()
+            with lock:
+                for arg in cmd:
+                    if Path(arg).name.startswith("segment_"):
+                        segment_dirs[Path(arg).parent] = owner
+        elif "concat" in cmd:
+            concat_list = Path(cmd[cmd.index("-i") + 1])
+            listed = Path(concat_list.read_text().splitlines()[0].split("'")[1])
+            with lock:
+                concat_lists[concat_list] = segment_dirs[listed.parent]
+            # export_project renames the concat output over the export path
+            Path(cmd[-1]).write_bytes(b"video")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr("video_editor.cutter.subprocess.run", fake_run)
+    monkeypatch.setattr(
+        "video_editor.cutter.run_ffmpeg",
+        lambda cmd, on_progress=None, should_cancel=None, cwd=None: fake_run(cmd),
+    )
+    config = Config(temp_dir=tmp_path / "tmp", use_hardware_encoding=False, ram_temp_segments=False)
+
+    outputs = export_pipeline.export_projects(
+        [tmp_path / "a.vedproj", tmp_path / "b.vedproj"], tmp_path / "out", config=config, no_captions=True
+    )
+
+    assert [path.name for path in outputs] == ["a_edited.mp4", "b_edited.mp4"]
+    # Both sources are named clip.mp4, yet every temp path belongs to one export
+    assert sorted(segment_dirs.values()) == ["a", "b"]
+    assert sorted(concat_lists.values()) == ["a", "b"]
+    assert list((tmp_path / "tmp").iterdir()) == []
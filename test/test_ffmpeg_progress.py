@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+
+import pytest
+
+from video_editor import ffmpeg_progress
+from video_editor.ffmpeg_progress import run_ffmpeg
+from video_editor.runtime_paths import ffmpeg_executable
+
+FFMPEG = ffmpeg_executable()
+
+pytestmark = pytest.mark.skipif(shutil.which(FFMPEG) is None, reason="FFmpeg is not installed")
+
+
+def _test_source(seconds: float) -> list[str]:
+    return [
+        FFMPEG, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc=size=160x120:rate=25:duration={seconds}",
+        "-f", "null", "-",
+    ]
+
+
+def test_run_ffmpeg_reports_output_time_until_the_end():
+    reported = []
+
+    result = run_ffmpeg(_test_source(2), on_progress=reported.append)
+
+    assert result.returncode == 0
+    assert reported
+    assert reported == sorted(reported)
+    assert reported[-1] == pytest.approx(2.0, abs=0.1)
+
+
+def test_run_ffmpeg_captures_stderr_of_a_failed_run(tmp_path):
+    result = run_ffmpeg([FFMPEG, "-hide_banner", "-i", str(tmp_path / "missing.mp4"), "-f", "null", "-"])
+
+    assert result.returncode != 0
+    assert "missing.mp4" in result.stderr
+
+
+def test_run_ffmpeg_terminates_ffmpeg_when_cancelled(monkeypatch):
+    processes = []
+    popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        process = popen(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(ffmpeg_progress.subprocess, "Popen", recording_popen)
+    # Real-time input keeps FFmpeg running far longer than the test waits
+    cmd = _test_source(60)
+    cmd.insert(cmd.index("-f"), "-re")
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        run_ffmpeg(cmd, should_cancel=lambda: True)
+
+    assert processes[0].poll() is not None
@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 
 from video_editor.analyzer import SegmentAction, TimeRange
-from video_editor.export_pipeline import crop_filter_from_project
+from video_editor.export_pipeline import crop_filter_from_project, crop_rect_from_project
 from video_editor.project_io import (
     add_highlight_range,
     backup_project_file,
@@ -15,6 +15,7 @@ from video_editor.project_io import (
     merge_project_with_analysis,
     parse_time,
     set_project_crop,
+    tokens_per_segment,
     write_project,
 )
 from video_editor.transcriber import Segment, Token
@@ -118,6 +119,21 @@ def test_final_tokens_exclude_cut_segments(tmp_path: Path):
     assert [token.text for token in tokens] == ["keep"]
 
 
+def test_tokens_per_segment_matches_filtering_every_token():
+    tokens = [Token(text=f"w{i}", start=i * 0.25, end=i * 0.25 + 0.2) for i in range(40)]
+    segments = [
+        Segment(start=0.0, end=1.0, text="a"),
+        Segment(start=1.0, end=2.6, text="b"),
+        Segment(start=2.3, end=3.0, text="overlaps b"),
+        Segment(start=20.0, end=21.0, text="no tokens"),
+    ]
+
+    expected = [[t for t in tokens if seg.start <= t.start < seg.end] for seg in segments]
+
+    assert tokens_per_segment(tokens, segments) == expected
+    assert tokens_per_segment(list(reversed(tokens)), segments) == expected
+
+
 def test_crop_config_from_rect_round_trips_to_project(tmp_path: Path):
     project_path = tmp_path / "recording.vedproj"
     payload = build_project_payload(
@@ -243,6 +259,7 @@ def test_export_crop_filter_falls_back_to_recorder_sidecar(tmp_path: Path):
             assert path == video_path.resolve()
             return 3440, 1440
 
+    assert crop_rect_from_project(project, StubCutter()) == (760, 180, 1920, 1080)
     assert crop_filter_from_project(project, StubCutter()) == "crop=1920:1080:760:180"
 
 
@@ -0,0 +1,44 @@
+import os
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from video_editor.gui.models import EditSession
+from video_editor.gui.timeline import Timeline
+
+
+def _qt_app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_timeline_playhead_ignores_sub_pixel_moves(monkeypatch):
+    _qt_app()
+    timeline = Timeline()
+    view = timeline._view
+    moves = []
+    monkeypatch.setattr(view._playhead, "set_position", lambda seconds, pps: moves.append(seconds))
+
+    # 50 px/s: 1 ms steps move the playhead 0.05 px each
+    for step in range(20):
+        timeline.set_playhead_position(step * 0.001)
+    timeline.set_playhead_position(1.0)
+
+    assert moves == [0.0, 0.01, 1.0]
+
+
+def test_timeline_playhead_is_redrawn_after_loading_a_session(tmp_path: Path, monkeypatch):
+    _qt_app()
+    timeline = Timeline()
+    moves = []
+    monkeypatch.setattr(timeline._view._playhead, "set_position", lambda seconds, pps: moves.append(seconds))
+
+    timeline.set_playhead_position(1.0)
+    timeline.load_session(EditSession(video_path=tmp_path / "next.mp4", video_duration=10.0))
+    timeline.set_playhead_position(1.0)
+
+    assert moves == [1.0, 1.0]
@@ -1,9 +1,12 @@
 """Analysis module for detecting bad takes, pauses, and retakes."""
 
+import importlib.util
 import os
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 
 from rapidfuzz import fuzz
 from rich.console import Console
@@ -70,19 +73,21 @@ HUNGARIAN_COMPLETION_MARKERS = [
     r"vége\s*$",      # "the end"
 ]
 
-# Try importing Gemini (primary) - new package
-try:
-    from google import genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
 
-# Try importing OpenAI (fallback)
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+def _module_available(name: str) -> bool:
+    """Return whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# The LLM SDKs are slow to import, so Analyzer imports them only when it
+# creates a client; here we only check that they are installed.
+# Gemini (primary) - new package
+GEMINI_AVAILABLE = _module_available("google.genai")
+# OpenAI (fallback)
+OPENAI_AVAILABLE = _module_available("openai")
 
 
 class SegmentAction(Enum):
@@ -112,6 +117,26 @@ class TimeRange:
         return self.end - self.start
 
 
+def segments_within_ranges(segments: list[Segment], ranges: list[TimeRange]) -> list[bool]:
+    """
+    Return, for each segment, whether it lies entirely inside one of the ranges.
+
+    Same result as checking every range per segment, but the ranges are sorted
+    once and each segment is answered with a binary search over the running
+    maximum range end, so the ranges may be unsorted or overlapping.
+    """
+    ordered = sorted(ranges, key=lambda r: r.start)
+    starts = [r.start for r in ordered]
+    # reach[i] is the furthest end among the first i + 1 ranges (by start)
+    reach = list(accumulate((r.end for r in ordered), max))
+
+    within: list[bool] = []
+    for seg in segments:
+        count = bisect_right(starts, seg.start)
+        within.append(count > 0 and seg.end <= reach[count - 1])
+    return within
+
+
 @dataclass
 class RetakeGroup:
     """A group of segments that are retakes of each other."""
@@ -145,9 +170,11 @@ class Analyzer:
         # Initialize Gemini if available (primary)
         gemini_key = os.getenv("GEMINI_API_KEY")
         if GEMINI_AVAILABLE and gemini_key:
+            from google import genai
             self._gemini_client = genai.Client(api_key=gemini_key)
             console.print("[green]✓[/green] Using Gemini 3 Flash for take selection")
         elif OPENAI_AVAILABLE and self.config.openai_api_key:
+            from openai import OpenAI
             self._openai_client = OpenAI(api_key=self.config.openai_api_key)
             console.print("[yellow]Using OpenAI as fallback for take selection[/yellow]")
         else:
@@ -775,15 +802,10 @@ DECISION: [number]"""
         kept_segments: list[Segment] = []
         removed_count = 0
 
-        for seg in segments:
-            # Check if this segment falls within a removal range
-            should_remove = False
-            for remove_range in ranges_to_remove:
-                # Segment is within removal range if it overlaps significantly
-                if seg.start >= remove_range.start and seg.end <= remove_range.end:
-                    should_remove = True
-                    break
+        # A segment is removed if it falls entirely within a removal range
+        remove_flags = segments_within_ranges(segments, ranges_to_remove)
 
+        for seg, should_remove in zip(segments, remove_flags):
             if not should_remove:
                 # Apply buffers to prevent word cutoff
                 buffered_start = max(0.0, seg.start - self.config.segment_start_buffer)
@@ -1,5 +1,6 @@
 """Caption generation and burning module."""
 
+from collections.abc import Callable
 from pathlib import Path
 import subprocess
 import re
@@ -10,6 +11,8 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import Config, CaptionStyle, CAPTION_STYLES
+from .cutter import CutGraph
+from .ffmpeg_progress import run_ffmpeg
 from .runtime_paths import ffmpeg_executable, ffprobe_executable
 from .transcriber import Segment, Token
 from .encoder import get_encoder_args, EncoderConfig
@@ -764,19 +767,25 @@ class Captioner:
 
     def _burn_streaming_captions_preview_renderer(
         self,
-        video_path: Path,
+        video_path: Path | None,
         tokens: list[Token],
         output_path: Path,
         max_words: int,
         caption_settings: dict | None,
         video_width: int,
         video_height: int,
+        cut: CutGraph | None = None,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> Path:
         """Burn captions with Qt when FFmpeg has no text-rendering filter.
 
         The packaged FFmpeg deliberately stays small and can omit libass and
         libfreetype.  Unlike the former soft-subtitle fallback, this produces a
         real video overlay and follows the GUI preview's text and box geometry.
+
+        With a cut graph, video_path is ignored and the overlay is applied to
+        the graph's [cutv]/[cuta] outputs in the same FFmpeg process.
         """
         console.print("[dim]Using the preview renderer for burned-in captions[/dim]")
         events = self._caption_events_for_preview(tokens, max_words)
@@ -823,21 +832,39 @@ class Captioner:
             manifest_path.write_text("\n".join(manifest_lines) + "\n", encoding="utf-8")
 
             encoder_args = get_encoder_args(self.encoder_config)
+            if cut is None:
+                source_args = ["-i", str(video_path)]
+                source_graph = ""
+                base_video = "[0:v]"
+                caption_input = 1
+                audio_args = ["-map", "0:a?", "-c:a", "copy"]
+            else:
+                source_args = cut.input_args
+                source_graph = cut.filter_graph + ";"
+                base_video = "[cutv]"
+                caption_input = cut.input_count
+                audio_args = [
+                    "-map", "[cuta]",
+                    "-c:a", "aac",
+                    "-b:a", "256k",
+                    "-ar", "48000",
+                    "-ac", "2",
+                ] if cut.has_audio else ["-an"]
             filter_complex = (
-                "[1:v]format=rgba,setpts=PTS-STARTPTS[captions];"
-                "[0:v][captions]overlay=0:0:eof_action=pass:repeatlast=0:format=auto[video]"
+                f"{source_graph}"
+                f"[{caption_input}:v]format=rgba,setpts=PTS-STARTPTS[captions];"
+                f"{base_video}[captions]overlay=0:0:eof_action=pass:repeatlast=0:format=auto[video]"
             )
             cmd = [
                 FFMPEG, "-y",
                 "-hide_banner", "-loglevel", "error", "-nostats",
-                "-i", str(video_path),
+                *source_args,
                 "-f", "concat", "-safe", "0", "-i", manifest_path.name,
                 "-filter_complex", filter_complex,
                 "-map", "[video]",
-                "-map", "0:a?",
                 *encoder_args,
                 "-pix_fmt", "yuv420p",
-                "-c:a", "copy",
+                *audio_args,
                 str(output_path),
             ]
 
@@ -847,11 +874,11 @@ class Captioner:
                 console=console,
             ) as progress:
                 progress.add_task("Encoding video with preview-matched captions...", total=None)
-                result = subprocess.run(
+                result = run_ffmpeg(
                     cmd,
+                    on_progress=on_progress,
+                    should_cancel=should_cancel,
                     cwd=render_dir,
-                    capture_output=True,
-                    text=True,
                 )
 
             if result.returncode != 0:
@@ -944,7 +971,7 @@ class Captioner:
         pos_y_px = max(0, min(video_height, int(pos_y * video_height)))
 
         # ASS header with style definition
-        ass_content = """[Script Info]
+        ass_header = """[Script Info]
 Title: Streaming Captions
 ScriptType: v4.00+
 PlayResX: {play_res_x}
@@ -978,42 +1005,46 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             centis = int((seconds % 1) * 100)
             return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
 
-        # Generate dialogue lines for each revealed word.
-        for chunk in chunks:
-            if not chunk:
-                continue
-
-            chunk_end = chunk[-1].end + 0.1
-
-            for i, token in enumerate(chunk):
-                accumulated_text = "".join(t.text for t in chunk[:i + 1]).strip()
-                accumulated_text = self._ensure_punctuation_spacing(accumulated_text)
-                lines = self._split_into_lines(
-                    accumulated_text,
-                    words_per_line=approx_words_per_line,
-                )
-                visible_text = r"\N".join(self._escape_ass_text(line) for line in lines)
-
-                delay = self.config.caption_delay
-                word_start = token.start + delay
-                if i < len(chunk) - 1:
-                    word_end = chunk[i + 1].start + delay
-                else:
-                    word_end = chunk_end + delay
+        def dialogue_lines():
+            """Yield one dialogue line per revealed word."""
+            for chunk in chunks:
+                if not chunk:
+                    continue
 
-                if word_end <= word_start:
-                    word_end = word_start + 0.01
+                chunk_end = chunk[-1].end + 0.1
+                revealed = ""
 
-                start_time = format_ass_time(word_start)
-                end_time = format_ass_time(word_end)
-                ass_content += (
-                    f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,"
-                    f"{{\\pos({pos_x_px},{pos_y_px})}}{font_override}{visible_text}\n"
-                )
+                for i, token in enumerate(chunk):
+                    revealed += token.text
+                    accumulated_text = self._ensure_punctuation_spacing(revealed.strip())
+                    lines = self._split_into_lines(
+                        accumulated_text,
+                        words_per_line=approx_words_per_line,
+                    )
+                    visible_text = r"\N".join(self._escape_ass_text(line) for line in lines)
+
+                    delay = self.config.caption_delay
+                    word_start = token.start + delay
+                    if i < len(chunk) - 1:
+                        word_end = chunk[i + 1].start + delay
+                    else:
+                        word_end = chunk_end + delay
+
+                    if word_end <= word_start:
+                        word_end = word_start + 0.01
+
+                    start_time = format_ass_time(word_start)
+                    end_time = format_ass_time(word_end)
+                    yield (
+                        f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,"
+                        f"{{\\pos({pos_x_px},{pos_y_px})}}{font_override}{visible_text}\n"
+                    )
 
+        # Lines are written as they are generated instead of building the whole file
         output_path = Path(output_path)
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(ass_content)
+            f.write(ass_header)
+            f.writelines(dialogue_lines())
 
         return output_path
 
@@ -1027,6 +1058,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         caption_settings: dict | None,
         video_width: int,
         video_height: int,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> Path:
         """Burn streaming captions using ASS subtitles."""
         import os
@@ -1080,7 +1113,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 console=console,
             ) as progress:
                 progress.add_task("Encoding video with streaming captions...", total=None)
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = run_ffmpeg(cmd, on_progress=on_progress, should_cancel=should_cancel)
 
             if result.returncode != 0:
                 raise RuntimeError(f"FFmpeg ASS caption burning failed: {result.stderr}")
@@ -1100,7 +1133,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         tokens: list[Token],
         output_path: Path,
         max_words: int = 15,
-        caption_settings: dict = None
+        caption_settings: dict = None,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> Path:
         """
         Burn streaming captions into video using FFmpeg.
@@ -1117,6 +1152,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             caption_settings: Optional dict with GUI caption settings
                 (font_size, font_family, font_weight, text_color, show_background,
                  pos_x, pos_y, box_width, box_height)
+            on_progress: Called with the encoded output time in seconds
+            should_cancel: Polled while encoding; stops FFmpeg with a RuntimeError
 
         Returns:
             Path to the output video
@@ -1170,6 +1207,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 caption_settings,
                 video_width,
                 video_height,
+                on_progress=on_progress,
+                should_cancel=should_cancel,
             )
 
         # Prefer the file-based ASS path for legacy/headless callers that have
@@ -1188,6 +1227,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 caption_settings,
                 video_width,
                 video_height,
+                on_progress=on_progress,
+                should_cancel=should_cancel,
             )
 
         if has_drawtext:
@@ -1222,6 +1263,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 caption_settings,
                 video_width,
                 video_height,
+                on_progress=on_progress,
+                should_cancel=should_cancel,
             )
 
         # Execute for drawtext path
@@ -1231,7 +1274,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             console=console,
         ) as progress:
             progress.add_task("Encoding video with streaming captions...", total=None)
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, on_progress=on_progress, should_cancel=should_cancel)
 
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg streaming caption burning failed: {result.stderr}")
@@ -1239,6 +1282,52 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         console.print(f"[green]✓[/green] Video with streaming captions saved to {output_path}")
         return output_path
 
+    def burn_captions_over_cut(
+        self,
+        cut: CutGraph,
+        tokens: list[Token],
+        output_path: Path,
+        max_words: int = 15,
+        caption_settings: dict | None = None,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> Path:
+        """
+        Cut and caption in one FFmpeg process, without an intermediate file.
+
+        The cut graph (see Cutter.build_cut_graph) feeds the preview-renderer
+        overlay directly, so the video is decoded and encoded once instead of
+        being written by the cutter and re-read for captioning.
+
+        Args:
+            cut: Cut timeline from Cutter.build_cut_graph
+            tokens: Word-level tokens already mapped onto the cut timeline
+            output_path: Path for output video
+            max_words: Maximum words on screen at once
+            caption_settings: Optional dict with GUI caption settings
+            on_progress: Called with the encoded output time in seconds
+            should_cancel: Polled while encoding; stops FFmpeg with a RuntimeError
+
+        Returns:
+            Path to the output video
+        """
+        output_path = Path(output_path).resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        console.print(f"[blue]Cutting and burning captions ({len(tokens)} words) in one pass...[/blue]")
+        return self._burn_streaming_captions_preview_renderer(
+            None,
+            tokens,
+            output_path,
+            max_words,
+            caption_settings,
+            cut.width,
+            cut.height,
+            cut=cut,
+            on_progress=on_progress,
+            should_cancel=should_cancel,
+        )
+
     def _tokens_to_segments(self, tokens: list[Token], max_words: int = 20) -> list[Segment]:
         """Convert tokens to segments for fallback captioning."""
         chunks = self._chunk_tokens(tokens, max_words)
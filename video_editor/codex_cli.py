@@ -20,7 +20,7 @@ from .codex_workflow import finish_edit
 from .config import Config
 from .cutter import Cutter
 from .environment import load_app_env
-from .export_pipeline import export_project
+from .export_pipeline import export_project, export_projects
 from .project_io import (
     add_highlight_range,
     crop_config_from_rect,
@@ -309,6 +309,26 @@ def export(project: Path, output_path: Path, no_captions: bool, keep_temp: bool)
     console.print(f"[green]Exported[/green] [cyan]{output}[/cyan]")
 
 
+@main.command()
+@click.argument("projects", nargs=-1, required=True,
+                type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("-o", "--output-dir", required=True,
+              type=click.Path(file_okay=False, path_type=Path),
+              help="Directory for the exported videos (<project>_edited.mp4, .m4a for audio).")
+@click.option("--no-captions", is_flag=True, help="Skip burned captions.")
+@click.option("--keep-temp", is_flag=True, help="Keep temporary processing files.")
+def export_batch(projects: tuple[Path, ...], output_dir: Path, no_captions: bool, keep_temp: bool) -> None:
+    """Export several saved projects, overlapping them on hardware encoders."""
+    outputs = export_projects(
+        list(projects),
+        output_dir,
+        config=_build_config(openai_key=None, keep_temp=keep_temp),
+        no_captions=no_captions,
+    )
+    for output in outputs:
+        console.print(f"[green]Exported[/green] [cyan]{output}[/cyan]")
+
+
 @main.command()
 @click.argument("project", type=click.Path(exists=True, dir_okay=False, path_type=Path))
 @click.option("--export", "export_video", required=True,
@@ -74,6 +74,30 @@ class Config(BaseModel):
         default=False,
         description="Keep temporary files after processing"
     )
+    ram_temp_segments: bool = Field(
+        default=True,
+        description=(
+            "Write intermediate cut segments to /dev/shm when they fit in a quarter of its "
+            "free space. Saves a disk write + read of the whole cut, at the cost of RAM "
+            "while exporting. Ignored when keep_temp is set."
+        )
+    )
+    cache_export_segments: bool = Field(
+        default=False,
+        description=(
+            "Keep encoded cut segments in ~/.cache/video_editor/segments and reuse them "
+            "when an unchanged range is exported again. Opt-in: the cache grows to 5 GiB "
+            "before the least recently used segments are evicted"
+        )
+    )
+    fast_short_segments: bool = Field(
+        default=False,
+        description=(
+            "Encode cuts whose ranges average under 3 seconds with libx264's zerolatency "
+            "tuning and 30-frame GOPs. Faster on talk-heavy edits, but it drops B-frames "
+            "and lookahead for the whole export, so quality per bit is noticeably lower"
+        )
+    )
     
     # LLM settings for take selection
     openai_api_key: str | None = Field(
@@ -132,7 +156,15 @@ class Config(BaseModel):
     # Hardware encoding settings
     use_hardware_encoding: bool = Field(
         default=True,
-        description="Use VideoToolbox hardware encoding if available (macOS)"
+        description="Use a hardware H.264 encoder (VideoToolbox, NVENC or QSV) if available"
+    )
+    max_encoder_sessions: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Hardware encode sessions one export may hold at once (None = the encoder's "
+            "limit). Lowered when several exports share the encoder."
+        )
     )
 
 
@@ -1,7 +1,14 @@
 """Video cutting module using FFmpeg."""
 
+import json
+import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from rich.console import Console
@@ -9,19 +16,94 @@ from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 
 from .analyzer import TimeRange
 from .config import Config
-from .encoder import get_encoder_args, EncoderConfig
+from .encoder import encoder_session_limit, get_encoder_args, EncoderConfig
+from .export_cache import SegmentCache
+from .ffmpeg_progress import run_ffmpeg
 from .runtime_paths import ffmpeg_executable, ffprobe_executable
+from .transcriber import Token
 
 console = Console()
 FFMPEG = ffmpeg_executable()
 FFPROBE = ffprobe_executable()
 
+# RAM-backed filesystem for intermediate segments (Linux only)
+SHM_DIR = Path("/dev/shm")
+# Only use shared memory when the segments fit comfortably in it
+SHM_MAX_FRACTION = 0.25
+
+
+def _pick_temp_dir(estimated_size_bytes: float | None, fallback: Path) -> Path:
+    """
+    Return the fastest directory that can hold the intermediate segments.
+
+    Prefers SHM_DIR when it exists, is writable and the estimated segment
+    total fits in SHM_MAX_FRACTION of its free space; otherwise returns
+    the fallback directory.
+    """
+    if not estimated_size_bytes or not SHM_DIR.is_dir() or not os.access(SHM_DIR, os.W_OK):
+        return fallback
+    try:
+        free_bytes = shutil.disk_usage(SHM_DIR).free
+    except OSError:
+        return fallback
+    if estimated_size_bytes <= free_bytes * SHM_MAX_FRACTION:
+        return SHM_DIR
+    return fallback
+
+
+@dataclass
+class SegmentJob:
+    """A single range to extract from the input video."""
+    output_path: Path
+    start: float
+    end: float
+    freeze_last_frame: bool = True
+    crop_filter: str | None = None
+
+
+@dataclass
+class CutGraph:
+    """
+    The cut_video() timeline as FFmpeg inputs plus one filtergraph.
+
+    The graph labels its outputs [cutv] and, when has_audio, [cuta], so a
+    later stage can filter and encode the cut in the same FFmpeg process.
+    """
+    input_args: list[str]
+    filter_graph: str
+    has_audio: bool
+    width: int
+    height: int
+
+    @property
+    def input_count(self) -> int:
+        """Number of FFmpeg inputs declared by input_args."""
+        return self.input_args.count("-i")
+
 
 class Cutter:
     """Handles video cutting and concatenation using FFmpeg."""
 
     # Gap between segments in seconds
     SEGMENT_GAP = 0.2
+    # Segments extracted per FFmpeg process (bounds open inputs per batch)
+    SEGMENTS_PER_PROCESS = 8
+    # FFmpeg batch processes run at once; each already encodes several outputs
+    PARALLEL_BATCHES = max(1, min(4, (os.cpu_count() or 1) // 2))
+    # Intermediate segments are written as fragmented MP4 with a shared video
+    # timescale, so the concat demuxer can append them without per-file moov
+    # parsing or timestamp rescaling. Audio timescale follows the fixed 48 kHz rate.
+    SEGMENT_MOVFLAGS = ["-movflags", "+frag_keyframe+empty_moov+default_base_moof"]
+    SEGMENT_VIDEO_TIMESCALE = ["-video_track_timescale", "90000"]
+    # Mean range duration (seconds) below which Config.fast_short_segments switches on
+    # the encoder's short-segment mode
+    SHORT_SEGMENT_SECONDS = 3.0
+    # Ranges closer than this (seconds) are cut as one segment
+    RANGE_MERGE_TOLERANCE = 0.02
+    # A single-range cut is stream-copied when its start is at most this long after a keyframe
+    KEYFRAME_TOLERANCE = 0.05
+    # Most ranges build_cut_graph() opens as inputs of a single FFmpeg process
+    MAX_GRAPH_RANGES = 16
 
     def __init__(self, config: Config, encoder_config: EncoderConfig | None = None):
         self.config = config
@@ -30,7 +112,59 @@ class Cutter:
         )
         self._has_audio_cache: dict[str, bool] = {}
         self._has_video_cache: dict[str, bool] = {}
+        self._dimensions_cache: dict[str, tuple[int, int]] = {}
+        self._duration_cache: dict[str, float] = {}
+        self._bit_rate_cache: dict[str, int | None] = {}
+        self.segment_cache = SegmentCache() if config.cache_export_segments else None
+
+    def with_config(self, config: Config) -> "Cutter":
+        """Return a cutter for config that starts with this cutter's media probe results."""
+        cutter = Cutter(config)
+        cutter._has_audio_cache = self._has_audio_cache.copy()
+        cutter._has_video_cache = self._has_video_cache.copy()
+        cutter._dimensions_cache = self._dimensions_cache.copy()
+        cutter._duration_cache = self._duration_cache.copy()
+        cutter._bit_rate_cache = self._bit_rate_cache.copy()
+        return cutter
     
+    @classmethod
+    def coalesce_ranges(cls, ranges: list[TimeRange]) -> list[TimeRange]:
+        """
+        Sort ranges and merge duplicates, overlaps and near-adjacent ranges.
+
+        This is the segment layout cut_video() produces, so token timing must
+        be mapped onto the cut timeline with the same ranges.
+
+        Args:
+            ranges: Time ranges to keep, in any order
+
+        Returns:
+            Sorted, non-overlapping ranges
+        """
+        return [range_ for range_, _ in cls._coalesce_ranges_with_sources(ranges)]
+
+    @classmethod
+    def cut_duration(cls, ranges: list[TimeRange]) -> float:
+        """Length in seconds of the video cut_video() makes from ranges, gaps included."""
+        ranges = cls.coalesce_ranges(ranges)
+        if not ranges:
+            return 0.0
+        return sum(r.end - r.start for r in ranges) + cls.SEGMENT_GAP * (len(ranges) - 1)
+
+    @classmethod
+    def _coalesce_ranges_with_sources(cls, ranges: list[TimeRange]) -> list[tuple[TimeRange, int]]:
+        """Coalesce ranges, pairing each result with the index of its first source range."""
+        order = sorted(range(len(ranges)), key=lambda index: ranges[index].start)
+        merged: list[tuple[TimeRange, int]] = []
+        for index in order:
+            current = ranges[index]
+            if merged and current.start <= merged[-1][0].end + cls.RANGE_MERGE_TOLERANCE:
+                previous, source = merged[-1]
+                merged[-1] = (TimeRange(previous.start, max(previous.end, current.end)), source)
+            else:
+                merged.append((current, index))
+        return merged
+
     def get_video_duration(self, video_path: Path) -> float:
         """
         Get the duration of a video file using FFprobe.
@@ -41,12 +175,16 @@ class Cutter:
         Returns:
             Duration in seconds
         """
+        key = str(Path(video_path).resolve())
+        if key in self._duration_cache:
+            return self._duration_cache[key]
+
         cmd = [
             FFPROBE,
             "-v", "error",
             "-show_entries", "format=duration",
             "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
+            key
         ]
 
         result = subprocess.run(cmd, capture_output=True, text=True)
@@ -54,7 +192,9 @@ class Cutter:
         if result.returncode != 0:
             raise RuntimeError(f"FFprobe failed: {result.stderr}")
 
-        return float(result.stdout.strip())
+        duration = float(result.stdout.strip())
+        self._duration_cache[key] = duration
+        return duration
 
     def get_video_dimensions(self, video_path: Path) -> tuple[int, int]:
         """
@@ -66,13 +206,17 @@ class Cutter:
         Returns:
             Tuple of (width, height) in pixels
         """
+        key = str(Path(video_path).resolve())
+        if key in self._dimensions_cache:
+            return self._dimensions_cache[key]
+
         cmd = [
             FFPROBE,
             "-v", "error",
             "-select_streams", "v:0",
             "-show_entries", "stream=width,height",
             "-of", "csv=p=0",
-            str(video_path)
+            key
         ]
 
         result = subprocess.run(cmd, capture_output=True, text=True)
@@ -84,8 +228,94 @@ class Cutter:
         width = int(parts[0]) if len(parts) > 0 else 1920
         height = int(parts[1]) if len(parts) > 1 else 1080
 
+        self._dimensions_cache[key] = (width, height)
         return width, height
 
+    def get_bit_rate(self, video_path: Path) -> int | None:
+        """
+        Get the overall bit rate of a media file using FFprobe.
+
+        Args:
+            video_path: Path to the media file
+
+        Returns:
+            Bit rate in bits per second, or None if it cannot be determined
+        """
+        key = str(Path(video_path).resolve())
+        if key in self._bit_rate_cache:
+            return self._bit_rate_cache[key]
+
+        cmd = [
+            FFPROBE,
+            "-v", "error",
+            "-show_entries", "format=bit_rate",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            key
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            return None
+        try:
+            bit_rate = int(result.stdout.strip())
+        except ValueError:
+            bit_rate = None
+        self._bit_rate_cache[key] = bit_rate
+        return bit_rate
+
+    def probe_media(self, input_path: Path) -> None:
+        """
+        Fill every probe cache for an input with a single FFprobe run.
+
+        Callers that know an input will be cut (e.g. when a video is opened)
+        can warm the caches up front; the individual getters then return
+        without forking FFprobe again.
+        """
+        key = str(Path(input_path).resolve())
+        cmd = [
+            FFPROBE,
+            "-v", "error",
+            "-show_entries", "format=duration,bit_rate:stream=codec_type,width,height",
+            "-of", "json",
+            key,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return
+        try:
+            data = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            return
+
+        streams = data.get("streams", [])
+        video = next((stream for stream in streams if stream.get("codec_type") == "video"), None)
+        self._has_video_cache[key] = video is not None
+        self._has_audio_cache[key] = any(stream.get("codec_type") == "audio" for stream in streams)
+        if video and video.get("width") and video.get("height"):
+            self._dimensions_cache[key] = (int(video["width"]), int(video["height"]))
+
+        media_format = data.get("format", {})
+        try:
+            self._duration_cache[key] = float(media_format["duration"])
+        except (KeyError, ValueError):
+            pass
+        try:
+            self._bit_rate_cache[key] = int(media_format["bit_rate"])
+        except (KeyError, ValueError):
+            pass
+
+    def _segment_temp_root(self, input_path: Path, ranges: list[TimeRange]) -> Path:
+        """Choose where intermediate segments are written for this cut."""
+        fallback = self.config.temp_dir or Path(tempfile.gettempdir())
+        if not self.config.ram_temp_segments or self.config.keep_temp:
+            return fallback
+        bit_rate = self.get_bit_rate(input_path)
+        if not bit_rate:
+            return fallback
+        kept_seconds = sum(r.end - r.start for r in ranges)
+        return _pick_temp_dir(kept_seconds * bit_rate / 8, fallback)
+
     def _input_has_audio(self, video_path: Path) -> bool:
         """Check whether the input file has at least one audio stream."""
         key = str(Path(video_path).resolve())
@@ -124,6 +354,86 @@ class Cutter:
         self._has_video_cache[key] = has_video
         return has_video
 
+    def _keyframe_near(self, video_path: Path, time_seconds: float) -> bool:
+        """Check whether a video keyframe lies at or up to KEYFRAME_TOLERANCE before a time."""
+        if time_seconds <= self.KEYFRAME_TOLERANCE:
+            return True
+
+        # Only the packets around the cut point are read, not the whole file
+        cmd = [
+            FFPROBE,
+            "-v", "error",
+            "-select_streams", "v:0",
+            "-read_intervals", f"{max(0.0, time_seconds - 1.0):.3f}%{time_seconds + 1.0:.3f}",
+            "-show_entries", "packet=pts_time,flags",
+            "-of", "csv=p=0",
+            str(video_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return False
+
+        for line in result.stdout.splitlines():
+            pts_time, _, flags = line.partition(",")
+            try:
+                pts = float(pts_time)
+            except ValueError:
+                continue
+            # A keyframe after the cut would make the copied video start early
+            if "K" in flags and time_seconds - self.KEYFRAME_TOLERANCE <= pts <= time_seconds:
+                return True
+        return False
+
+    def _copy_range(
+        self,
+        input_path: Path,
+        range_: TimeRange,
+        output_path: Path,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> bool:
+        """
+        Trim one range by copying the video stream instead of re-encoding it.
+
+        Audio is still normalized to the AAC layout cut_video() always produces.
+        Returns False when FFmpeg cannot copy the stream into the output container.
+        Raises RuntimeError when should_cancel stopped FFmpeg.
+        """
+        cmd = [
+            FFMPEG,
+            "-y",
+            "-hide_banner", "-loglevel", "error", "-nostats",
+            "-ss", str(range_.start),
+            "-t", str(range_.end - range_.start),
+            "-i", str(input_path),
+            "-map", "0:v:0", "-c:v", "copy",
+        ]
+        if self._input_has_audio(input_path):
+            cmd.extend([
+                "-map", "0:a:0",
+                "-c:a", "aac",
+                "-b:a", "256k",
+                "-ar", "48000",
+                "-ac", "2",
+            ])
+        else:
+            cmd.append("-an")
+        cmd.extend([
+            "-avoid_negative_ts", "make_zero",
+            "-movflags", "+faststart",
+            str(output_path),
+        ])
+
+        try:
+            result = run_ffmpeg(cmd, on_progress=on_progress, should_cancel=should_cancel)
+        except RuntimeError:
+            Path(output_path).unlink(missing_ok=True)
+            raise
+        if result.returncode != 0:
+            Path(output_path).unlink(missing_ok=True)
+            return False
+        return True
+
     def cut_segment(
         self,
         input_path: Path,
@@ -141,7 +451,7 @@ class Cutter:
         can only cut at keyframes, causing timing mismatches that desync captions.
 
         Optionally freezes the last frame for SEGMENT_GAP duration to create
-        smooth transitions between segments (uses two-pass for reliability).
+        smooth transitions between segments.
 
         Args:
             input_path: Path to input video
@@ -155,78 +465,85 @@ class Cutter:
         Returns:
             Path to the extracted segment
         """
-        if not self.input_has_video(input_path):
-            return self._cut_audio_segment(input_path, output_path, start, end)
-
-        # Single-pass approach using filter chains for trimming and frame freeze.
-        # Use input-level -ss/-t to keep decoding bounded for each segment.
-        if freeze_last_frame and self.SEGMENT_GAP > 0:
-            # Build video filter chain: trim + optional crop + tpad
-            duration = end - start
-            vf_parts = [f"trim=duration={duration}", "setpts=PTS-STARTPTS"]
-            if crop_filter:
-                vf_parts.append(crop_filter)
-            vf_parts.append(f"tpad=stop_mode=clone:stop_duration={self.SEGMENT_GAP}")
-            video_filter = ",".join(vf_parts)
-            has_audio = self._input_has_audio(input_path)
-            encoder_args = get_encoder_args(self.encoder_config)
-            cmd = [
-                FFMPEG,
-                "-y",
-                "-hide_banner", "-loglevel", "error", "-nostats",
-                "-ss", str(start),
-                "-t", str(duration),
+        job = SegmentJob(output_path, start, end, freeze_last_frame, crop_filter)
+        self.cut_segments(input_path, [job])
+        return output_path
+
+    def cut_segments(
+        self,
+        input_path: Path,
+        jobs: list[SegmentJob],
+        encoder_config: EncoderConfig | None = None,
+        on_progress: Callable[[float], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> list[Path]:
+        """
+        Extract several segments from the same input with one FFmpeg process.
+
+        Each job gets its own seeked input (``-ss``/``-t`` before ``-i``) and
+        its own output, so decoding stays bounded per segment while process
+        startup and library initialization are paid once per batch.
+
+        Args:
+            input_path: Path to input video
+            jobs: Segments to extract
+            encoder_config: Encoder override for this batch (defaults to self.encoder_config)
+            on_progress: Called with FFmpeg's output time in seconds; the
+                segments are encoded side by side, so this is roughly the
+                position reached in each of them
+            should_cancel: Polled while FFmpeg runs; when it returns True FFmpeg
+                is stopped and a RuntimeError is raised
+
+        Returns:
+            Paths to the extracted segments, in job order
+        """
+        if not jobs:
+            return []
+
+        cmd = [
+            FFMPEG,
+            "-y",
+            "-hide_banner", "-loglevel", "error", "-nostats",
+        ]
+        for job in jobs:
+            cmd.extend([
+                "-ss", str(job.start),
+                "-t", str(job.end - job.start),
                 "-i", str(input_path),
-            ]
+            ])
 
-            if has_audio:
+        if not self.input_has_video(input_path):
+            # Audio-only ranges: no synthetic video stream is created.
+            for i, job in enumerate(jobs):
                 cmd.extend([
-                    "-vf", video_filter,
-                    "-af", f"atrim=duration={duration},asetpts=PTS-STARTPTS",
-                    *encoder_args,
+                    "-map", f"{i}:a:0",
                     "-c:a", "aac",
                     "-b:a", "256k",
                     "-ar", "48000",
                     "-ac", "2",
                     "-avoid_negative_ts", "make_zero",
-                    str(output_path)
+                    *self.SEGMENT_MOVFLAGS,
+                    str(job.output_path),
                 ])
-            else:
-                cmd.extend([
-                    "-vf", video_filter,
-                    *encoder_args,
-                    "-an",
-                    "-avoid_negative_ts", "make_zero",
-                    str(output_path)
-                ])
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd, on_progress=on_progress, should_cancel=should_cancel)
             if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg segment extraction failed: {result.stderr}")
+                raise RuntimeError(f"FFmpeg audio segment extraction failed: {result.stderr}")
+            return [job.output_path for job in jobs]
 
-        else:
-            # Single pass without frame freezing
-            cmd = [
-                FFMPEG,
-                "-y",
-                "-hide_banner", "-loglevel", "error", "-nostats",
-                "-ss", str(start),
-                "-i", str(input_path),
-                "-t", str(end - start),
-            ]
+        has_audio = self._input_has_audio(input_path)
+        encoder_args = get_encoder_args(encoder_config or self.encoder_config)
 
-            # Add crop filter if specified
-            if crop_filter:
-                cmd.extend(["-vf", crop_filter])
+        # Build one filter chain per job: trim + optional crop + optional tpad
+        graphs: list[str] = []
+        for i, job in enumerate(jobs):
+            graphs.extend(self._segment_filter_chains(job, i, has_audio))
+        cmd.extend(["-filter_complex", ";".join(graphs)])
 
-            encoder_args = get_encoder_args(self.encoder_config)
-            has_audio = self._input_has_audio(input_path)
-            cmd.extend([
-                *encoder_args,
-                "-avoid_negative_ts", "make_zero",
-            ])
+        for i, job in enumerate(jobs):
+            cmd.extend(["-map", f"[v{i}]", *encoder_args])
             if has_audio:
                 cmd.extend([
+                    "-map", f"[a{i}]",
                     "-c:a", "aac",
                     "-b:a", "256k",
                     "-ar", "48000",
@@ -234,44 +551,18 @@ class Cutter:
                 ])
             else:
                 cmd.append("-an")
-            cmd.append(str(output_path))
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg segment extraction failed: {result.stderr}")
-
-        return output_path
+            cmd.extend([
+                "-avoid_negative_ts", "make_zero",
+                *self.SEGMENT_MOVFLAGS,
+                *self.SEGMENT_VIDEO_TIMESCALE,
+                str(job.output_path),
+            ])
 
-    def _cut_audio_segment(
-        self,
-        input_path: Path,
-        output_path: Path,
-        start: float,
-        end: float,
-    ) -> Path:
-        """Extract an audio-only range without creating a synthetic video stream."""
-        duration = end - start
-        cmd = [
-            FFMPEG,
-            "-y",
-            "-hide_banner", "-loglevel", "error", "-nostats",
-            "-ss", str(start),
-            "-t", str(duration),
-            "-i", str(input_path),
-            "-map", "0:a:0",
-            "-c:a", "aac",
-            "-b:a", "256k",
-            "-ar", "48000",
-            "-ac", "2",
-            "-avoid_negative_ts", "make_zero",
-            "-movflags", "+faststart",
-            str(output_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_ffmpeg(cmd, on_progress=on_progress, should_cancel=should_cancel)
         if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg audio segment extraction failed: {result.stderr}")
-        return output_path
+            raise RuntimeError(f"FFmpeg segment extraction failed: {result.stderr}")
+
+        return [job.output_path for job in jobs]
 
     def create_gap_segment(
         self,
@@ -330,6 +621,8 @@ class Cutter:
             "-ar", "48000",
             "-ac", "2",
             "-shortest",
+            *self.SEGMENT_MOVFLAGS,
+            *self.SEGMENT_VIDEO_TIMESCALE,
             str(output_path)
         ]
 
@@ -342,7 +635,8 @@ class Cutter:
     def concatenate_segments(
         self,
         segment_paths: list[Path],
-        output_path: Path
+        output_path: Path,
+        should_cancel: Callable[[], bool] | None = None,
     ) -> Path:
         """
         Concatenate multiple video segments into one.
@@ -353,15 +647,20 @@ class Cutter:
         Args:
             segment_paths: List of paths to segment files
             output_path: Path for the concatenated output
+            should_cancel: Polled while FFmpeg runs; when it returns True FFmpeg
+                is stopped and a RuntimeError is raised
 
         Returns:
             Path to the concatenated video
         """
         temp_dir = self.config.temp_dir or Path(tempfile.gettempdir())
-        concat_file = temp_dir / "concat_list.txt"
 
-        # Create concat file - segments already have frozen frames appended
-        with open(concat_file, "w") as f:
+        # Create concat file - segments already have frozen frames appended.
+        # Each call gets its own list so concurrent exports cannot clobber it.
+        with tempfile.NamedTemporaryFile(
+            "w", prefix="concat_list_", suffix=".txt", dir=temp_dir, delete=False
+        ) as f:
+            concat_file = Path(f.name)
             for seg_path in segment_paths:
                 f.write(f"file '{seg_path}'\n")
 
@@ -397,34 +696,127 @@ class Cutter:
         cmd.extend(["-movflags", "+faststart"])
         cmd.append(str(output_path))
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        # Clean up concat file
-        if not self.config.keep_temp:
-            concat_file.unlink()
+        try:
+            result = run_ffmpeg(cmd, should_cancel=should_cancel)
+        finally:
+            # Clean up concat file
+            if not self.config.keep_temp:
+                concat_file.unlink()
 
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg concatenation failed: {result.stderr}")
 
         return output_path
 
+    def _segment_filter_chains(self, job: SegmentJob, input_index: int, has_audio: bool) -> list[str]:
+        """Filter chains that turn seeked input input_index into segment [v<i>]/[a<i>]."""
+        duration = job.end - job.start
+        vf_parts = [f"trim=duration={duration}", "setpts=PTS-STARTPTS"]
+        if job.crop_filter:
+            vf_parts.append(job.crop_filter)
+        if job.freeze_last_frame and self.SEGMENT_GAP > 0:
+            vf_parts.append(f"tpad=stop_mode=clone:stop_duration={self.SEGMENT_GAP}")
+        chains = [f"[{input_index}:v]{','.join(vf_parts)}[v{input_index}]"]
+        if has_audio:
+            chains.append(
+                f"[{input_index}:a]atrim=duration={duration},asetpts=PTS-STARTPTS[a{input_index}]"
+            )
+        return chains
+
+    def build_cut_graph(
+        self,
+        input_path: Path,
+        ranges: list[TimeRange],
+        crop_filter: str | None = None,
+        crop_size: tuple[int, int] | None = None,
+    ) -> CutGraph | None:
+        """
+        Describe cut_video()'s output as a filtergraph instead of a file.
+
+        Uses the same coalesced ranges, crop and frozen-frame gaps as
+        cut_video(), joined with the concat filter; the concat filter pads the
+        shorter audio of each gap with silence. Returns None when the layout
+        does not suit a single process (no video, or more than
+        MAX_GRAPH_RANGES ranges), in which case callers cut to a file.
+
+        crop_size is the (width, height) crop_filter produces and is required
+        with it; without a crop the graph has the input's dimensions.
+        """
+        if crop_filter and crop_size is None:
+            raise ValueError("crop_size is required with crop_filter")
+
+        input_path = Path(input_path).resolve()
+        if not ranges or not self.input_has_video(input_path):
+            return None
+
+        ranges = self.coalesce_ranges(ranges)
+        if len(ranges) > self.MAX_GRAPH_RANGES:
+            return None
+
+        has_audio = self._input_has_audio(input_path)
+        input_args: list[str] = []
+        chains: list[str] = []
+        concat_inputs: list[str] = []
+        for i, range_ in enumerate(ranges):
+            input_args.extend([
+                "-ss", str(range_.start),
+                "-t", str(range_.end - range_.start),
+                "-i", str(input_path),
+            ])
+            job = SegmentJob(
+                Path(),
+                range_.start,
+                range_.end,
+                freeze_last_frame=i < len(ranges) - 1,
+                crop_filter=crop_filter,
+            )
+            chains.extend(self._segment_filter_chains(job, i, has_audio))
+            concat_inputs.append(f"[v{i}][a{i}]" if has_audio else f"[v{i}]")
+
+        outputs = "[cutv][cuta]" if has_audio else "[cutv]"
+        chains.append(
+            f"{''.join(concat_inputs)}concat=n={len(ranges)}:v=1:a={int(has_audio)}{outputs}"
+        )
+
+        if crop_filter:
+            width, height = crop_size
+        else:
+            width, height = self.get_video_dimensions(input_path)
+
+        return CutGraph(input_args, ";".join(chains), has_audio, width, height)
+
     def cut_video(
         self,
         input_path: Path,
         ranges: list[TimeRange],
         output_path: Path,
         crop_filter: str | None = None,
-        segment_crop_filters: dict[int, str] | None = None
+        segment_crop_filters: dict[int, str] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        on_progress: Callable[[float], None] | None = None,
     ) -> Path:
         """
         Cut and concatenate video based on time ranges.
 
+        Ranges are coalesced first (see coalesce_ranges), so adjacent or
+        overlapping ranges become a single segment. A merged segment uses the
+        crop override of its earliest source range.
+
+        A single uncropped range that starts on a keyframe is a pure trim and
+        is stream-copied; everything else is re-encoded so the segments can be
+        cropped and joined with frozen-frame gaps.
+
         Args:
             input_path: Path to input video
             ranges: List of time ranges to keep
             output_path: Path for final output
             crop_filter: Global crop filter to apply to all segments (e.g., "crop=1280:720:320:180")
-            segment_crop_filters: Per-segment crop filter overrides {segment_index: filter_string}
+            segment_crop_filters: Per-segment crop filter overrides {range_index: filter_string}
+            should_cancel: Polled while FFmpeg runs; when it returns True the
+                running FFmpeg processes are stopped, the remaining batches are
+                skipped, extracted segments are removed and a RuntimeError is raised
+            on_progress: Called with the seconds of cut output extracted so far,
+                as FFmpeg reports its output time (see cut_duration for the total)
 
         Returns:
             Path to the processed video
@@ -435,61 +827,259 @@ class Cutter:
         if not ranges:
             raise ValueError("No segments to keep")
 
+        coalesced = self._coalesce_ranges_with_sources(ranges)
+        ranges = [range_ for range_, _ in coalesced]
+
         has_video = self.input_has_video(input_path)
         media_label = "video" if has_video else "audio"
         console.print(f"[blue]Cutting {len(ranges)} {media_label} segments...[/blue]")
         if crop_filter and has_video:
             console.print(f"[blue]Applying crop: {crop_filter}[/blue]")
 
-        # Setup temp directory
-        temp_dir = self.config.temp_dir or Path(tempfile.gettempdir())
-        temp_dir = temp_dir / f"video_editor_{input_path.stem}"
-        temp_dir.mkdir(exist_ok=True)
-
-        segment_paths: list[Path] = []
         segment_crop_filters = segment_crop_filters or {}
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Extracting segments", total=len(ranges))
-
-            for i, range_ in enumerate(ranges):
-                segment_suffix = ".mp4" if has_video else ".m4a"
-                seg_path = temp_dir / f"segment_{i:04d}{segment_suffix}"
-                # Don't freeze last frame on the final segment (no transition after it)
-                is_last = (i == len(ranges) - 1)
+        # A lone uncropped range has no gap to freeze, so it may not need encoding
+        if (
+            has_video
+            and len(ranges) == 1
+            and segment_crop_filters.get(coalesced[0][1], crop_filter) is None
+            and self._keyframe_near(input_path, ranges[0].start)
+            and self._copy_range(
+                input_path, ranges[0], output_path, on_progress=on_progress, should_cancel=should_cancel
+            )
+        ):
+            console.print(f"[green]✓[/green] Video trimmed without re-encoding to {output_path}")
+            return output_path
 
-                # Use per-segment crop if available, otherwise use global crop
-                segment_crop = segment_crop_filters.get(i, crop_filter) if has_video else None
+        # Setup temp directory
+        # A fresh directory per cut keeps concurrent exports of same-named inputs apart
+        temp_dir = Path(tempfile.mkdtemp(
+            prefix=f"video_editor_{input_path.stem}_",
+            dir=self._segment_temp_root(input_path, ranges),
+        ))
+
+        jobs: list[SegmentJob] = []
+
+        try:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeRemainingColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Extracting segments", total=len(ranges))
 
-                self.cut_segment(
-                    input_path, seg_path, range_.start, range_.end, i,
-                    freeze_last_frame=has_video and not is_last,
-                    crop_filter=segment_crop
+                segment_suffix = ".mp4" if has_video else ".m4a"
+                for i, (range_, source_index) in enumerate(coalesced):
+                    # Don't freeze last frame on the final segment (no transition after it)
+                    is_last = (i == len(ranges) - 1)
+
+                    # Use per-segment crop if available, otherwise use global crop
+                    segment_crop = segment_crop_filters.get(source_index, crop_filter) if has_video else None
+
+                    jobs.append(SegmentJob(
+                        temp_dir / f"segment_{i:04d}{segment_suffix}",
+                        range_.start,
+                        range_.end,
+                        freeze_last_frame=has_video and not is_last,
+                        crop_filter=segment_crop,
+                    ))
+
+                mean_duration = sum(r.end - r.start for r in ranges) / len(ranges)
+                encoder_config = replace(
+                    self.encoder_config,
+                    short_segment_mode=(
+                        self.config.fast_short_segments
+                        and mean_duration < self.SHORT_SEGMENT_SECONDS
+                    ),
                 )
-                segment_paths.append(seg_path)
-                progress.update(task, advance=1)
 
-        # Concatenate all segments
-        console.print("[blue]Concatenating segments...[/blue]")
-
-        self.concatenate_segments(segment_paths, output_path)
-
-        # Clean up temp segments
-        if not self.config.keep_temp:
-            for seg_path in segment_paths:
-                if seg_path.exists():
-                    seg_path.unlink()
-            if temp_dir.exists():
-                try:
-                    temp_dir.rmdir()
-                except OSError:
-                    pass  # Directory not empty, leave it
+                extracted = 0.0
+                extracted_lock = threading.Lock()
+
+                def job_seconds(job: SegmentJob) -> float:
+                    return job.end - job.start + (self.SEGMENT_GAP if job.freeze_last_frame else 0.0)
+
+                def report_extracted(seconds: float) -> None:
+                    nonlocal extracted
+                    if on_progress is None or seconds <= 0:
+                        return
+                    with extracted_lock:
+                        extracted += seconds
+                        on_progress(extracted)
+
+                pending = jobs
+                if self.segment_cache is not None:
+                    pending = self._use_cached_segments(input_path, jobs, encoder_config)
+                    progress.update(task, advance=len(jobs) - len(pending))
+                    pending_ids = {id(job) for job in pending}
+                    report_extracted(sum(job_seconds(job) for job in jobs if id(job) not in pending_ids))
+
+                def run_batch(batch: list[SegmentJob]) -> None:
+                    if should_cancel and should_cancel():
+                        return
+                    durations = [job_seconds(job) for job in batch]
+                    batch_extracted = 0.0
+
+                    def report_batch(seconds: float) -> None:
+                        nonlocal batch_extracted
+                        # The batch's outputs advance together; each stops at its own length
+                        done = sum(min(seconds, duration) for duration in durations)
+                        report_extracted(done - batch_extracted)
+                        batch_extracted = max(batch_extracted, done)
+
+                    try:
+                        self.cut_segments(
+                            input_path,
+                            batch,
+                            encoder_config,
+                            on_progress=report_batch if on_progress else None,
+                            should_cancel=should_cancel,
+                        )
+                    except Exception:
+                        if self.segment_cache is not None:
+                            for job in batch:
+                                self.segment_cache.discard(job.output_path)
+                        raise
+                    if self.segment_cache is not None:
+                        for job in batch:
+                            job.output_path = self.segment_cache.commit(job.output_path)
+                    progress.update(task, advance=len(batch))
+                    report_extracted(sum(durations) - batch_extracted)
+
+                # Every segment may already be cached, leaving nothing to encode
+                if pending:
+                    # Each output holds a hardware encoder session while its batch runs
+                    sessions = self.encoder_sessions(encoder_config)
+                    workers = min(self.PARALLEL_BATCHES, len(pending), sessions or len(pending))
+                    per_process = min(self.SEGMENTS_PER_PROCESS, (sessions or self.SEGMENTS_PER_PROCESS) // workers)
+                    # Spread the jobs over the parallel processes before filling batches
+                    batch_size = min(per_process, -(-len(pending) // workers))
+                    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+                    # Segments are independent FFmpeg processes; list() re-raises a failed batch
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cut-batch") as pool:
+                        list(pool.map(run_batch, batches))
+
+            if should_cancel and should_cancel():
+                raise RuntimeError("Cutting cancelled")
+
+            # Concatenate all segments
+            console.print("[blue]Concatenating segments...[/blue]")
+
+            self.concatenate_segments([job.output_path for job in jobs], output_path, should_cancel=should_cancel)
+        finally:
+            # Runs on failure and cancel too, so no segments are stranded (in
+            # /dev/shm especially); cached segments outlive the cut
+            if not self.config.keep_temp:
+                owned = [] if self.segment_cache is not None else [job.output_path for job in jobs]
+                self._remove_segments(owned, temp_dir)
+
+        if self.segment_cache is not None:
+            self.segment_cache.prune()
 
         console.print(f"[green]✓[/green] {media_label.capitalize()} saved to {output_path}")
         return output_path
+
+    def encoder_sessions(self, encoder_config: EncoderConfig | None = None) -> int | None:
+        """Hardware encoder sessions a cut may hold at once, or None for libx264."""
+        limit = encoder_session_limit(encoder_config or self.encoder_config)
+        if limit is None or self.config.max_encoder_sessions is None:
+            return limit
+        return min(limit, self.config.max_encoder_sessions)
+
+    def _use_cached_segments(
+        self,
+        input_path: Path,
+        jobs: list[SegmentJob],
+        encoder_config: EncoderConfig,
+    ) -> list[SegmentJob]:
+        """
+        Point jobs at segments cached by earlier exports.
+
+        Jobs with a cached segment get its path; the others are redirected to
+        a partial cache path. Returns the jobs that still need encoding.
+        """
+        encoder_args = get_encoder_args(encoder_config)
+        pending: list[SegmentJob] = []
+        for job in jobs:
+            suffix = job.output_path.suffix
+            key = self.segment_cache.key(
+                input_path,
+                job.end - job.start,
+                job.start,
+                job.freeze_last_frame,
+                job.crop_filter,
+                self.SEGMENT_GAP,
+                encoder_args,
+                suffix,
+            )
+            cached = self.segment_cache.lookup(key, suffix)
+            if cached is not None:
+                job.output_path = cached
+            else:
+                job.output_path = self.segment_cache.partial_path(key, suffix)
+                pending.append(job)
+        return pending
+
+    @staticmethod
+    def _remove_segments(segment_paths: list[Path], temp_dir: Path) -> None:
+        """Delete extracted segment files and their temp directory if it is empty."""
+        for seg_path in segment_paths:
+            seg_path.unlink(missing_ok=True)
+        try:
+            temp_dir.rmdir()
+        except OSError:
+            pass  # Missing or not empty, leave it
+
+
+def adjust_tokens_for_cuts(
+    tokens: list[Token],
+    keep_ranges: list[TimeRange],
+    segment_gap: float = Cutter.SEGMENT_GAP,
+) -> list[Token]:
+    """
+    Map original token times onto the timeline cut_video() produces.
+
+    Tokens outside every kept range are dropped; token ends are clamped to
+    their range.
+    """
+    if not tokens or not keep_ranges:
+        return []
+
+    sorted_tokens = sorted(tokens, key=lambda token: token.start)
+    # Same segment layout as Cutter.cut_video (sorted + coalesced)
+    sorted_ranges = Cutter.coalesce_ranges(keep_ranges)
+
+    offsets: list[float] = []
+    cumulative = 0.0
+    for index, range_ in enumerate(sorted_ranges):
+        offsets.append(cumulative)
+        cumulative += range_.duration
+        if index < len(sorted_ranges) - 1:
+            cumulative += segment_gap
+
+    adjusted: list[Token] = []
+    range_index = 0
+
+    for token in sorted_tokens:
+        while range_index < len(sorted_ranges) and sorted_ranges[range_index].end <= token.start:
+            range_index += 1
+
+        if range_index >= len(sorted_ranges):
+            break
+
+        range_ = sorted_ranges[range_index]
+        if range_.start <= token.start < range_.end:
+            offset = offsets[range_index]
+            adjusted.append(Token(
+                text=token.text,
+                start=offset + (token.start - range_.start),
+                end=min(
+                    offset + (token.end - range_.start),
+                    offset + range_.duration,
+                ),
+            ))
+
+    return adjusted
@@ -11,35 +11,111 @@ class EncoderConfig:
     """Configuration for video encoding."""
     use_hardware: bool = True
     quality: int = 70  # VideoToolbox quality (0-100, ~70 matches CRF 18)
-    crf: int = 18  # libx264 fallback
+    crf: int = 18  # libx264 fallback; also the NVENC/QSV constant-quality level
     preset: str = "medium"
+    short_segment_mode: bool = False  # libx264: no lookahead stalls on many short cuts (Config.fast_short_segments)
 
 
-_videotoolbox_available: bool | None = None
+# Hardware H.264 encoders, in order of preference
+HARDWARE_ENCODERS = ("h264_videotoolbox", "h264_nvenc", "h264_qsv")
+
+# Encode sessions each hardware encoder is given at once. Consumer NVIDIA
+# drivers refuse sessions past a small per-system cap; the media engines
+# behind QSV and VideoToolbox stop scaling long before they run out.
+HARDWARE_ENCODER_SESSIONS = {
+    "h264_videotoolbox": 4,
+    "h264_nvenc": 3,
+    "h264_qsv": 4,
+}
+
+_listed_encoders: str | None = None
+_hardware_encoder: str | None = None
+_hardware_encoder_detected = False
 FFMPEG = ffmpeg_executable()
 
 
+def _encoder_listing() -> str:
+    """Return the output of ``ffmpeg -encoders``, cached after the first call."""
+    global _listed_encoders
+
+    if _listed_encoders is None:
+        try:
+            result = subprocess.run(
+                [FFMPEG, "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True
+            )
+            _listed_encoders = result.stdout
+        except Exception:
+            _listed_encoders = ""
+
+    return _listed_encoders
+
+
 def is_videotoolbox_available() -> bool:
     """Check if h264_videotoolbox encoder is available.
 
     Result is cached after first check.
     """
-    global _videotoolbox_available
+    return "h264_videotoolbox" in _encoder_listing()
+
 
-    if _videotoolbox_available is not None:
-        return _videotoolbox_available
+def _can_open_encoder(name: str) -> bool:
+    """Encode one tiny frame to check that the encoder's device is present.
 
+    NVENC and QSV are compiled into many FFmpeg builds that run on machines
+    without the matching GPU, so being listed is not enough.
+    """
     try:
         result = subprocess.run(
-            [FFMPEG, "-hide_banner", "-encoders"],
+            [
+                FFMPEG, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                "-frames:v", "1",
+                "-c:v", name,
+                "-f", "null", "-",
+            ],
             capture_output=True,
-            text=True
+            text=True,
+            timeout=15,
         )
-        _videotoolbox_available = "h264_videotoolbox" in result.stdout
-    except Exception:
-        _videotoolbox_available = False
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def detect_hardware_encoder() -> str | None:
+    """Return the preferred usable hardware H.264 encoder, or None.
+
+    Result is cached after first check.
+    """
+    global _hardware_encoder, _hardware_encoder_detected
 
-    return _videotoolbox_available
+    if _hardware_encoder_detected:
+        return _hardware_encoder
+
+    listing = _encoder_listing()
+    for name in HARDWARE_ENCODERS:
+        if name not in listing:
+            continue
+        # VideoToolbox falls back to software itself (-allow_sw)
+        if name == "h264_videotoolbox" or _can_open_encoder(name):
+            _hardware_encoder = name
+            break
+
+    _hardware_encoder_detected = True
+    return _hardware_encoder
+
+
+def encoder_session_limit(config: EncoderConfig | None = None) -> int | None:
+    """Return how many encode sessions may run at once, or None for libx264.
+
+    Every FFmpeg output encoded with a hardware encoder holds one session, so
+    callers running outputs side by side must stay within this limit.
+    """
+    config = config or EncoderConfig()
+    hardware_encoder = detect_hardware_encoder() if config.use_hardware else None
+    return HARDWARE_ENCODER_SESSIONS.get(hardware_encoder)
 
 
 def get_encoder_args(config: EncoderConfig | None = None) -> list[str]:
@@ -53,16 +129,48 @@ def get_encoder_args(config: EncoderConfig | None = None) -> list[str]:
     """
     config = config or EncoderConfig()
 
-    if config.use_hardware and is_videotoolbox_available():
+    hardware_encoder = detect_hardware_encoder() if config.use_hardware else None
+    if hardware_encoder == "h264_videotoolbox":
         return [
             "-c:v", "h264_videotoolbox",
             "-q:v", str(config.quality),
             "-profile:v", "high",
             "-allow_sw", "true",
         ]
-    else:
+    if hardware_encoder == "h264_nvenc":
+        return [
+            "-c:v", "h264_nvenc",
+            "-preset", "p4",
+            "-tune", "hq",
+            "-rc", "vbr",
+            "-cq", str(config.crf),
+            "-b:v", "0",
+            "-profile:v", "high",
+        ]
+    if hardware_encoder == "h264_qsv":
         return [
-            "-c:v", "libx264",
+            "-c:v", "h264_qsv",
             "-preset", config.preset,
-            "-crf", str(config.crf),
+            "-global_quality", str(config.crf),
+            "-profile:v", "high",
         ]
+
+    args = [
+        "-c:v", "libx264",
+        "-preset", config.preset,
+        "-crf", str(config.crf),
+    ]
+    if config.short_segment_mode:
+        # Short segments end before x264's lookahead fills, so every segment
+        # would pay a full flush stall; encode them with sliced threads instead.
+        # The trade-off: zerolatency disables B-frames and lookahead, and the short
+        # GOP adds keyframes. The segments are stream-copied into the final file,
+        # so this costs quality per bit across the whole export, which is why
+        # Config.fast_short_segments has to opt in to it.
+        args.extend([
+            "-tune", "zerolatency",
+            "-x264-params", "sliced-threads=1:threads=auto:lookahead-threads=2:sync-lookahead=0",
+            "-g", "30",
+            "-keyint_min", "15",
+        ])
+    return args
@@ -0,0 +1,105 @@
+"""Content-addressed cache of encoded export segments."""
+
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+
+# Per-user cache location for reusable segments
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "video_editor" / "segments"
+# Oldest segments are evicted once the cache grows past this size
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+# Segments used this recently may belong to a cut that is still running
+PRUNE_GRACE_SECONDS = 15 * 60
+# Partial segments this old were left behind by a process that died mid-encode
+STALE_PARTIAL_SECONDS = 24 * 60 * 60
+
+_PARTIAL_MARKER = ".partial"
+
+
+class SegmentCache:
+    """
+    Stores encoded segments under a hash of everything that shaped them.
+
+    A segment is identified by its source file (path, size and mtime), its
+    range, its filter chain and the encoder arguments, so re-exporting an
+    unchanged range reuses the earlier encode. Segments are written under a
+    partial name unique to the encode and only committed once FFmpeg
+    succeeded, so concurrent exports of the same range never share a file.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def key(self, input_path: Path, *parts: object) -> str:
+        """Hash the source file identity together with the segment parameters."""
+        input_path = Path(input_path).resolve()
+        stat = input_path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (str(input_path), stat.st_size, stat.st_mtime_ns, *parts):
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def lookup(self, key: str, suffix: str) -> Path | None:
+        """Return the cached segment for key, marking it recently used."""
+        path = self.cache_dir / f"{key}{suffix}"
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def partial_path(self, key: str, suffix: str) -> Path:
+        """Where a segment for key is encoded before commit() (or discard())."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self.cache_dir / f"{key}{_PARTIAL_MARKER}-{uuid.uuid4().hex}{suffix}"
+
+    def commit(self, partial_path: Path) -> Path:
+        """Publish a fully encoded segment and return its cached path."""
+        partial_path = Path(partial_path)
+        key = partial_path.name.partition(_PARTIAL_MARKER)[0]
+        final_path = partial_path.with_name(f"{key}{partial_path.suffix}")
+        os.replace(partial_path, final_path)
+        return final_path
+
+    @staticmethod
+    def discard(partial_path: Path) -> None:
+        """Remove a segment whose encode failed or was abandoned."""
+        Path(partial_path).unlink(missing_ok=True)
+
+    def prune(self) -> None:
+        """
+        Evict least recently used segments until the cache fits max_bytes.
+
+        Segments used within PRUNE_GRACE_SECONDS and partial segments still
+        being encoded are left alone, since a concurrent cut may need them;
+        partials older than STALE_PARTIAL_SECONDS are removed.
+        """
+        if not self.cache_dir.is_dir():
+            return
+        now = time.time()
+        entries = []
+        total = 0
+        for path in self.cache_dir.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if _PARTIAL_MARKER in path.name:
+                if now - stat.st_mtime > STALE_PARTIAL_SECONDS:
+                    path.unlink(missing_ok=True)
+                continue
+            total += stat.st_size
+            if now - stat.st_mtime >= PRUNE_GRACE_SECONDS:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
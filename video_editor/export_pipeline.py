@@ -2,71 +2,33 @@
 
 from __future__ import annotations
 
+import copy
+import os
 import shutil
 import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .analyzer import TimeRange
 from .captioner import Captioner
 from .config import Config
-from .cutter import Cutter
+from .cutter import Cutter, adjust_tokens_for_cuts
 from .project_io import (
     ProjectData,
     get_final_keep_ranges,
     get_final_tokens,
     infer_recording_crop_config,
+    load_project,
 )
-from .transcriber import Token
-
-
-def adjust_tokens_for_cuts(
-    tokens: list[Token],
-    keep_ranges: list[TimeRange],
-    segment_gap: float = Cutter.SEGMENT_GAP,
-) -> list[Token]:
-    """Adjust original token times onto the cut-video timeline."""
-    if not tokens or not keep_ranges:
-        return []
-
-    sorted_tokens = sorted(tokens, key=lambda token: token.start)
-    sorted_ranges = sorted(keep_ranges, key=lambda range_: range_.start)
-
-    offsets: list[float] = []
-    cumulative = 0.0
-    for index, range_ in enumerate(sorted_ranges):
-        offsets.append(cumulative)
-        cumulative += range_.duration
-        if index < len(sorted_ranges) - 1:
-            cumulative += segment_gap
-
-    adjusted: list[Token] = []
-    range_index = 0
-
-    for token in sorted_tokens:
-        while range_index < len(sorted_ranges) and sorted_ranges[range_index].end <= token.start:
-            range_index += 1
-
-        if range_index >= len(sorted_ranges):
-            break
-
-        range_ = sorted_ranges[range_index]
-        if range_.start <= token.start < range_.end:
-            offset = offsets[range_index]
-            adjusted.append(Token(
-                text=token.text,
-                start=offset + (token.start - range_.start),
-                end=min(
-                    offset + (token.end - range_.start),
-                    offset + range_.duration,
-                ),
-            ))
-
-    return adjusted
 
+# Most exports run side by side on a hardware encoder; x264 already uses every core
+HARDWARE_BATCH_EXPORTS = 2
 
-def crop_filter_from_project(project: ProjectData, cutter: Cutter) -> str | None:
-    """Build the global crop filter stored by the GUI, if present."""
+
+def crop_rect_from_project(project: ProjectData, cutter: Cutter) -> tuple[int, int, int, int] | None:
+    """Pixel rectangle (x, y, width, height) of the project's global crop, if present."""
     crop = project.raw.get("crop_config")
     if not crop and not project.raw.get("recording_crop_cleared"):
         crop = infer_recording_crop_config(project.video_path)
@@ -92,7 +54,20 @@ def crop_filter_from_project(project: ProjectData, cutter: Cutter) -> str | None
 
     crop_x = max(0, min(crop_x, video_width - crop_width))
     crop_y = max(0, min(crop_y, video_height - crop_height))
-    return f"crop={crop_width}:{crop_height}:{crop_x}:{crop_y}"
+    return crop_x, crop_y, crop_width, crop_height
+
+
+def _crop_filter_for_rect(rect: tuple[int, int, int, int] | None) -> str | None:
+    """FFmpeg crop filter for a crop_rect_from_project() rectangle."""
+    if rect is None:
+        return None
+    x, y, width, height = rect
+    return f"crop={width}:{height}:{x}:{y}"
+
+
+def crop_filter_from_project(project: ProjectData, cutter: Cutter) -> str | None:
+    """Build the global crop filter stored by the GUI, if present."""
+    return _crop_filter_for_rect(crop_rect_from_project(project, cutter))
 
 
 _crop_filter_from_project = crop_filter_from_project
@@ -121,8 +96,14 @@ def export_project(
     *,
     config: Config | None = None,
     no_captions: bool = False,
+    should_cancel: Callable[[], bool] | None = None,
 ) -> Path:
-    """Export a project by cutting from its original source video."""
+    """
+    Export a project by cutting from its original source video.
+
+    should_cancel is polled while cutting and burning captions; when it
+    returns True the running FFmpeg work stops and a RuntimeError is raised.
+    """
     output_path = Path(output_path).expanduser().resolve()
     source_path = project.video_path.expanduser().resolve()
     if output_path == source_path:
@@ -142,31 +123,178 @@ def export_project(
         start_buffer=config.segment_start_buffer,
         end_buffer=config.segment_end_buffer,
     )
-    crop_filter = crop_filter_from_project(project, cutter) if source_has_video else None
-
-    if not source_has_video or no_captions or not project.caption_settings.get("enabled", True):
-        return cutter.cut_video(source_path, keep_ranges, output_path, crop_filter=crop_filter)
-
-    captioner = Captioner(config)
-    with tempfile.NamedTemporaryFile(prefix="video_editor_codex_", suffix=".mp4", delete=False) as temp_file:
+    crop_rect = crop_rect_from_project(project, cutter) if source_has_video else None
+    crop_filter = _crop_filter_for_rect(crop_rect)
+
+    # Cut next to the output so the final rename never copies across filesystems;
+    # the output is only replaced once the export succeeded
+    with tempfile.NamedTemporaryFile(
+        prefix=".video_editor_codex_", suffix=output_path.suffix or ".mp4", dir=output_path.parent, delete=False
+    ) as temp_file:
         temp_cut = Path(temp_file.name)
     temp_cut.unlink(missing_ok=True)
 
-    try:
-        cutter.cut_video(source_path, keep_ranges, temp_cut, crop_filter=crop_filter)
+    adjusted_tokens = []
+    if source_has_video and not no_captions and project.caption_settings.get("enabled", True):
         tokens = get_final_tokens(project)
         adjusted_tokens = adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP)
-        if adjusted_tokens:
-            captioner.burn_streaming_captions(
-                temp_cut,
+
+    if not adjusted_tokens:
+        # Nothing to overlay, so the cut itself is the export
+        try:
+            cutter.cut_video(source_path, keep_ranges, temp_cut, crop_filter=crop_filter, should_cancel=should_cancel)
+            os.replace(temp_cut, output_path)
+        finally:
+            temp_cut.unlink(missing_ok=True)
+        return output_path
+
+    captioner = Captioner(config)
+
+    # Cut and caption in one FFmpeg pass when the cut fits a single filtergraph
+    cut_graph = cutter.build_cut_graph(
+        source_path, keep_ranges, crop_filter, crop_rect[2:] if crop_rect else None
+    )
+    if cut_graph is not None:
+        try:
+            captioner.burn_captions_over_cut(
+                cut_graph,
                 adjusted_tokens,
-                output_path,
+                temp_cut,
                 max_words=config.max_caption_words,
                 caption_settings=project.caption_settings,
+                should_cancel=should_cancel,
             )
-        else:
-            shutil.move(str(temp_cut), str(output_path))
+            os.replace(temp_cut, output_path)
+        finally:
+            temp_cut.unlink(missing_ok=True)
+        return output_path
+
+    # Captions are burned into a second temp file, so a failed burn keeps the old output
+    with tempfile.NamedTemporaryFile(
+        prefix=".video_editor_codex_", suffix=output_path.suffix or ".mp4", dir=output_path.parent, delete=False
+    ) as temp_file:
+        temp_output = Path(temp_file.name)
+    temp_output.unlink(missing_ok=True)
+
+    try:
+        cutter.cut_video(source_path, keep_ranges, temp_cut, crop_filter=crop_filter, should_cancel=should_cancel)
+        captioner.burn_streaming_captions(
+            temp_cut,
+            adjusted_tokens,
+            temp_output,
+            max_words=config.max_caption_words,
+            caption_settings=project.caption_settings,
+            should_cancel=should_cancel,
+        )
+        os.replace(temp_output, output_path)
     finally:
         temp_cut.unlink(missing_ok=True)
+        temp_output.unlink(missing_ok=True)
 
     return output_path
+
+
+def batch_export_concurrency(config: Config) -> int:
+    """
+    How many project exports export_projects() runs at once.
+
+    Exports only overlap on a hardware encoder, and never more than its
+    session limit allows: each running export keeps at least one session.
+    """
+    sessions = Cutter(config).encoder_sessions()
+    if sessions is None:
+        return 1
+    return max(1, min(HARDWARE_BATCH_EXPORTS, sessions))
+
+
+def batch_output_paths(project_paths: list[Path], output_dir: Path) -> list[Path]:
+    """
+    Output paths export_projects() uses, one per project.
+
+    Each is `<project>_edited.mp4`; projects sharing a name get a numbered
+    suffix so no export overwrites another. Audio-only projects are written
+    with an `.m4a` suffix instead (see export_projects).
+    """
+    output_dir = Path(output_dir)
+    taken: set[str] = set()
+    outputs: list[Path] = []
+    for project_path in project_paths:
+        base = f"{Path(project_path).stem}_edited"
+        name = base
+        number = 2
+        while name.casefold() in taken:
+            name = f"{base}_{number}"
+            number += 1
+        taken.add(name.casefold())
+        outputs.append(output_dir / f"{name}.mp4")
+    return outputs
+
+
+def export_projects(
+    project_paths: list[Path],
+    output_dir: Path,
+    *,
+    config: Config | None = None,
+    no_captions: bool = False,
+    should_cancel: Callable[[], bool] | None = None,
+) -> list[Path]:
+    """
+    Export several projects into output_dir (see batch_output_paths).
+
+    Each project is loaded only when its export starts. Exports overlap when a
+    hardware encoder does the encoding (see batch_export_concurrency); each
+    gets its own copy of config, which export_project() adjusts per project,
+    its own temp directory under config.temp_dir and an equal share of the
+    encoder's sessions (Config.max_encoder_sessions).
+
+    Args:
+        project_paths: `.vedproj` files to export
+        output_dir: Directory for the exported videos
+        config: Shared settings for every export
+        no_captions: Skip burned captions
+        should_cancel: Polled before each export starts and by the running
+            exports; when it returns True they stop and a RuntimeError is raised
+
+    Returns:
+        Exported paths, in the order of project_paths
+    """
+    config = config or Config(temp_dir=Path(tempfile.gettempdir()) / "video_editor")
+    output_dir = Path(output_dir).expanduser().resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    temp_root = config.temp_dir or Path(tempfile.gettempdir())
+    temp_root.mkdir(parents=True, exist_ok=True)
+
+    # The encoder's sessions are shared out between the exports running at once
+    concurrency = batch_export_concurrency(config)
+    sessions = Cutter(config).encoder_sessions()
+    sessions_per_export = sessions // concurrency if sessions is not None else None
+
+    # A failed export stops the exports that have not started yet
+    failed = threading.Event()
+
+    def export_one(project_path: Path, output_path: Path) -> Path:
+        if failed.is_set() or (should_cancel and should_cancel()):
+            raise RuntimeError("Export cancelled")
+        job_config = copy.deepcopy(config)
+        job_config.temp_dir = Path(tempfile.mkdtemp(prefix="batch_export_", dir=temp_root))
+        job_config.max_encoder_sessions = sessions_per_export
+        try:
+            project = load_project(project_path)
+            if not Cutter(job_config).input_has_video(project.video_path):
+                output_path = output_path.with_suffix(".m4a")
+            return export_project(
+                project,
+                output_path,
+                config=job_config,
+                no_captions=no_captions,
+                should_cancel=should_cancel,
+            )
+        except Exception:
+            failed.set()
+            raise
+        finally:
+            if not config.keep_temp:
+                shutil.rmtree(job_config.temp_dir, ignore_errors=True)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch-export") as pool:
+        return list(pool.map(export_one, project_paths, batch_output_paths(project_paths, output_dir)))
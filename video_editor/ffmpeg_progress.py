@@ -0,0 +1,82 @@
+"""Run FFmpeg while following its -progress output."""
+
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+# Seconds FFmpeg gets to exit after being terminated before it is killed
+TERMINATE_TIMEOUT = 2.0
+
+# Both keys carry microseconds; out_time_ms is the older, misnamed spelling
+_OUT_TIME_KEYS = ("out_time_us", "out_time_ms")
+
+
+def run_ffmpeg(
+    cmd: list[str],
+    on_progress: Callable[[float], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+    cwd: Path | None = None,
+) -> subprocess.CompletedProcess:
+    """
+    Run an FFmpeg command, reporting its output time as it encodes.
+
+    FFmpeg writes a key=value progress block to stdout about twice a second.
+    Each output position is passed to on_progress in seconds, and
+    should_cancel is polled at the same rate; when it returns True, FFmpeg is
+    terminated (and killed if it does not exit within TERMINATE_TIMEOUT).
+
+    Args:
+        cmd: FFmpeg command, executable first
+        on_progress: Called with the encoded output time in seconds
+        should_cancel: Polled while FFmpeg runs
+        cwd: Working directory for FFmpeg
+
+    Returns:
+        The finished process, with stderr captured as text
+
+    Raises:
+        RuntimeError: If should_cancel stopped FFmpeg
+    """
+    cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+    cancelled = False
+
+    # stderr goes to a file so a chatty FFmpeg cannot block on a full pipe
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        )
+        last_out_time = None
+        try:
+            for line in process.stdout:
+                if should_cancel and should_cancel():
+                    cancelled = True
+                    break
+                key, _, value = line.strip().partition("=")
+                # Reported as N/A until the first frame is written
+                if on_progress and key in _OUT_TIME_KEYS and value.isdigit() and value != last_out_time:
+                    last_out_time = value
+                    on_progress(int(value) / 1_000_000)
+            if not cancelled:
+                process.wait()
+        finally:
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            process.stdout.close()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    if cancelled:
+        raise RuntimeError("FFmpeg cancelled")
+
+    return subprocess.CompletedProcess(cmd, process.returncode, "", stderr)
@@ -1,6 +1,8 @@
 """Caption settings panel widget."""
 
-from PySide6.QtCore import Signal
+from contextlib import contextmanager
+
+from PySide6.QtCore import QSignalBlocker, QStringListModel, Signal, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QComboBox,
     QSlider, QCheckBox, QPushButton
@@ -11,21 +13,200 @@ from PySide6.QtCore import Qt
 from .models import CaptionSettings
 
 
+@contextmanager
+def _signals_blocked(*objects):
+    """Block signals on the given objects, restoring their previous state on exit."""
+    # QSignalBlocker records and restores each object's prior blocked state in C++
+    blockers = [QSignalBlocker(obj) for obj in objects]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+# Common fonts listed first in the font dropdown
+_PREFERRED_FONTS = ["Arial", "Helvetica", "Verdana", "Roboto", "Open Sans", "SF Pro", "Segoe UI"]
+# Font dropdown entries, enumerated once per process by _get_font_items()
+_FONT_ITEMS: list[str] | None = None
+
+
+def _get_font_items() -> list[str]:
+    """Return the installed font families, preferred fonts first, then alphabetical."""
+    global _FONT_ITEMS
+    if _FONT_ITEMS is None:
+        fonts = set(QFontDatabase.families())
+        head = [font for font in _PREFERRED_FONTS if font in fonts]
+        _FONT_ITEMS = head + sorted(fonts.difference(head))
+    return _FONT_ITEMS
+
+
+# Combo labels mapped to CaptionSettings values (and back)
+_WEIGHT_TO_SETTING = {
+    "Regular": "regular",
+    "Medium": "medium",
+    "Semi-Bold": "semi-bold",
+    "Bold": "bold",
+    "Extra-Bold": "extra-bold",
+}
+_SETTING_TO_WEIGHT = {value: label for label, value in _WEIGHT_TO_SETTING.items()}
+_COLOR_TO_SETTING = {"White": "white", "Black": "black"}
+_SETTING_TO_COLOR = {value: label for label, value in _COLOR_TO_SETTING.items()}
+_WEIGHT_ITEMS = list(_WEIGHT_TO_SETTING)
+_COLOR_ITEMS = list(_COLOR_TO_SETTING)
+# Settings values by combo row, so the change handler reads an index instead of text
+_WEIGHT_VALUES = tuple(_WEIGHT_TO_SETTING.values())
+_COLOR_VALUES = tuple(_COLOR_TO_SETTING.values())
+# Read-only combo models shared by every panel, created on first use
+_SHARED_MODELS: dict[str, QStringListModel] = {}
+
+
+def _shared_model(name: str, items: list[str]) -> QStringListModel:
+    """Return the process-wide list model for a combo, building it once."""
+    model = _SHARED_MODELS.get(name)
+    if model is None:
+        model = _SHARED_MODELS[name] = QStringListModel(items)
+    return model
+
+
+class _LazyFontCombo(QComboBox):
+    """Font dropdown that only enumerates installed fonts when first opened.
+
+    Until then it holds a one-item model with the current family, so panel
+    construction does not wait for the OS font scan.
+    """
+
+    DEFAULT_FONT = "Arial"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fonts_loaded = False
+        self._placeholder = QStringListModel([self.DEFAULT_FONT], self)
+        self.setModel(self._placeholder)
+
+    def set_current_font(self, family: str) -> None:
+        """Select a font family (kept as the placeholder until fonts are loaded)."""
+        if not self._fonts_loaded:
+            self._placeholder.setStringList([family])
+            self.setCurrentIndex(0)
+            return
+        index = self.findText(family)
+        if index >= 0:
+            self.setCurrentIndex(index)
+
+    def ensure_fonts_loaded(self) -> None:
+        """Swap in the shared installed-fonts model, keeping the current selection."""
+        if self._fonts_loaded:
+            return
+        self._fonts_loaded = True
+        current = self.currentText()
+        with _signals_blocked(self):
+            self.setModel(_shared_model("fonts", _get_font_items()))
+            index = self.findText(current)
+            self.setCurrentIndex(index)
+        if index < 0:
+            # Family is not installed: fall back (and report the change) like a user pick
+            self.setCurrentIndex(max(0, self.findText(self.DEFAULT_FONT)))
+
+    def showPopup(self) -> None:
+        self.ensure_fonts_loaded()
+        super().showPopup()
+
+
+# Dark theme shared by every CaptionSettingsPanel instance
+_CAPTION_PANEL_STYLESHEET = """
+    QLabel {
+        color: #fff;
+    }
+    QSpinBox, QComboBox {
+        background-color: #3d3d3d;
+        color: #fff;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QSlider::groove:horizontal {
+        background: #3d3d3d;
+        height: 6px;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #2196f3;
+        width: 14px;
+        margin: -4px 0;
+        border-radius: 7px;
+    }
+    QCheckBox {
+        color: #fff;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #555;
+        background: #3d3d3d;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #2196f3;
+        background: #2196f3;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: #fff;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton:checked {
+        background-color: #2196f3;
+        border-color: #2196f3;
+    }
+    QPushButton:pressed {
+        background-color: #1976d2;
+    }
+"""
+
+
 class CaptionSettingsPanel(QWidget):
     """Widget for configuring caption appearance."""
 
-    settings_changed = Signal(object)  # CaptionSettings
+    # CaptionSettings; emitted at most once per SETTINGS_EMIT_INTERVAL_MS. Consumers that
+    # re-render should connect with Qt.QueuedConnection so the work runs from the event loop.
+    settings_changed = Signal(object)
     move_caption_requested = Signal(bool)  # True to enable move mode, False to disable
     regenerate_requested = Signal()  # Emitted when user wants to refresh captions from edited text
 
+    # Coalesce bursts of widget changes (e.g. slider drags) into at most one
+    # settings_changed emission per interval (~60 Hz)
+    SETTINGS_EMIT_INTERVAL_MS = 16
+
+    # Width of the label column shared by the settings rows
+    LABEL_WIDTH = 80
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._settings = CaptionSettings()
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.SETTINGS_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_settings)
+        # Last text shown in the position label
+        self._last_pos_text = ""
+        # Set while the spinbox and slider mirror each other's value
+        self._syncing_size = False
+        # Field values of the settings the consumers last saw (see _snapshot)
+        self._last_emitted = self._snapshot()
         self._setup_ui()
         self._connect_signals()
 
     def _setup_ui(self):
         """Set up the UI layout."""
+        # Suppress repaints while the rows are added; re-enabled once below
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(12)
@@ -40,208 +221,96 @@ class CaptionSettingsPanel(QWidget):
         layout.addLayout(preview_layout)
 
         # Font size
-        size_layout = QHBoxLayout()
-        size_label = QLabel("Font size:")
-        size_label.setFixedWidth(80)
-        size_layout.addWidget(size_label)
-
         self._size_spin = QSpinBox()
         self._size_spin.setRange(12, 72)
         self._size_spin.setValue(24)
         self._size_spin.setSuffix(" pt")
-        size_layout.addWidget(self._size_spin)
 
         self._size_slider = QSlider(Qt.Orientation.Horizontal)
         self._size_slider.setRange(12, 72)
         self._size_slider.setValue(24)
-        size_layout.addWidget(self._size_slider, stretch=1)
-
-        layout.addLayout(size_layout)
 
         # Font family
-        font_layout = QHBoxLayout()
-        font_label = QLabel("Font:")
-        font_label.setFixedWidth(80)
-        font_layout.addWidget(font_label)
-
-        self._font_combo = QComboBox()
-        # Get available fonts
-        fonts = QFontDatabase.families()
-        # Prioritize common fonts
-        preferred = ["Arial", "Helvetica", "Verdana", "Roboto", "Open Sans", "SF Pro", "Segoe UI"]
-        sorted_fonts = []
-        for pref in preferred:
-            if pref in fonts:
-                sorted_fonts.append(pref)
-        for font in sorted(fonts):
-            if font not in sorted_fonts:
-                sorted_fonts.append(font)
-        self._font_combo.addItems(sorted_fonts)
-        # Set Arial as default if available
-        arial_idx = self._font_combo.findText("Arial")
-        if arial_idx >= 0:
-            self._font_combo.setCurrentIndex(arial_idx)
-        font_layout.addWidget(self._font_combo, stretch=1)
-
-        layout.addLayout(font_layout)
+        self._font_combo = _LazyFontCombo()
 
         # Font weight
-        weight_layout = QHBoxLayout()
-        weight_label = QLabel("Weight:")
-        weight_label.setFixedWidth(80)
-        weight_layout.addWidget(weight_label)
-
         self._weight_combo = QComboBox()
-        self._weight_combo.addItems(["Regular", "Medium", "Semi-Bold", "Bold", "Extra-Bold"])
+        self._weight_combo.setModel(_shared_model("weights", _WEIGHT_ITEMS))
         self._weight_combo.setCurrentText("Bold")
-        weight_layout.addWidget(self._weight_combo, stretch=1)
-
-        layout.addLayout(weight_layout)
 
         # Text color
-        color_layout = QHBoxLayout()
-        color_label = QLabel("Text color:")
-        color_label.setFixedWidth(80)
-        color_layout.addWidget(color_label)
-
         self._color_combo = QComboBox()
-        self._color_combo.addItems(["White", "Black"])
-        color_layout.addWidget(self._color_combo, stretch=1)
-
-        layout.addLayout(color_layout)
+        self._color_combo.setModel(_shared_model("colors", _COLOR_ITEMS))
 
         # Background toggle
-        bg_layout = QHBoxLayout()
-        bg_label = QLabel("")
-        bg_label.setFixedWidth(80)
-        bg_layout.addWidget(bg_label)
-
         self._bg_check = QCheckBox("Show background")
         self._bg_check.setChecked(True)
         self._bg_check.setToolTip("Show semi-transparent background behind caption text")
-        bg_layout.addWidget(self._bg_check)
-        bg_layout.addStretch()
-
-        layout.addLayout(bg_layout)
 
         # Position section with move button
-        pos_layout = QHBoxLayout()
-        pos_label = QLabel("Position:")
-        pos_label.setFixedWidth(80)
-        pos_layout.addWidget(pos_label)
-
         self._move_btn = QPushButton("Drag to Move")
         self._move_btn.setCheckable(True)
         self._move_btn.setToolTip("Click and drag the caption on the video to reposition it")
-        pos_layout.addWidget(self._move_btn, stretch=1)
-
-        layout.addLayout(pos_layout)
 
         # Position display (read-only, shows normalized position)
-        pos_display_layout = QHBoxLayout()
-        pos_display_label = QLabel("")  # Empty label for alignment
-        pos_display_label.setFixedWidth(80)
-        pos_display_layout.addWidget(pos_display_label)
-
         self._pos_display = QLabel("Center: 50%, Bottom: 92%")
         self._pos_display.setStyleSheet("color: #888; font-size: 11px;")
-        pos_display_layout.addWidget(self._pos_display, stretch=1)
-
-        layout.addLayout(pos_display_layout)
 
         # Reset position button
-        reset_layout = QHBoxLayout()
-        reset_label = QLabel("")
-        reset_label.setFixedWidth(80)
-        reset_layout.addWidget(reset_label)
-
         self._reset_pos_btn = QPushButton("Reset Position")
         self._reset_pos_btn.setToolTip("Reset caption to default centered bottom position")
-        reset_layout.addWidget(self._reset_pos_btn, stretch=1)
-
-        layout.addLayout(reset_layout)
 
         # Regenerate captions button
-        regen_layout = QHBoxLayout()
-        regen_label = QLabel("")
-        regen_label.setFixedWidth(80)
-        regen_layout.addWidget(regen_label)
-
         self._regen_btn = QPushButton("Refresh Captions")
         self._regen_btn.setToolTip("Regenerate caption preview from edited transcript text")
-        regen_layout.addWidget(self._regen_btn, stretch=1)
 
-        layout.addLayout(regen_layout)
+        # (label, widgets); the last widget takes the remaining width, except
+        # checkboxes, which keep their natural size
+        rows = [
+            ("Font size:", (self._size_spin, self._size_slider)),
+            ("Font:", (self._font_combo,)),
+            ("Weight:", (self._weight_combo,)),
+            ("Text color:", (self._color_combo,)),
+            ("", (self._bg_check,)),
+            ("Position:", (self._move_btn,)),
+            ("", (self._pos_display,)),
+            ("", (self._reset_pos_btn,)),
+            ("", (self._regen_btn,)),
+        ]
+        for label_text, widgets in rows:
+            layout.addLayout(self._build_row(label_text, widgets))
 
         # Apply dark theme styling
-        self.setStyleSheet("""
-            QLabel {
-                color: #fff;
-            }
-            QSpinBox, QComboBox {
-                background-color: #3d3d3d;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QSlider::groove:horizontal {
-                background: #3d3d3d;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #2196f3;
-                width: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }
-            QCheckBox {
-                color: #fff;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #555;
-                background: #3d3d3d;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #2196f3;
-                background: #2196f3;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:checked {
-                background-color: #2196f3;
-                border-color: #2196f3;
-            }
-            QPushButton:pressed {
-                background-color: #1976d2;
-            }
-        """)
+        self.setStyleSheet(_CAPTION_PANEL_STYLESHEET)
+        self.setUpdatesEnabled(True)
+
+    def _build_row(self, label_text: str, widgets: tuple[QWidget, ...]) -> QHBoxLayout:
+        """Build one settings row: a fixed-width label column followed by the widgets."""
+        row = QHBoxLayout()
+        label = QLabel(label_text)
+        label.setFixedWidth(self.LABEL_WIDTH)
+        row.addWidget(label)
+        *leading, last = widgets
+        for widget in leading:
+            row.addWidget(widget)
+        if isinstance(last, QCheckBox):
+            row.addWidget(last)
+            row.addStretch()
+        else:
+            row.addWidget(last, stretch=1)
+        return row
 
     def _connect_signals(self):
         """Connect internal signals."""
-        # Sync spinbox and slider
-        self._size_spin.valueChanged.connect(self._size_slider.setValue)
-        self._size_slider.valueChanged.connect(self._size_spin.setValue)
+        # Sync spinbox and slider (each also records the size change)
+        self._size_spin.valueChanged.connect(self._on_size_spin_changed)
+        self._size_slider.valueChanged.connect(self._on_size_slider_changed)
 
         # Emit settings changed
         self._preview_check.toggled.connect(self._on_setting_changed)
-        self._size_spin.valueChanged.connect(self._on_setting_changed)
-        self._font_combo.currentTextChanged.connect(self._on_setting_changed)
-        self._weight_combo.currentTextChanged.connect(self._on_setting_changed)
-        self._color_combo.currentTextChanged.connect(self._on_setting_changed)
+        self._font_combo.currentIndexChanged.connect(self._on_setting_changed)
+        self._weight_combo.currentIndexChanged.connect(self._on_setting_changed)
+        self._color_combo.currentIndexChanged.connect(self._on_setting_changed)
         self._bg_check.toggled.connect(self._on_setting_changed)
 
         # Move button
@@ -251,16 +320,59 @@ class CaptionSettingsPanel(QWidget):
         self._reset_pos_btn.clicked.connect(self._on_reset_position)
 
         # Regenerate captions
-        self._regen_btn.clicked.connect(self.regenerate_requested.emit)
+        self._regen_btn.clicked.connect(self.regenerate_requested)
+
+    def _on_size_spin_changed(self, value: int):
+        """Mirror the spinbox into the slider and record the change."""
+        if self._syncing_size:
+            return
+        self._syncing_size = True
+        try:
+            self._size_slider.setValue(value)
+        finally:
+            self._syncing_size = False
+        self._on_setting_changed()
+
+    def _on_size_slider_changed(self, value: int):
+        """Mirror the slider into the spinbox and record the change."""
+        if self._syncing_size:
+            return
+        self._syncing_size = True
+        try:
+            self._size_spin.setValue(value)
+        finally:
+            self._syncing_size = False
+        self._on_setting_changed()
 
     def _on_setting_changed(self):
-        """Handle any setting change."""
+        """Read the widgets into the settings and schedule one coalesced emission."""
         self._settings.font_size = self._size_spin.value()
         self._settings.font_family = self._font_combo.currentText()
-        self._settings.font_weight = self._weight_combo.currentText().lower()
+        self._settings.font_weight = _WEIGHT_VALUES[self._weight_combo.currentIndex()]
         self._settings.enabled = self._preview_check.isChecked()
-        self._settings.text_color = self._color_combo.currentText().lower()
+        self._settings.text_color = _COLOR_VALUES[self._color_combo.currentIndex()]
         self._settings.show_background = self._bg_check.isChecked()
+        self._schedule_emit()
+
+    def _schedule_emit(self):
+        """Queue one settings_changed emission."""
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _snapshot(self) -> tuple:
+        """Return the current settings' field values for change detection."""
+        s = self._settings
+        return (
+            s.font_size, s.font_family, s.font_weight, s.enabled, s.text_color,
+            s.show_background, s.pos_x, s.pos_y, s.box_width, s.box_height,
+        )
+
+    def _flush_settings(self):
+        """Emit the settings accumulated since the last emission, unless nothing changed."""
+        snapshot = self._snapshot()
+        if snapshot == self._last_emitted:
+            return
+        self._last_emitted = snapshot
         self.settings_changed.emit(self._settings)
 
     def _on_move_toggled(self, checked: bool):
@@ -274,7 +386,7 @@ class CaptionSettingsPanel(QWidget):
         self._settings.box_width = 0.6
         self._settings.box_height = 0.07
         self._update_position_display()
-        self.settings_changed.emit(self._settings)
+        self._schedule_emit()
 
     def _update_position_display(self):
         """Update the position display label."""
@@ -282,7 +394,12 @@ class CaptionSettingsPanel(QWidget):
         y_pct = int(self._settings.pos_y * 100)
         w_pct = int(self._settings.box_width * 100)
         h_pct = int(self._settings.box_height * 100)
-        self._pos_display.setText(f"Pos: {x_pct}%, {y_pct}% | Size: {w_pct}% x {h_pct}%")
+        text = f"Pos: {x_pct}%, {y_pct}% | Size: {w_pct}% x {h_pct}%"
+        # Fine drags often round to the same percentages; skip the relayout then
+        if text == self._last_pos_text:
+            return
+        self._last_pos_text = text
+        self._pos_display.setText(text)
 
     def get_settings(self) -> CaptionSettings:
         """Get the current caption settings."""
@@ -290,59 +407,49 @@ class CaptionSettingsPanel(QWidget):
 
     def set_settings(self, settings: CaptionSettings):
         """Set the caption settings."""
+        self._emit_timer.stop()
         self._settings = settings
 
         # Block signals to prevent multiple emissions
-        self._size_spin.blockSignals(True)
-        self._size_slider.blockSignals(True)
-        self._font_combo.blockSignals(True)
-        self._weight_combo.blockSignals(True)
-        self._preview_check.blockSignals(True)
-        self._color_combo.blockSignals(True)
-        self._bg_check.blockSignals(True)
-
-        self._size_spin.setValue(settings.font_size)
-        self._size_slider.setValue(settings.font_size)
-
-        font_idx = self._font_combo.findText(settings.font_family)
-        if font_idx >= 0:
-            self._font_combo.setCurrentIndex(font_idx)
-
-        # Set font weight (convert from lowercase with hyphens to title case)
-        weight_text = settings.font_weight.replace("-", "-").title().replace("-", "-")
-        weight_idx = self._weight_combo.findText(weight_text)
-        if weight_idx >= 0:
-            self._weight_combo.setCurrentIndex(weight_idx)
-
-        self._preview_check.setChecked(settings.enabled)
-
-        # Set text color
-        color_idx = self._color_combo.findText(settings.text_color.capitalize())
-        if color_idx >= 0:
-            self._color_combo.setCurrentIndex(color_idx)
-
-        # Set background toggle
-        self._bg_check.setChecked(settings.show_background)
-
-        # Update position display
-        self._update_position_display()
+        with _signals_blocked(
+            self._size_spin, self._size_slider, self._font_combo,
+            self._weight_combo, self._preview_check, self._color_combo,
+            self._bg_check,
+        ):
+            self._size_spin.setValue(settings.font_size)
+            self._size_slider.setValue(settings.font_size)
+
+            self._font_combo.set_current_font(settings.font_family)
+
+            # Set font weight (unknown values leave the combo unchanged)
+            weight_text = _SETTING_TO_WEIGHT.get(settings.font_weight)
+            if weight_text is not None:
+                self._weight_combo.setCurrentText(weight_text)
+
+            self._preview_check.setChecked(settings.enabled)
+
+            # Set text color
+            color_text = _SETTING_TO_COLOR.get(settings.text_color)
+            if color_text is not None:
+                self._color_combo.setCurrentText(color_text)
+
+            # Set background toggle
+            self._bg_check.setChecked(settings.show_background)
+
+            # Update position display
+            self._update_position_display()
 
-        # Unblock signals
-        self._size_spin.blockSignals(False)
-        self._size_slider.blockSignals(False)
-        self._font_combo.blockSignals(False)
-        self._weight_combo.blockSignals(False)
-        self._preview_check.blockSignals(False)
-        self._color_combo.blockSignals(False)
-        self._bg_check.blockSignals(False)
+        # The caller already has these settings; only later edits need emitting
+        self._last_emitted = self._snapshot()
 
     def set_move_mode(self, enabled: bool):
         """Set the move button state (called when mode changes externally)."""
-        self._move_btn.blockSignals(True)
-        self._move_btn.setChecked(enabled)
-        self._move_btn.blockSignals(False)
+        with _signals_blocked(self._move_btn):
+            self._move_btn.setChecked(enabled)
 
     def update_position_from_drag(self, settings: CaptionSettings):
         """Update settings and display when position is changed by dragging."""
         self._settings = settings
+        # The drag was already reported through the video player
+        self._last_emitted = self._snapshot()
         self._update_position_display()
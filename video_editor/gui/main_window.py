@@ -1,16 +1,18 @@
 """Main window for the video editor GUI."""
 
 import copy
-import shutil
+import os
 import tempfile
 import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, Slot, QTimer, Signal
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QMenuBar, QMenu, QToolBar, QPushButton, QLabel, QStatusBar,
-    QFileDialog, QMessageBox, QProgressDialog, QApplication, QComboBox,
+    QFileDialog, QMessageBox, QProgressDialog, QComboBox,
     QTabWidget
 )
 from PySide6.QtGui import QAction, QKeySequence, QShortcut
@@ -22,13 +24,113 @@ from .models import EditSession, CropConfig, CaptionSettings, RecordingConfig
 from .caption_settings import CaptionSettingsPanel
 from .settings_dialog import SettingsDialog
 from .recorder import RecorderTab
-from ..transcriber import Transcriber, Segment
-from ..analyzer import Analyzer, AnalyzedSegment, SegmentAction
-from ..cutter import Cutter
-from ..captioner import Captioner
+from ..transcriber import Segment
+from ..analyzer import Analyzer, AnalyzedSegment, SegmentAction, segments_within_ranges
+from ..cutter import Cutter, adjust_tokens_for_cuts
 from ..config import Config
 from ..project_io import infer_recording_crop_config
 
+if TYPE_CHECKING:
+    from ..transcriber import Transcriber
+
+
+# Dark theme for the main window and its children
+_MAIN_WINDOW_STYLESHEET = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QMenuBar {
+        background-color: #2d2d2d;
+        color: #fff;
+    }
+    QMenuBar::item:selected {
+        background-color: #3d3d3d;
+    }
+    QMenu {
+        background-color: #2d2d2d;
+        color: #fff;
+    }
+    QMenu::item:selected {
+        background-color: #3d3d3d;
+    }
+    QToolBar {
+        background-color: #2d2d2d;
+        border: none;
+        spacing: 4px;
+        padding: 4px;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: #fff;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton:pressed {
+        background-color: #2d2d2d;
+    }
+    QPushButton:checked {
+        background-color: #2196f3;
+        border-color: #1976d2;
+    }
+    QPushButton:disabled {
+        background-color: #2d2d2d;
+        color: #666;
+    }
+    QStatusBar {
+        background-color: #2d2d2d;
+        color: #888;
+    }
+    QSplitter::handle {
+        background-color: #3d3d3d;
+    }
+    QLabel {
+        color: #fff;
+    }
+    QComboBox {
+        background-color: #3d3d3d;
+        color: #fff;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 4px 8px;
+    }
+    QComboBox:hover {
+        background-color: #4d4d4d;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3d3d3d;
+        color: #fff;
+        selection-background-color: #2196f3;
+    }
+    QTabWidget::pane {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #888;
+        border: none;
+        padding: 10px 24px;
+        min-width: 100px;
+    }
+    QTabBar::tab:selected {
+        background-color: #1e1e1e;
+        color: #fff;
+        border-bottom: 2px solid #2196f3;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #3d3d3d;
+        color: #aaa;
+    }
+"""
+
 
 class MainWindow(QMainWindow):
     """
@@ -42,18 +144,44 @@ class MainWindow(QMainWindow):
     - Status bar: Statistics
     """
 
-    _export_progress_updated = Signal(str)
+    _analysis_progress_updated = Signal(int, str)
+    _analysis_finished = Signal(bool, object)
+    _export_progress_updated = Signal(int, str)
     _export_finished = Signal(bool, object)
 
+    # Left/Right arrow seek distance and Shift+arrow crop pan step (fraction of the frame)
+    JUMP_SECONDS = 5
+    CROP_PAN_STEP = 0.05
+    # Playback position updates are applied to the views at most once per interval (~60 Hz)
+    POSITION_UPDATE_INTERVAL_MS = 16
+
     def __init__(self, video_path: Path | None = None, parent=None):
         super().__init__(parent)
 
         self._session: EditSession | None = None
         self._config = Config()
+        # Pipeline components shared by every analysis/export, created on first use
+        self._transcriber: "Transcriber | None" = None
+        self._analyzer: Analyzer | None = None
+        self._cutter: Cutter | None = None
         self._project_path: Path | None = None
         self._unsaved_changes = False
+        self._analysis_thread: threading.Thread | None = None
         self._export_thread: threading.Thread | None = None
-        self._export_progress_dialog: QProgressDialog | None = None
+        self._export_cancel_event = threading.Event()
+        # Modal progress dialog shared by analysis and export, created on first use
+        self._progress_dialog: QProgressDialog | None = None
+
+        # Latest playback position not yet applied to the timeline/transcript/captions
+        # (None after a media or session load, so the next position always applies)
+        self._pending_position_ms: int | None = None
+        self._position_timer = QTimer(self)
+        self._position_timer.setSingleShot(True)
+        self._position_timer.setInterval(self.POSITION_UPDATE_INTERVAL_MS)
+        self._position_timer.timeout.connect(self._flush_playback_position)
+
+        # Video passed on the command line, loaded once the window is shown
+        self._pending_video_path: Path | None = video_path
 
         # Load API keys from settings file into environment
         SettingsDialog.load_settings_to_env()
@@ -70,7 +198,7 @@ class MainWindow(QMainWindow):
         self._apply_dark_theme()
 
         if video_path:
-            QTimer.singleShot(100, lambda: self._load_video(video_path))
+            QTimer.singleShot(100, self._load_pending_video)
 
     def _setup_ui(self):
         """Set up the main UI layout with tabs."""
@@ -233,6 +361,9 @@ class MainWindow(QMainWindow):
         export_action.setShortcut(QKeySequence("Ctrl+E"))
         export_action.triggered.connect(self._export_video)
 
+        batch_export_action = file_menu.addAction("Export Projects...")
+        batch_export_action.triggered.connect(self._batch_export)
+
         file_menu.addSeparator()
 
         quit_action = file_menu.addAction("Quit")
@@ -269,10 +400,14 @@ class MainWindow(QMainWindow):
         api_keys_action = settings_menu.addAction("API Keys...")
         api_keys_action.triggered.connect(self._open_settings)
 
+    @Slot()
     def _open_settings(self):
         """Open the settings dialog."""
         dialog = SettingsDialog(self)
-        dialog.exec()
+        if dialog.exec():
+            # API keys are read when the components are built, so rebuild them
+            self._transcriber = None
+            self._analyzer = None
 
     def _setup_shortcuts(self):
         """Set up keyboard shortcuts."""
@@ -282,10 +417,10 @@ class MainWindow(QMainWindow):
 
         # Left/Right arrows - jump 5 seconds
         left = QShortcut(QKeySequence(Qt.Key.Key_Left), self)
-        left.activated.connect(lambda: self._video_player.jump_backward(5))
+        left.activated.connect(self._jump_backward)
 
         right = QShortcut(QKeySequence(Qt.Key.Key_Right), self)
-        right.activated.connect(lambda: self._video_player.jump_forward(5))
+        right.activated.connect(self._jump_forward)
 
         # K - toggle keep/cut for selected segment
         toggle = QShortcut(QKeySequence(Qt.Key.Key_K), self)
@@ -308,16 +443,16 @@ class MainWindow(QMainWindow):
 
         # Shift+Arrow keys - pan crop region
         pan_left = QShortcut(QKeySequence("Shift+Left"), self)
-        pan_left.activated.connect(lambda: self._pan_crop(-0.05, 0))
+        pan_left.activated.connect(self._pan_crop_left)
 
         pan_right = QShortcut(QKeySequence("Shift+Right"), self)
-        pan_right.activated.connect(lambda: self._pan_crop(0.05, 0))
+        pan_right.activated.connect(self._pan_crop_right)
 
         pan_up = QShortcut(QKeySequence("Shift+Up"), self)
-        pan_up.activated.connect(lambda: self._pan_crop(0, -0.05))
+        pan_up.activated.connect(self._pan_crop_up)
 
         pan_down = QShortcut(QKeySequence("Shift+Down"), self)
-        pan_down.activated.connect(lambda: self._pan_crop(0, 0.05))
+        pan_down.activated.connect(self._pan_crop_down)
 
     def _connect_signals(self):
         """Connect signals between components."""
@@ -352,7 +487,10 @@ class MainWindow(QMainWindow):
 
         # Caption controls
         self._captions_btn.clicked.connect(self._on_captions_btn_clicked)
-        self._caption_settings_panel.settings_changed.connect(self._on_caption_settings_changed)
+        # Queued so the preview re-render runs from the event loop, not inside the widget handler
+        self._caption_settings_panel.settings_changed.connect(
+            self._on_caption_settings_changed, Qt.ConnectionType.QueuedConnection
+        )
         self._caption_settings_panel.move_caption_requested.connect(self._on_caption_move_requested)
         self._caption_settings_panel.regenerate_requested.connect(self._on_regenerate_captions)
         self._video_player.caption_settings_changed.connect(self._on_caption_position_changed)
@@ -360,107 +498,17 @@ class MainWindow(QMainWindow):
         # Recorder tab
         self._recorder_tab.open_in_editor_requested.connect(self._on_recording_open_requested)
 
-        # Background export
-        self._export_progress_updated.connect(self._on_export_progress_updated)
-        self._export_finished.connect(self._on_export_finished)
+        # Background analysis and export: emitted from worker threads, so pin the
+        # connections to queued delivery and keep every dialog update on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self._analysis_progress_updated.connect(self._on_analysis_progress_updated, queued)
+        self._analysis_finished.connect(self._on_analysis_finished, queued)
+        self._export_progress_updated.connect(self._on_export_progress_updated, queued)
+        self._export_finished.connect(self._on_export_finished, queued)
 
     def _apply_dark_theme(self):
         """Apply dark theme styling."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: #fff;
-            }
-            QMenuBar::item:selected {
-                background-color: #3d3d3d;
-            }
-            QMenu {
-                background-color: #2d2d2d;
-                color: #fff;
-            }
-            QMenu::item:selected {
-                background-color: #3d3d3d;
-            }
-            QToolBar {
-                background-color: #2d2d2d;
-                border: none;
-                spacing: 4px;
-                padding: 4px;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-            QPushButton:checked {
-                background-color: #2196f3;
-                border-color: #1976d2;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666;
-            }
-            QStatusBar {
-                background-color: #2d2d2d;
-                color: #888;
-            }
-            QSplitter::handle {
-                background-color: #3d3d3d;
-            }
-            QLabel {
-                color: #fff;
-            }
-            QComboBox {
-                background-color: #3d3d3d;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QComboBox:hover {
-                background-color: #4d4d4d;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #fff;
-                selection-background-color: #2196f3;
-            }
-            QTabWidget::pane {
-                border: none;
-                background-color: #1e1e1e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #888;
-                border: none;
-                padding: 10px 24px;
-                min-width: 100px;
-            }
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                color: #fff;
-                border-bottom: 2px solid #2196f3;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #3d3d3d;
-                color: #aaa;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_STYLESHEET)
 
     # Public methods
 
@@ -470,6 +518,13 @@ class MainWindow(QMainWindow):
 
     # Private methods
 
+    @Slot()
+    def _load_pending_video(self):
+        """Load the video passed to the constructor."""
+        path, self._pending_video_path = self._pending_video_path, None
+        if path:
+            self._load_video(path)
+
     def _load_video(self, path: Path):
         """Load a video file and prepare for editing."""
         path = Path(path)
@@ -478,6 +533,7 @@ class MainWindow(QMainWindow):
             return
 
         self._video_player.load_video(path)
+        self._reset_playback_position()
         self.setWindowTitle(f"Video Editor - {path.name}")
         self._process_btn.setEnabled(True)
 
@@ -492,12 +548,23 @@ class MainWindow(QMainWindow):
         )
         self._video_player.set_crop_config(crop_config)
         self._unsaved_changes = False
+        self._prefetch_media_info(path)
 
         if crop_config.is_default:
             self._status_label.setText(f"Loaded: {path.name}")
         else:
             self._status_label.setText(f"Loaded: {path.name} | Recorder crop restored")
 
+    def _prefetch_media_info(self, path: Path) -> None:
+        """Probe the source once in the background so analysis and export reuse it."""
+        threading.Thread(
+            target=self._get_cutter().probe_media,
+            args=(path,),
+            name="media-probe",
+            daemon=True,
+        ).start()
+
+    @Slot()
     def _analyze_video(self):
         """Run the full analysis pipeline."""
         if not self._session:
@@ -540,92 +607,181 @@ class MainWindow(QMainWindow):
                     # User closed without adding key, continue anyway
                     pass
 
+        if self._analysis_thread and self._analysis_thread.is_alive():
+            QMessageBox.information(self, "Analysis In Progress", "Wait for the current analysis to finish.")
+            return
+
         path = self._session.video_path
-        existing_crop = self._session.crop_config.copy()
 
         # Show progress dialog
-        progress = QProgressDialog("Analyzing video...", "Cancel", 0, 100, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
+        progress = self._show_progress("Analyzing video...", 100)
         progress.setValue(10)
-        QApplication.processEvents()
 
-        try:
-            # Initialize components
-            transcriber = Transcriber(self._config)
-            analyzer = Analyzer(self._config)
-            cutter = Cutter(self._config)
-
-            # Get video duration
-            progress.setLabelText("Getting video info...")
-            progress.setValue(15)
-            QApplication.processEvents()
-            video_duration = cutter.get_video_duration(path)
-
-            # Transcribe
-            progress.setLabelText("Transcribing speech...")
-            progress.setValue(20)
-            QApplication.processEvents()
-            segments, tokens = transcriber.transcribe_video(path)
-
-            if not segments:
-                QMessageBox.warning(self, "Warning", "No speech detected in video!")
-                return
+        self._process_btn.setEnabled(False)
 
-            progress.setValue(60)
+        def run_analysis() -> None:
+            try:
+                result = self._run_analysis_job(path)
+                self._analysis_finished.emit(True, result)
+            except Exception as exc:
+                self._analysis_finished.emit(False, str(exc))
 
-            # Analyze
-            progress.setLabelText("Analyzing segments...")
-            QApplication.processEvents()
+        self._analysis_thread = threading.Thread(
+            target=run_analysis,
+            name="video-analysis",
+            daemon=True,
+        )
+        self._analysis_thread.start()
+
+    def _show_progress(self, label: str, maximum: int, cancel_text: str | None = None) -> QProgressDialog:
+        """Show the shared modal progress dialog (maximum 0 = busy indicator)."""
+        if self._progress_dialog is None:
+            self._progress_dialog = QProgressDialog(self)
+            self._progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            self._progress_dialog.setMinimumDuration(0)
+            self._progress_dialog.setAutoClose(False)
+            self._progress_dialog.setAutoReset(False)
+            self._progress_dialog.canceled.connect(self._on_export_canceled)
+
+        progress = self._progress_dialog
+        # Clears a previous cancellation and stops the auto-show timer
+        progress.reset()
+        if cancel_text:
+            progress.setCancelButtonText(cancel_text)
+        else:
+            progress.setCancelButton(None)
+        progress.setRange(0, maximum)
+        progress.setLabelText(label)
+        progress.show()
+        return progress
+
+    def _hide_progress(self) -> None:
+        """Hide the shared progress dialog, keeping it for the next job."""
+        if self._progress_dialog:
+            self._progress_dialog.reset()
+            self._progress_dialog.hide()
+
+    def _get_transcriber(self) -> "Transcriber":
+        """Return the shared transcriber, creating it on first use."""
+        if self._transcriber is None:
+            from ..transcriber import Transcriber
+            self._transcriber = Transcriber(self._config)
+        return self._transcriber
+
+    def _get_analyzer(self) -> Analyzer:
+        """Return the shared analyzer, creating it on first use."""
+        if self._analyzer is None:
+            self._analyzer = Analyzer(self._config)
+        return self._analyzer
+
+    def _get_cutter(self) -> Cutter:
+        """Return the shared cutter, whose media probes are cached per input."""
+        if self._cutter is None:
+            self._cutter = Cutter(self._config)
+        return self._cutter
+
+    def _run_analysis_job(self, path: Path) -> dict | None:
+        """Transcribe and analyze the video outside the UI thread.
+
+        Returns None when no speech was detected.
+        """
+        transcriber = self._get_transcriber()
+        analyzer = self._get_analyzer()
+        cutter = self._get_cutter()
+
+        # Get video duration
+        self._analysis_progress_updated.emit(15, "Getting video info...")
+        video_duration = cutter.get_video_duration(path)
+
+        # Transcribe
+        self._analysis_progress_updated.emit(20, "Transcribing speech...")
+        segments, tokens = transcriber.transcribe_video(path)
+
+        if not segments:
+            return None
+
+        # Analyze
+        self._analysis_progress_updated.emit(60, "Analyzing segments...")
+
+        # Get analyzed segments with actions
+        keep_ranges, kept_segments = analyzer.analyze(segments, video_duration)
+
+        # Create analyzed segment objects
+        analyzed_segments = []
+        kept_flags = segments_within_ranges(segments, keep_ranges)
+
+        for seg, is_kept in zip(segments, kept_flags):
+            action = SegmentAction.KEEP if is_kept else SegmentAction.REMOVE
+            analyzed_segments.append(AnalyzedSegment(
+                segment=seg,
+                action=action,
+                reason="" if is_kept else "Retake or silence"
+            ))
+
+        self._analysis_progress_updated.emit(80, "Analyzing segments...")
+
+        return {
+            "video_path": path,
+            "video_duration": video_duration,
+            "segments": segments,
+            "analyzed_segments": analyzed_segments,
+            "tokens": tokens,
+            "keep_ranges": keep_ranges,
+        }
 
-            # Get analyzed segments with actions
-            keep_ranges, kept_segments = analyzer.analyze(segments, video_duration)
+    @Slot(int, str)
+    def _on_analysis_progress_updated(self, value: int, label: str) -> None:
+        """Update analysis progress from the worker thread."""
+        if self._progress_dialog:
+            self._progress_dialog.setLabelText(label)
+            self._progress_dialog.setValue(value)
 
-            # Create analyzed segment objects
-            analyzed_segments = []
-            kept_set = {(r.start, r.end) for r in keep_ranges}
+    @Slot(bool, object)
+    def _on_analysis_finished(self, success: bool, payload: object) -> None:
+        """Load the analysis result into the editor on the UI thread."""
+        self._analysis_thread = None
+        self._process_btn.setEnabled(self._session is not None)
 
-            for seg in segments:
-                # Check if this segment is in keep_ranges
-                is_kept = any(
-                    r.start <= seg.start and seg.end <= r.end
-                    for r in keep_ranges
-                )
-                action = SegmentAction.KEEP if is_kept else SegmentAction.REMOVE
-                analyzed_segments.append(AnalyzedSegment(
-                    segment=seg,
-                    action=action,
-                    reason="" if is_kept else "Retake or silence"
-                ))
+        try:
+            if not success:
+                QMessageBox.critical(self, "Error", f"Analysis failed: {payload}")
+                return
+
+            if payload is None:
+                QMessageBox.warning(self, "Warning", "No speech detected in video!")
+                return
+
+            path = payload["video_path"]
+            if not self._session or self._session.video_path != path:
+                # A different video was loaded while this one was being analyzed
+                return
 
-            progress.setValue(80)
+            segments = payload["segments"]
+            analyzed_segments = payload["analyzed_segments"]
+            tokens = payload["tokens"]
+            video_duration = payload["video_duration"]
 
             # Update session
-            self._session = EditSession(
-                video_path=path,
-                video_duration=video_duration,
-                original_segments=segments,
-                analyzed_segments=analyzed_segments,
-                tokens=tokens,
-                original_keep_ranges=keep_ranges,
-                crop_config=existing_crop,
+            self._session.apply_analysis(
+                video_duration,
+                segments,
+                analyzed_segments,
+                tokens,
+                payload["keep_ranges"],
             )
 
             # Update UI
-            progress.setLabelText("Updating display...")
-            progress.setValue(90)
-            QApplication.processEvents()
+            self._on_analysis_progress_updated(90, "Updating display...")
 
             self._timeline.load_session(self._session)
             self._transcript_editor.load_session(self._session)
+            self._reset_playback_position()
 
             # Set up caption preview with tokens
             self._video_player.set_caption_tokens(tokens)
             self._video_player.set_caption_settings(self._session.caption_settings)
             self._caption_settings_panel.set_settings(self._session.caption_settings)
 
-            progress.setValue(100)
-
             # Update status
             kept_count = sum(1 for a in analyzed_segments if a.action == SegmentAction.KEEP)
             self._status_label.setText(
@@ -635,18 +791,32 @@ class MainWindow(QMainWindow):
 
             self._export_btn.setEnabled(True)
             self._captions_btn.setEnabled(True)
-
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Analysis failed: {e}")
         finally:
-            progress.close()
+            self._hide_progress()
 
     # Slots
 
     @Slot(int)
     def _on_playback_position_changed(self, position_ms: int):
-        """Update timeline, transcript, and captions when playback position changes."""
-        time_seconds = position_ms / 1000.0
+        """Record the playback position and schedule one coalesced view update."""
+        if position_ms == self._pending_position_ms:
+            # Already shown or scheduled; source switches re-emit the same frame
+            return
+        self._pending_position_ms = position_ms
+        if not self._position_timer.isActive():
+            self._position_timer.start()
+
+    def _reset_playback_position(self):
+        """Drop the remembered position so the first update after a load is applied."""
+        self._position_timer.stop()
+        self._pending_position_ms = None
+
+    @Slot()
+    def _flush_playback_position(self):
+        """Update timeline, transcript, and captions to the latest playback position."""
+        time_seconds = self._pending_position_ms / 1000.0
         self._timeline.set_playhead_position(time_seconds)
         self._transcript_editor.highlight_current_time(time_seconds)
         self._video_player.update_caption(time_seconds)
@@ -654,8 +824,9 @@ class MainWindow(QMainWindow):
     @Slot(int)
     def _on_duration_changed(self, duration_ms: int):
         """Update session when video duration is known."""
-        if self._session:
-            self._session.video_duration = duration_ms / 1000.0
+        duration = duration_ms / 1000.0
+        if self._session and self._session.video_duration != duration:
+            self._session.video_duration = duration
 
     @Slot(int)
     def _on_timeline_segment_clicked(self, index: int):
@@ -725,6 +896,7 @@ class MainWindow(QMainWindow):
         self._view_preview_btn.setChecked(False)
         if self._session:
             self._video_player.load_video(self._session.video_path)
+            self._reset_playback_position()
 
     @Slot()
     def _on_view_preview(self):
@@ -740,6 +912,7 @@ class MainWindow(QMainWindow):
         """Toggle crop editing mode."""
         self._toggle_crop_mode()
 
+    @Slot()
     def _toggle_crop_mode(self):
         """Toggle crop editing mode."""
         is_crop_mode = not self._video_player.is_crop_mode()
@@ -812,10 +985,32 @@ class MainWindow(QMainWindow):
             self._session.set_global_crop(config)
             self._unsaved_changes = True
 
+    @Slot(float, float)
     def _pan_crop(self, pan_x_delta: float, pan_y_delta: float):
         """Adjust pan offset by delta values."""
         self._video_player.adjust_pan(pan_x_delta, pan_y_delta)
 
+    @Slot()
+    def _pan_crop_left(self):
+        """Pan the crop region left."""
+        self._pan_crop(-self.CROP_PAN_STEP, 0)
+
+    @Slot()
+    def _pan_crop_right(self):
+        """Pan the crop region right."""
+        self._pan_crop(self.CROP_PAN_STEP, 0)
+
+    @Slot()
+    def _pan_crop_up(self):
+        """Pan the crop region up."""
+        self._pan_crop(0, -self.CROP_PAN_STEP)
+
+    @Slot()
+    def _pan_crop_down(self):
+        """Pan the crop region down."""
+        self._pan_crop(0, self.CROP_PAN_STEP)
+
+    @Slot()
     def _reset_crop(self):
         """Reset crop to full frame."""
         self._video_player.reset_crop()
@@ -874,11 +1069,23 @@ class MainWindow(QMainWindow):
             pos = self._video_player.position_seconds()
             self._video_player.update_caption(pos)
 
+    @Slot()
+    def _jump_backward(self):
+        """Jump playback backward."""
+        self._video_player.jump_backward(self.JUMP_SECONDS)
+
+    @Slot()
+    def _jump_forward(self):
+        """Jump playback forward."""
+        self._video_player.jump_forward(self.JUMP_SECONDS)
+
+    @Slot()
     def _toggle_selected_segment(self):
         """Toggle keep/cut for the currently selected segment."""
         if self._transcript_editor._selected_index >= 0:
             self._on_toggle_segment(self._transcript_editor._selected_index)
 
+    @Slot()
     def _select_previous_segment(self):
         """Select the previous segment."""
         current = self._transcript_editor._selected_index
@@ -886,6 +1093,7 @@ class MainWindow(QMainWindow):
             self._transcript_editor.select_segment(current - 1)
             self._on_transcript_segment_clicked(current - 1)
 
+    @Slot()
     def _select_next_segment(self):
         """Select the next segment."""
         current = self._transcript_editor._selected_index
@@ -893,26 +1101,27 @@ class MainWindow(QMainWindow):
             self._transcript_editor.select_segment(current + 1)
             self._on_transcript_segment_clicked(current + 1)
 
+    @Slot()
     def _keep_all_segments(self):
         """Set all segments to keep."""
-        if self._session:
-            for i in range(len(self._session.original_segments)):
-                self._session.set_segment_kept(i, True)
-                self._timeline.update_segment(i, True)
-                self._transcript_editor.update_segment(i, True)
-            self._unsaved_changes = True
+        self._set_all_segments_kept(True)
 
+    @Slot()
     def _cut_all_segments(self):
         """Set all segments to cut."""
+        self._set_all_segments_kept(False)
+
+    def _set_all_segments_kept(self, keep: bool):
+        """Apply one keep/cut decision to every segment and refresh the views once."""
         if self._session:
-            for i in range(len(self._session.original_segments)):
-                self._session.set_segment_kept(i, False)
-                self._timeline.update_segment(i, False)
-                self._transcript_editor.update_segment(i, False)
+            self._session.set_all_segments_kept(keep)
+            self._timeline.update_all_segments(keep)
+            self._transcript_editor.update_all_segments(keep)
             self._unsaved_changes = True
 
     # File operations
 
+    @Slot()
     def _open_video(self):
         """Open a video file dialog."""
         path, _ = QFileDialog.getOpenFileName(
@@ -924,6 +1133,7 @@ class MainWindow(QMainWindow):
         if path:
             self._load_video(Path(path))
 
+    @Slot()
     def _open_project(self):
         """Open a project file."""
         path, _ = QFileDialog.getOpenFileName(
@@ -937,8 +1147,10 @@ class MainWindow(QMainWindow):
                 self._session = EditSession.load(Path(path))
                 self._project_path = Path(path)
                 self._video_player.load_video(self._session.video_path)
+                self._prefetch_media_info(self._session.video_path)
                 self._timeline.load_session(self._session)
                 self._transcript_editor.load_session(self._session)
+                self._reset_playback_position()
 
                 # Restore crop settings
                 if self._session.crop_config:
@@ -956,6 +1168,7 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open project: {e}")
 
+    @Slot()
     def _save_project(self):
         """Save the current project."""
         if not self._session:
@@ -967,6 +1180,7 @@ class MainWindow(QMainWindow):
         else:
             self._save_project_as()
 
+    @Slot()
     def _save_project_as(self):
         """Save the project with a new name."""
         if not self._session:
@@ -986,6 +1200,7 @@ class MainWindow(QMainWindow):
             self._unsaved_changes = False
             self.setWindowTitle(f"Video Editor - {path}")
 
+    @Slot()
     def _export_video(self):
         """Export the edited recording."""
         if not self._session:
@@ -995,7 +1210,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Export In Progress", "Wait for the current export to finish.")
             return
 
-        source_has_video = Cutter(self._config).input_has_video(self._session.video_path)
+        source_has_video = self._get_cutter().input_has_video(self._session.video_path)
         default_suffix = ".mp4" if source_has_video else ".m4a"
         title = "Export Video" if source_has_video else "Export Audio"
         file_filter = "MP4 Video (*.mp4)" if source_has_video else "M4A Audio (*.m4a);;MP4 Audio (*.mp4)"
@@ -1017,26 +1232,23 @@ class MainWindow(QMainWindow):
         session_snapshot = copy.deepcopy(self._session)
         config_snapshot = copy.deepcopy(self._config)
 
-        self._export_progress_dialog = QProgressDialog("Preparing export...", None, 0, 0, self)
-        self._export_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self._export_progress_dialog.setMinimumDuration(0)
-        self._export_progress_dialog.setAutoClose(False)
-        self._export_progress_dialog.setAutoReset(False)
-        self._export_progress_dialog.setCancelButton(None)
-        self._export_progress_dialog.show()
+        self._export_cancel_event = threading.Event()
+        cancel_event = self._export_cancel_event
+
+        self._show_progress("Preparing export...", 100, cancel_text="Cancel")
 
         self._export_btn.setEnabled(False)
         self._status_label.setText("Preparing export...")
 
         def run_export() -> None:
             try:
-                result_path = self._run_export_job(session_snapshot, config_snapshot, output_path)
+                result_path = self._run_export_job(
+                    session_snapshot, config_snapshot, output_path, cancel_event.is_set
+                )
                 self._export_finished.emit(True, result_path)
             except Exception as exc:
-                try:
-                    output_path.unlink(missing_ok=True)
-                except OSError:
-                    pass
+                # _run_export_job only replaces the output once it succeeded,
+                # so an earlier export at this path is left in place
                 self._export_finished.emit(False, str(exc))
 
         self._export_thread = threading.Thread(
@@ -1046,9 +1258,71 @@ class MainWindow(QMainWindow):
         )
         self._export_thread.start()
 
-    def _run_export_job(self, session: EditSession, config: Config, output_path: Path) -> Path:
-        """Run the export pipeline outside the UI thread."""
-        from ..main import _adjust_tokens_for_cuts
+    @Slot()
+    def _batch_export(self):
+        """Export several saved projects into one folder."""
+        if self._export_thread and self._export_thread.is_alive():
+            QMessageBox.information(self, "Export In Progress", "Wait for the current export to finish.")
+            return
+
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Export Projects",
+            "",
+            "Video Editor Projects (*.vedproj)"
+        )
+        if not paths:
+            return
+
+        output_dir = QFileDialog.getExistingDirectory(self, "Export To Folder")
+        if not output_dir:
+            return
+
+        project_paths = [Path(path) for path in paths]
+        config_snapshot = copy.deepcopy(self._config)
+
+        self._export_cancel_event = threading.Event()
+        cancel_event = self._export_cancel_event
+
+        label = f"Exporting {len(project_paths)} projects..."
+        self._show_progress(label, 0, cancel_text="Cancel")
+        self._export_btn.setEnabled(False)
+        self._status_label.setText(label)
+
+        def run_batch_export() -> None:
+            from ..export_pipeline import export_projects
+
+            try:
+                result_paths = export_projects(
+                    project_paths,
+                    Path(output_dir),
+                    config=config_snapshot,
+                    should_cancel=cancel_event.is_set,
+                )
+                self._export_finished.emit(True, result_paths)
+            except Exception as exc:
+                self._export_finished.emit(False, str(exc))
+
+        self._export_thread = threading.Thread(
+            target=run_batch_export,
+            name="video-batch-export",
+            daemon=True,
+        )
+        self._export_thread.start()
+
+    def _run_export_job(
+        self,
+        session: EditSession,
+        config: Config,
+        output_path: Path,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> Path:
+        """Run the export pipeline outside the UI thread.
+
+        should_cancel is polled between FFmpeg steps and while FFmpeg cuts,
+        concatenates or burns captions, which stops the running FFmpeg.
+        """
+        from ..captioner import Captioner
 
         if output_path == session.video_path.resolve():
             raise RuntimeError("Choose a different output path than the source video.")
@@ -1071,7 +1345,9 @@ class MainWindow(QMainWindow):
             config.caption_position = "bottom"
             config.caption_vertical_offset = (1.0 - caption_settings.pos_y) * 1080
 
-        cutter = Cutter(config)
+        # The export gets its own cutter so settings changed meanwhile stay out of
+        # it; the probes prefetched on the shared cutter still apply
+        cutter = self._get_cutter().with_config(config)
         source_has_video = cutter.input_has_video(session.video_path)
 
         keep_ranges = session.get_final_keep_ranges(
@@ -1079,17 +1355,23 @@ class MainWindow(QMainWindow):
             config.segment_end_buffer
         )
 
-        self._export_progress_updated.emit("Cutting video..." if source_has_video else "Cutting audio...")
+        cut_label = "Cutting video..." if source_has_video else "Cutting audio..."
+        self._export_progress_updated.emit(0, cut_label)
 
         crop_filter = None
+        crop_size = None
         segment_crop_filters = None
+        needs_global_crop = session.crop_config and not session.crop_config.is_default
 
-        if source_has_video and session.crop_config and not session.crop_config.is_default:
+        if source_has_video and (needs_global_crop or session.segment_crop_overrides):
+            # One probe serves both the global and the per-segment crop filters
             video_w, video_h = cutter.get_video_dimensions(session.video_path)
+
+        if source_has_video and needs_global_crop:
             crop_filter = session.crop_config.to_ffmpeg_filter(video_w, video_h)
+            crop_size = session.crop_config.get_crop_rect(video_w, video_h)[2:]
 
         if source_has_video and session.segment_crop_overrides:
-            video_w, video_h = cutter.get_video_dimensions(session.video_path)
             segment_crop_filters = {
                 idx: crop.to_ffmpeg_filter(video_w, video_h)
                 for idx, crop in session.segment_crop_overrides.items()
@@ -1098,66 +1380,155 @@ class MainWindow(QMainWindow):
             if not segment_crop_filters:
                 segment_crop_filters = None
 
+        tokens = session.get_final_tokens()
+        burn_captions = bool(source_has_video and tokens and session.caption_settings.enabled)
+
+        # Progress is reported against the length of the cut output
+        cut_duration = Cutter.cut_duration(keep_ranges)
+
+        # Everything is written next to the output so the final rename never copies
+        # across filesystems, and the output is only replaced once the export succeeded
         temp_suffix = ".mp4" if source_has_video else ".m4a"
-        with tempfile.NamedTemporaryFile(prefix="video_editor_export_", suffix=temp_suffix, delete=False) as tmp_file:
-            temp_cut = Path(tmp_file.name)
 
-        temp_cut.unlink(missing_ok=True)
+        def make_temp_path() -> Path:
+            with tempfile.NamedTemporaryFile(
+                prefix=".video_editor_export_", suffix=temp_suffix, dir=output_path.parent, delete=False
+            ) as tmp_file:
+                temp_path = Path(tmp_file.name)
+            temp_path.unlink(missing_ok=True)
+            return temp_path
+
+        # Cut and caption in one FFmpeg pass when the cut fits a single filtergraph
+        cut_graph = None
+        if burn_captions and not segment_crop_filters:
+            cut_graph = cutter.build_cut_graph(session.video_path, keep_ranges, crop_filter, crop_size)
+        if cut_graph is not None:
+            label = "Cutting video and adding captions..."
+            self._export_progress_updated.emit(0, label)
+            temp_output = make_temp_path()
+            try:
+                Captioner(config).burn_captions_over_cut(
+                    cut_graph,
+                    adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP),
+                    temp_output,
+                    max_words=config.max_caption_words,
+                    caption_settings=caption_settings.to_dict(),
+                    on_progress=self._export_progress_reporter(label, 0, 100, cut_duration),
+                    should_cancel=should_cancel,
+                )
+                os.replace(temp_output, output_path)
+            finally:
+                temp_output.unlink(missing_ok=True)
+            return output_path
+
+        temp_cut = make_temp_path()
+        temp_output = None
 
         try:
+            if not burn_captions:
+                # Nothing to overlay, so the cut itself is the export
+                cutter.cut_video(
+                    session.video_path,
+                    keep_ranges,
+                    temp_cut,
+                    crop_filter=crop_filter,
+                    segment_crop_filters=segment_crop_filters,
+                    should_cancel=should_cancel,
+                    # The rest of the bar is the concat of the extracted segments
+                    on_progress=self._export_progress_reporter(cut_label, 0, 95, cut_duration),
+                )
+                os.replace(temp_cut, output_path)
+                return output_path
+
+            # Cutting and captioning are each one FFmpeg encode of the cut length
             cutter.cut_video(
                 session.video_path,
                 keep_ranges,
                 temp_cut,
                 crop_filter=crop_filter,
-                segment_crop_filters=segment_crop_filters
+                segment_crop_filters=segment_crop_filters,
+                should_cancel=should_cancel,
+                on_progress=self._export_progress_reporter(cut_label, 0, 50, cut_duration),
             )
 
-            self._export_progress_updated.emit("Adding captions..." if source_has_video else "Finalizing audio export...")
-
-            tokens = session.get_final_tokens()
-
-            if source_has_video and tokens and session.caption_settings.enabled:
-                captioner = Captioner(config)
-                adjusted_tokens = _adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP)
-                captioner.burn_streaming_captions(
-                    temp_cut,
-                    adjusted_tokens,
-                    output_path,
-                    max_words=config.max_caption_words,
-                    caption_settings=session.caption_settings.to_dict()
-                )
-            else:
-                self._export_progress_updated.emit("Finalizing export...")
-                shutil.move(str(temp_cut), str(output_path))
+            if should_cancel and should_cancel():
+                raise RuntimeError("Export cancelled")
 
+            label = "Adding captions..."
+            self._export_progress_updated.emit(50, label)
+            captioner = Captioner(config)
+            adjusted_tokens = adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP)
+            temp_output = make_temp_path()
+            captioner.burn_streaming_captions(
+                temp_cut,
+                adjusted_tokens,
+                temp_output,
+                max_words=config.max_caption_words,
+                caption_settings=session.caption_settings.to_dict(),
+                on_progress=self._export_progress_reporter(label, 50, 50, cut_duration),
+                should_cancel=should_cancel,
+            )
+            os.replace(temp_output, output_path)
             return output_path
         finally:
             temp_cut.unlink(missing_ok=True)
+            if temp_output is not None:
+                temp_output.unlink(missing_ok=True)
+
+    def _export_progress_reporter(
+        self, label: str, start: int, span: int, total_seconds: float
+    ) -> Callable[[float], None]:
+        """Map encoded seconds onto start..start+span percent of the export dialog."""
+        def report(seconds: float) -> None:
+            fraction = min(seconds / total_seconds, 1.0) if total_seconds > 0 else 0.0
+            self._export_progress_updated.emit(start + int(span * fraction), label)
 
-    @Slot(str)
-    def _on_export_progress_updated(self, label: str) -> None:
-        """Update export progress text from the worker thread."""
-        if self._export_progress_dialog:
-            self._export_progress_dialog.setLabelText(label)
+        return report
+
+    @Slot(int, str)
+    def _on_export_progress_updated(self, value: int, label: str) -> None:
+        """Update export progress from the worker thread."""
+        if self._progress_dialog:
+            self._progress_dialog.setLabelText(label)
+            self._progress_dialog.setValue(value)
         self._status_label.setText(label)
 
+    @Slot()
+    def _on_export_canceled(self) -> None:
+        """Ask the export worker to stop; a running caption encode is terminated."""
+        if not (self._export_thread and self._export_thread.is_alive()):
+            return  # The shared progress dialog was dismissed during analysis
+        self._export_cancel_event.set()
+        if self._progress_dialog:
+            self._progress_dialog.setLabelText("Canceling...")
+        self._status_label.setText("Canceling export...")
+
     @Slot(bool, object)
     def _on_export_finished(self, success: bool, payload: object) -> None:
         """Handle export completion on the UI thread."""
-        if self._export_progress_dialog:
-            self._export_progress_dialog.close()
-            self._export_progress_dialog = None
+        self._hide_progress()
 
         self._export_thread = None
         self._export_btn.setEnabled(self._session is not None)
 
+        if success and isinstance(payload, list):
+            output_dir = payload[0].parent
+            self._status_label.setText(f"Exported {len(payload)} projects")
+            QMessageBox.information(
+                self, "Export Complete", f"{len(payload)} videos exported to:\n{output_dir}"
+            )
+            return
+
         if success:
             output_path = Path(payload)
             self._status_label.setText(f"Exported {output_path.name}")
             QMessageBox.information(self, "Export Complete", f"Video exported to:\n{output_path}")
             return
 
+        if self._export_cancel_event.is_set():
+            self._status_label.setText("Export cancelled")
+            return
+
         self._status_label.setText("Export failed")
         QMessageBox.critical(self, "Error", f"Export failed: {payload}")
 
@@ -1174,6 +1545,15 @@ class MainWindow(QMainWindow):
             event.ignore()
             return
 
+        if self._analysis_thread and self._analysis_thread.is_alive():
+            QMessageBox.warning(
+                self,
+                "Analysis In Progress",
+                "Wait for the current analysis to finish before closing the editor."
+            )
+            event.ignore()
+            return
+
         if self._export_thread and self._export_thread.is_alive():
             QMessageBox.warning(
                 self,
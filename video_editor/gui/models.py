@@ -1,16 +1,57 @@
 """Data models for GUI state management."""
 
 import json
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from ..transcriber import Segment, Token
 from ..analyzer import AnalyzedSegment, TimeRange, SegmentAction
-from ..project_io import infer_recording_crop_config
+from ..project_io import infer_recording_crop_config, tokens_per_segment
 
+# orjson writes the same indented JSON several times faster; it is optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def _crop_rect(
+    width: float, height: float, pan_x: float, pan_y: float, video_width: int, video_height: int
+) -> tuple[int, int, int, int]:
+    """Pixel crop rectangle (x, y, width, height) for normalized crop values."""
+    crop_w = int(width * video_width)
+    crop_h = int(height * video_height)
+
+    # Available space for panning
+    max_pan_x = video_width - crop_w
+    max_pan_y = video_height - crop_h
+
+    # Calculate position based on pan offset (-1 to 1 maps to full range)
+    # pan_x=0 means centered, pan_x=-1 means left edge, pan_x=1 means right edge
+    crop_x = int((max_pan_x / 2) * (1 + pan_x)) if max_pan_x > 0 else 0
+    crop_y = int((max_pan_y / 2) * (1 + pan_y)) if max_pan_y > 0 else 0
+
+    # Clamp to valid range
+    crop_x = max(0, min(crop_x, video_width - crop_w))
+    crop_y = max(0, min(crop_y, video_height - crop_h))
+
+    return crop_x, crop_y, crop_w, crop_h
+
+
+@lru_cache(maxsize=128)
+def _crop_filter_for(
+    width: float, height: float, pan_x: float, pan_y: float, video_width: int, video_height: int
+) -> str:
+    """FFmpeg crop filter for normalized crop values (segments often share one preset)."""
+    x, y, w, h = _crop_rect(width, height, pan_x, pan_y, video_width, video_height)
+    return f"crop={w}:{h}:{x}:{y}"
+
+
+@dataclass(slots=True)
 class CropConfig:
     """Configuration for video cropping and panning.
 
@@ -39,23 +80,7 @@ class CropConfig:
         Returns:
             (x, y, width, height) in pixels for FFmpeg crop filter
         """
-        crop_w = int(self.width * video_width)
-        crop_h = int(self.height * video_height)
-
-        # Available space for panning
-        max_pan_x = video_width - crop_w
-        max_pan_y = video_height - crop_h
-
-        # Calculate position based on pan offset (-1 to 1 maps to full range)
-        # pan_x=0 means centered, pan_x=-1 means left edge, pan_x=1 means right edge
-        crop_x = int((max_pan_x / 2) * (1 + self.pan_x)) if max_pan_x > 0 else 0
-        crop_y = int((max_pan_y / 2) * (1 + self.pan_y)) if max_pan_y > 0 else 0
-
-        # Clamp to valid range
-        crop_x = max(0, min(crop_x, video_width - crop_w))
-        crop_y = max(0, min(crop_y, video_height - crop_h))
-
-        return crop_x, crop_y, crop_w, crop_h
+        return _crop_rect(self.width, self.height, self.pan_x, self.pan_y, video_width, video_height)
 
     def to_ffmpeg_filter(self, video_width: int, video_height: int) -> str:
         """Generate FFmpeg crop filter string.
@@ -67,8 +92,9 @@ class CropConfig:
         Returns:
             FFmpeg crop filter string, e.g., "crop=1280:720:320:180"
         """
-        x, y, w, h = self.get_crop_rect(video_width, video_height)
-        return f"crop={w}:{h}:{x}:{y}"
+        return _crop_filter_for(
+            self.width, self.height, self.pan_x, self.pan_y, video_width, video_height
+        )
 
     def to_dict(self) -> dict:
         """Serialize for JSON storage."""
@@ -99,7 +125,7 @@ class CropConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptionSettings:
     """Configuration for caption display and styling.
 
@@ -437,7 +463,7 @@ class HighlightRegion:
         return self.end - self.start
 
 
-@dataclass
+@dataclass(slots=True)
 class EditSession:
     """
     Stores the editable state for a video editing session.
@@ -467,6 +493,43 @@ class EditSession:
     # Caption settings
     caption_settings: CaptionSettings = field(default_factory=CaptionSettings)
 
+    # Segment start times for segment_at_time(), rebuilt when original_segments changes
+    _segment_starts: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _segment_starts_source: list[Segment] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def apply_analysis(
+        self,
+        video_duration: float,
+        segments: list[Segment],
+        analyzed_segments: list[AnalyzedSegment],
+        tokens: list[Token],
+        keep_ranges: list[TimeRange],
+    ) -> None:
+        """Replace the transcription and analysis results in place.
+
+        Crop, caption and highlight settings are kept; edits keyed by segment
+        index are dropped because they refer to the previous segments.
+        """
+        self.video_duration = video_duration
+        self.original_segments = segments
+        self.analyzed_segments = analyzed_segments
+        self.tokens = tokens
+        self.original_keep_ranges = keep_ranges
+        self.text_edits.clear()
+        self.keep_overrides.clear()
+        self.segment_crop_overrides.clear()
+
+    def segment_at_time(self, time_seconds: float) -> int:
+        """Return the index of the segment playing at time_seconds, or -1 if none."""
+        segments = self.original_segments
+        if self._segment_starts_source is not segments or len(self._segment_starts) != len(segments):
+            self._segment_starts = [seg.start for seg in segments]
+            self._segment_starts_source = segments
+        index = bisect_right(self._segment_starts, time_seconds) - 1
+        if index >= 0 and time_seconds < segments[index].end:
+            return index
+        return -1
+
     def get_segment_text(self, index: int) -> str:
         """Get the current text for a segment (edited or original)."""
         if index in self.text_edits:
@@ -511,6 +574,17 @@ class EditSession:
             else:
                 self.keep_overrides[index] = keep
 
+    def set_all_segments_kept(self, keep: bool) -> None:
+        """Override the keep/cut decision of every segment at once."""
+        self.keep_overrides.clear()
+        for index in range(len(self.original_segments)):
+            original_kept = True
+            if index < len(self.analyzed_segments):
+                original_kept = self.analyzed_segments[index].action == SegmentAction.KEEP
+            # Only segments whose analysis decision differs need an override
+            if keep != original_kept:
+                self.keep_overrides[index] = keep
+
     def get_segment_reason(self, index: int) -> str:
         """Get the reason why a segment was marked for removal."""
         if 0 <= index < len(self.analyzed_segments):
@@ -598,13 +672,14 @@ class EditSession:
         if not self.tokens:
             return []
 
+        tokens_by_segment = tokens_per_segment(self.tokens, self.original_segments)
         result = []
-        for i, seg in enumerate(self.original_segments):
+        for i in range(len(self.original_segments)):
             if not self.is_segment_kept(i):
                 continue
 
-            # Find tokens that belong to this segment
-            seg_tokens = [t for t in self.tokens if seg.start <= t.start < seg.end]
+            # Tokens that belong to this segment
+            seg_tokens = tokens_by_segment[i]
 
             if i in self.text_edits and seg_tokens:
                 # Text was edited - create new tokens from edited text
@@ -734,14 +809,21 @@ class EditSession:
             "caption_settings": self.caption_settings.to_dict()
         }
 
+        if ORJSON_AVAILABLE:
+            Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
     @classmethod
     def load(cls, path: Path) -> "EditSession":
         """Load an editing session from a JSON file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
         segments = [
             Segment(
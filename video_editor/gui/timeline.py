@@ -119,6 +119,8 @@ class TimelineView(QGraphicsView):
         self._highlight_items: list[HighlightItem] = []
         self._playhead = PlayheadItem(self.segment_height + 10)
         self._scene.addItem(self._playhead)
+        # Scene x of the last drawn playhead position (None forces the next update)
+        self._playhead_x: float | None = None
 
         # Shared signals for all segments
         self._segment_signals = SegmentSignals()
@@ -150,6 +152,8 @@ class TimelineView(QGraphicsView):
         self.clear_segments()
         self.clear_highlights()
         self.duration_seconds = session.video_duration
+        # The previous session's playhead position says nothing about this one
+        self._playhead_x = None
 
         # Update scene rect
         width = self.duration_seconds * self.pixels_per_second
@@ -238,12 +242,28 @@ class TimelineView(QGraphicsView):
         if 0 <= index < len(self._segment_items):
             self._segment_items[index].set_kept(is_kept)
 
+    def update_all_segments(self, is_kept: bool):
+        """Update every segment's appearance with a single viewport repaint."""
+        viewport = self.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            for item in self._segment_items:
+                if item.is_kept != is_kept:
+                    item.set_kept(is_kept)
+        finally:
+            viewport.setUpdatesEnabled(True)
+        viewport.update()
+
     def set_playhead_position(self, time_seconds: float):
         """Update the playhead position."""
+        playhead_x = time_seconds * self.pixels_per_second
+        # Sub-pixel moves would repaint without any visible change
+        if self._playhead_x is not None and abs(playhead_x - self._playhead_x) < 0.5:
+            return
+        self._playhead_x = playhead_x
         self._playhead.set_position(time_seconds, self.pixels_per_second)
 
         # Auto-scroll to keep playhead visible
-        playhead_x = time_seconds * self.pixels_per_second
         visible_rect = self.mapToScene(self.viewport().rect()).boundingRect()
 
         if playhead_x < visible_rect.left() + 50 or playhead_x > visible_rect.right() - 50:
@@ -257,6 +277,7 @@ class TimelineView(QGraphicsView):
             center_time = visible_rect.center().x() / self.pixels_per_second
 
         self.pixels_per_second = pixels_per_second
+        self._playhead_x = None
 
         # Update scene size
         width = self.duration_seconds * self.pixels_per_second
@@ -555,6 +576,10 @@ class Timeline(QWidget):
         """Update a segment's appearance."""
         self._view.update_segment(index, is_kept)
 
+    def update_all_segments(self, is_kept: bool):
+        """Update every segment's appearance."""
+        self._view.update_all_segments(is_kept)
+
     def set_playhead_position(self, time_seconds: float):
         """Update playhead position."""
         self._view.set_playhead_position(time_seconds)
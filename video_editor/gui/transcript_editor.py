@@ -120,10 +120,14 @@ class SegmentWidget(QFrame):
             }}
         """)
 
+    def is_kept(self) -> bool:
+        """Whether the segment is currently shown as kept."""
+        return self._keep_checkbox.isChecked()
+
     def set_selected(self, selected: bool):
         """Set the selection state."""
         self.is_selected = selected
-        self._update_background(self._keep_checkbox.isChecked())
+        self._update_background(self.is_kept())
 
     def mousePressEvent(self, event):
         """Handle click to select."""
@@ -249,6 +253,23 @@ class TranscriptEditor(QWidget):
             widget.set_data(seg.start, seg.end, text, is_kept, reason)
             self._update_stats()
 
+    def update_all_segments(self, is_kept: bool):
+        """Update every segment's keep state, repainting and recounting once."""
+        if not self._session:
+            return
+        self._container.setUpdatesEnabled(False)
+        try:
+            for index, widget in enumerate(self._segment_widgets):
+                if widget.is_kept() == is_kept:
+                    continue
+                seg = self._session.original_segments[index]
+                text = self._session.get_segment_text(index)
+                reason = self._session.get_segment_reason(index)
+                widget.set_data(seg.start, seg.end, text, is_kept, reason)
+        finally:
+            self._container.setUpdatesEnabled(True)
+        self._update_stats()
+
     def select_segment(self, index: int):
         """Select a segment and scroll to it."""
         if self._selected_index >= 0 and self._selected_index < len(self._segment_widgets):
@@ -268,11 +289,9 @@ class TranscriptEditor(QWidget):
             return
 
         # Find the segment containing this time
-        for i, seg in enumerate(self._session.original_segments):
-            if seg.start <= time_seconds < seg.end:
-                if i != self._selected_index:
-                    self.select_segment(i)
-                break
+        index = self._session.segment_at_time(time_seconds)
+        if index >= 0 and index != self._selected_index:
+            self.select_segment(index)
 
     def _update_stats(self):
         """Update the statistics label."""
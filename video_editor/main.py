@@ -16,7 +16,7 @@ from rich.table import Table
 from .config import Config, CaptionStyle
 from .transcriber import Transcriber, Token
 from .analyzer import Analyzer, TimeRange
-from .cutter import Cutter
+from .cutter import Cutter, adjust_tokens_for_cuts
 from .captioner import Captioner
 from .qc import QualityController
 
@@ -27,10 +27,6 @@ def _adjust_tokens_for_cuts(tokens: list[Token], keep_ranges: list[TimeRange], s
     """
     Adjust token timestamps for the cut video timeline.
 
-    Uses a single-pass algorithm where each token is processed exactly once.
-    This prevents the duplication bug where nested loops would add the same
-    token multiple times with different offsets.
-
     Args:
         tokens: Original tokens with timestamps from the full video
         keep_ranges: List of time ranges that are being kept
@@ -39,50 +35,9 @@ def _adjust_tokens_for_cuts(tokens: list[Token], keep_ranges: list[TimeRange], s
     Returns:
         List of tokens with adjusted timestamps for the cut video
     """
-    if not tokens or not keep_ranges:
-        return []
-
-    # Sort tokens and ranges by start time
-    sorted_tokens = sorted(tokens, key=lambda t: t.start)
-    sorted_ranges = sorted(keep_ranges, key=lambda r: r.start)
-
-    # Precompute cumulative offsets for each range
-    # offsets[i] = total duration of all ranges before range i + gaps between them
-    offsets = []
-    cumulative = 0.0
-    for i, range_ in enumerate(sorted_ranges):
-        offsets.append(cumulative)
-        cumulative += range_.duration
-        # Add gap after each segment except the last
-        if i < len(sorted_ranges) - 1:
-            cumulative += segment_gap
-
-    adjusted_tokens = []
-    range_idx = 0
-
-    for token in sorted_tokens:
-        # Skip ranges that end before this token starts
-        while range_idx < len(sorted_ranges) and sorted_ranges[range_idx].end <= token.start:
-            range_idx += 1
-
-        # Check if token falls within current range
-        if range_idx < len(sorted_ranges):
-            range_ = sorted_ranges[range_idx]
-            if range_.start <= token.start < range_.end:
-                # Token is within this range - adjust timestamp
-                new_start = offsets[range_idx] + (token.start - range_.start)
-                new_end = offsets[range_idx] + (token.end - range_.start)
-
-                # Clamp end time to not exceed the range's contribution
-                new_end = min(new_end, offsets[range_idx] + range_.duration)
-
-                adjusted_tokens.append(Token(
-                    text=token.text,
-                    start=new_start,
-                    end=new_end
-                ))
-
-    console.print(f"[dim]Token adjustment: {len(tokens)} → {len(adjusted_tokens)} tokens[/dim]")
+    adjusted_tokens = adjust_tokens_for_cuts(tokens, keep_ranges, segment_gap)
+    if tokens and keep_ranges:
+        console.print(f"[dim]Token adjustment: {len(tokens)} → {len(adjusted_tokens)} tokens[/dim]")
     return adjusted_tokens
 
 
@@ -269,53 +224,54 @@ def main(
             cutter.cut_video(input_path, keep_ranges, output_path)
         else:
             # Cut to temp, then add captions
-            cutter.cut_video(input_path, keep_ranges, temp_cut)
-
-            if streaming_captions:
-                # Use word-by-word streaming captions
-                # Adjust token times for the cut video (accounting for gaps between segments)
-                adjusted_tokens = _adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP)
-
-                captioner.burn_streaming_captions(
-                    temp_cut,
-                    adjusted_tokens,
-                    output_path,
-                    max_words=config.max_caption_words
-                )
-            else:
-                # Use traditional segment-based captions
-                # Adjust segment times for the cut video
-                adjusted_segments = []
-                current_time = 0.0
-                for seg in kept_segments:
-                    duration = seg.duration
-                    from .transcriber import Segment
-                    adjusted_seg = Segment(
-                        start=current_time,
-                        end=current_time + duration,
-                        text=seg.text,
-                        confidence=seg.confidence
+            try:
+                cutter.cut_video(input_path, keep_ranges, temp_cut)
+
+                if streaming_captions:
+                    # Use word-by-word streaming captions
+                    # Adjust token times for the cut video (accounting for gaps between segments)
+                    adjusted_tokens = _adjust_tokens_for_cuts(tokens, keep_ranges, Cutter.SEGMENT_GAP)
+
+                    captioner.burn_streaming_captions(
+                        temp_cut,
+                        adjusted_tokens,
+                        output_path,
+                        max_words=config.max_caption_words
                     )
-                    adjusted_segments.append(adjusted_seg)
-                    current_time += duration
-
-                # Generate SRT
-                srt_path = config.temp_dir / f"{input_path.stem}.srt" if config.temp_dir else Path(tempfile.gettempdir()) / f"{input_path.stem}.srt"
-                captioner.generate_srt(adjusted_segments, srt_path)
-
-                # Add captions
-                if soft_captions:
-                    captioner.add_soft_captions(temp_cut, srt_path, output_path)
                 else:
-                    captioner.burn_captions(temp_cut, srt_path, output_path)
-
-                # Clean up SRT
-                if not keep_temp and srt_path.exists():
-                    srt_path.unlink()
-
-            # Clean up temp cut file
-            if not keep_temp and temp_cut.exists():
-                temp_cut.unlink()
+                    # Use traditional segment-based captions
+                    # Adjust segment times for the cut video
+                    adjusted_segments = []
+                    current_time = 0.0
+                    for seg in kept_segments:
+                        duration = seg.duration
+                        from .transcriber import Segment
+                        adjusted_seg = Segment(
+                            start=current_time,
+                            end=current_time + duration,
+                            text=seg.text,
+                            confidence=seg.confidence
+                        )
+                        adjusted_segments.append(adjusted_seg)
+                        current_time += duration
+
+                    # Generate SRT
+                    srt_path = config.temp_dir / f"{input_path.stem}.srt" if config.temp_dir else Path(tempfile.gettempdir()) / f"{input_path.stem}.srt"
+                    captioner.generate_srt(adjusted_segments, srt_path)
+
+                    # Add captions
+                    if soft_captions:
+                        captioner.add_soft_captions(temp_cut, srt_path, output_path)
+                    else:
+                        captioner.burn_captions(temp_cut, srt_path, output_path)
+
+                    # Clean up SRT
+                    if not keep_temp:
+                        srt_path.unlink(missing_ok=True)
+            finally:
+                # Clean up temp cut file, even when cutting or captioning failed
+                if not keep_temp:
+                    temp_cut.unlink(missing_ok=True)
 
         # Final summary
         new_duration = cutter.get_video_duration(output_path)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 import shutil
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -267,20 +268,33 @@ def get_final_keep_ranges(
     return merge_ranges(ranges)
 
 
+def tokens_per_segment(tokens: list[Token], segments: list[Segment]) -> list[list[Token]]:
+    """
+    Return, for each segment, the tokens that start inside it (start <= t < end).
+
+    Same result as filtering every token per segment, but the tokens are
+    sorted by start once and each segment takes a binary-searched slice.
+    """
+    ordered = sorted(tokens, key=lambda token: token.start)
+    starts = [token.start for token in ordered]
+    return [
+        ordered[bisect_left(starts, segment.start):bisect_left(starts, segment.end)]
+        for segment in segments
+    ]
+
+
 def get_final_tokens(project: ProjectData) -> list[Token]:
     """Compute caption tokens for kept transcript segments."""
     if not project.tokens:
         return []
 
+    tokens_by_segment = tokens_per_segment(project.tokens, project.segments)
     result: list[Token] = []
-    for index, segment in enumerate(project.segments):
+    for index in range(len(project.segments)):
         if not is_segment_kept(project, index):
             continue
 
-        segment_tokens = [
-            token for token in project.tokens
-            if segment.start <= token.start < segment.end
-        ]
+        segment_tokens = tokens_by_segment[index]
 
         if index in project.text_edits and segment_tokens:
             words = project.text_edits[index].split()